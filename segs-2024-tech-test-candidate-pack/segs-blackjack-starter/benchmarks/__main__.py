@@ -0,0 +1,45 @@
+import argparse
+import json
+import os
+
+# Benchmarks draw offscreen and the game runs without a window
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from . import harness, micro, macro  # noqa: F401, importing registers the benchmarks
+
+# Results are written here by default, named by the commit they were taken at
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), 'results')
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the engine, rendering and asset paths and save the results as JSON.")
+    parser.add_argument('--filter', default=None, help="only run benchmarks whose name contains this")
+    parser.add_argument('--group', choices=['micro', 'macro'], default=None, help="only run micro or macro benchmarks")
+    parser.add_argument('--repeat', type=int, default=5, help="timed repeats per benchmark, the best is reported")
+    parser.add_argument('--min-time', type=float, default=0.2, help="seconds each repeat runs for at least")
+    parser.add_argument('--output', default=None, help="JSON file to save the results to")
+    parser.add_argument('--compare', default=None, metavar='BASELINE', help="JSON results to compare against")
+    parser.add_argument('--threshold', type=float, default=0.1, help="slowdown over the baseline reported as a regression")
+    args = parser.parse_args()
+
+    # Asset paths are relative to the project folder
+    os.chdir(os.path.join(os.path.dirname(__file__), '..'))
+    results = harness.run(args.filter, args.group, args.repeat, args.min_time)
+
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"{harness.environment()['commit'] or 'results'}.json")
+    harness.save(results, output)
+    print(f"Saved results to {output}")
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)['results']
+        comparison = harness.compare(results, baseline, args.threshold)
+        for name, ratio, regressed in comparison:
+            print(f"{name:<36}{ratio:8.2f}x {'REGRESSED' if regressed else ''}")
+        if any(regressed for _, _, regressed in comparison):
+            raise SystemExit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+# Registered benchmarks in the order they were defined
+BENCHMARKS = []
+
+class Benchmark:
+    def __init__(self, name, group, setup, per=1, unit='op'):
+        """Initialise a benchmark whose setup returns the callable to time.
+
+        per is how many units of work one call does, e.g. 52 draws or 100
+        rounds, so results are reported per unit.
+        """
+
+        self.name = name
+        self.group = group
+        self.setup = setup
+        self.per = per
+        self.unit = unit
+
+def benchmark(name, group='micro', per=1, unit='op'):
+    """Registers a function returning the callable to time as a benchmark."""
+
+    def register(setup):
+        BENCHMARKS.append(Benchmark(name, group, setup, per, unit))
+        return setup
+    return register
+
+def calibrate(func, min_time):
+    """Returns how many calls take at least min_time, doubling from one like timeit's autorange."""
+
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        if time.perf_counter() - start >= min_time:
+            return number
+        number *= 2
+
+def measure(bench, repeat=5, min_time=0.2):
+    """Times a benchmark and returns the seconds per unit of work over each repeat."""
+
+    func = bench.setup()
+    number = calibrate(func, min_time)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / (number * bench.per))
+
+    best = min(samples)
+    return {
+        'group': bench.group,
+        'unit': bench.unit,
+        'min': best,
+        'mean': statistics.mean(samples),
+        'stdev': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        'per_second': 1 / best if best else float('inf'),
+        'calls': number,
+        'repeat': repeat,
+    }
+
+def environment():
+    """Returns the interpreter, platform, library versions and git commit the results were taken with."""
+
+    info = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+    }
+    for module in ('pygame', 'numpy'):
+        if module in sys.modules:
+            info[module] = getattr(sys.modules[module], '__version__', None)
+    try:
+        info['commit'] = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                        check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        info['commit'] = None
+    return info
+
+def run(pattern=None, group=None, repeat=5, min_time=0.2, report=print):
+    """Runs every registered benchmark matching the name pattern and group, returning the results by name."""
+
+    results = {}
+    for bench in BENCHMARKS:
+        if pattern and pattern not in bench.name:
+            continue
+        if group and bench.group != group:
+            continue
+        results[bench.name] = result = measure(bench, repeat, min_time)
+        report(format_result(bench.name, result))
+    return results
+
+def format_result(name, result):
+    """Formats one result as a line of the report."""
+
+    best = result['min']
+    if best >= 1e-3:
+        time_text = f"{best * 1e3:10.3f} ms"
+    else:
+        time_text = f"{best * 1e6:10.3f} us"
+    return f"{name:<36}{time_text}/{result['unit']:<6} {result['per_second']:>14,.0f} {result['unit']}/s  ±{result['stdev'] / result['mean']:.1%}"
+
+def save(results, path):
+    """Writes the results with their environment to a JSON file."""
+
+    with open(path, 'w') as file:
+        json.dump({'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'), 'environment': environment(), 'results': results},
+                  file, indent=2)
+
+def compare(results, baseline, threshold=0.1):
+    """Returns (name, ratio, regressed) for every benchmark also in the baseline results.
+
+    ratio is the new best time over the old one, so above 1 is slower, and a
+    benchmark has regressed when it is slower by more than threshold.
+    """
+
+    comparison = []
+    for name, result in results.items():
+        old = baseline.get(name)
+        if old is None or not old['min']:
+            continue
+        ratio = result['min'] / old['min']
+        comparison.append((name, ratio, ratio > 1 + threshold))
+    return comparison
@@ -0,0 +1,71 @@
+import os
+
+from src.display import OffscreenTarget
+from src.engine import GameEngine
+from src.rng import RandomStream
+from src.roundlog import RoundLogWriter
+from src.shoe import Shoe
+
+from .harness import benchmark
+
+# Rounds played per timed call, enough that setup per call does not show
+ENGINE_ROUNDS = 100
+UI_ROUNDS = 10
+
+def engine_rounds(num_players, shoe=None, log=None):
+    """Returns a callable playing ENGINE_ROUNDS headless rounds at a seeded table."""
+
+    engine = GameEngine(num_players, shoe=shoe, rng=RandomStream(1), log=log)
+
+    def play():
+        for _ in range(ENGINE_ROUNDS):
+            engine.reset_round()
+            engine.play_round()
+    return play
+
+@benchmark('engine.rounds.single', group='macro', per=ENGINE_ROUNDS, unit='round')
+def single_player_rounds():
+    return engine_rounds(1)
+
+@benchmark('engine.rounds.multi', group='macro', per=ENGINE_ROUNDS, unit='round')
+def multi_player_rounds():
+    return engine_rounds(3)
+
+@benchmark('engine.rounds.shoe', group='macro', per=ENGINE_ROUNDS, unit='round')
+def shoe_rounds():
+    return engine_rounds(3, Shoe(6))
+
+@benchmark('engine.rounds.logged', group='macro', per=ENGINE_ROUNDS, unit='round')
+def logged_rounds():
+    # The same rounds as engine.rounds.multi, written to a round log that is never read back
+    return engine_rounds(3, log=RoundLogWriter(os.devnull))
+
+@benchmark('engine.seats.3', group='macro', per=ENGINE_ROUNDS * 3, unit='seat')
+def three_seat_rounds():
+    return engine_rounds(3, Shoe(8))
+
+@benchmark('engine.seats.20', group='macro', per=ENGINE_ROUNDS * 20, unit='seat')
+def twenty_seat_rounds():
+    return engine_rounds(20, Shoe(8))
+
+@benchmark('game.autoplay', group='macro', per=UI_ROUNDS, unit='round')
+def autoplay_rounds():
+    # Imported here, so the engine benchmarks never load the game module
+    from blackjack import BlackjackGame
+
+    game = BlackjackGame(3, rng=RandomStream(1), target=OffscreenTarget())
+    return lambda: game.autoplay(UI_ROUNDS)
+
+@benchmark('game.draw_screen.full', group='macro', unit='frame')
+def full_frames():
+    from blackjack import BlackjackGame
+
+    game = BlackjackGame(3, rng=RandomStream(1), target=OffscreenTarget())
+    game.deal_initial_cards()
+    game.timeline.finish()
+
+    # Invalidating first redraws the whole table every frame
+    def draw():
+        game.renderer.invalidate()
+        game.draw_screen()
+    return draw
@@ -0,0 +1,118 @@
+import pygame
+
+from src.atlas import card_atlas
+from src.card import Card
+from src.deck import Deck
+from src.engine import GameEngine
+from src.hand import Hand
+from src.rng import RandomStream
+from src.sprites import sprite_cache
+
+from .harness import benchmark
+
+# Offscreen target the size of the game window, drawing to it needs no display
+SCREEN_SIZE = (1200, 700)
+
+def sample_hand(ranks=('Ace', '7', '3', 'King', '2')):
+    """Returns a hand of face up cards with the given ranks."""
+
+    hand = Hand()
+    for rank in ranks:
+        hand.add_card(Card('Spades', rank, face_up=True))
+    return hand
+
+@benchmark('deck.create_deck')
+def create_deck():
+    deck = Deck()
+    return deck.create_deck
+
+@benchmark('deck.shuffle')
+def shuffle():
+    deck = Deck(RandomStream(1))
+    return deck.shuffle
+
+@benchmark('deck.draw_card', per=52, unit='card')
+def draw_card():
+    deck = Deck()
+    cards = deck.cards[:]
+
+    # Refills the deck from a copy and draws it out, so each call draws 52 cards
+    def draw_all():
+        deck.cards = cards[:]
+        for _ in range(52):
+            deck.draw_card()
+    return draw_all
+
+@benchmark('hand.calculate_value')
+def calculate_value():
+    return sample_hand().calculate_value
+
+@benchmark('hand.add_card', per=5, unit='card')
+def add_card():
+    cards = sample_hand().cards[:]
+    hand = Hand()
+
+    def deal():
+        hand.clear()
+        for card in cards:
+            hand.add_card(card)
+    return deal
+
+def mid_round_engine():
+    """Returns a seeded three seat table with the opening cards dealt."""
+
+    engine = GameEngine(3, rng=RandomStream(1))
+    engine.deal_initial_cards()
+    return engine
+
+@benchmark('engine.snapshot')
+def snapshot():
+    return mid_round_engine().snapshot
+
+@benchmark('engine.restore')
+def restore():
+    engine = mid_round_engine()
+    data = engine.snapshot()
+    return lambda: engine.restore(data)
+
+@benchmark('card.get_image.cached')
+def get_image_cached():
+    card = Card('Hearts', 'Queen', face_up=True)
+    card.get_image()
+    return card.get_image
+
+@benchmark('card.get_image.decode')
+def get_image_decode():
+    card = Card('Hearts', 'Queen', face_up=True)
+
+    # Clearing the atlas first makes every call decode the PNG from disk
+    def decode():
+        card_atlas.clear()
+        card.get_image()
+    return decode
+
+@benchmark('hand.draw_hand.horizontal', per=5, unit='card')
+def draw_hand_horizontal():
+    screen = pygame.Surface(SCREEN_SIZE)
+    hand = sample_hand()
+    hand.draw_hand(screen, 450, 500, 'horizontal')
+    return lambda: hand.draw_hand(screen, 450, 500, 'horizontal')
+
+@benchmark('hand.draw_hand.vertical', per=5, unit='card')
+def draw_hand_vertical():
+    screen = pygame.Surface(SCREEN_SIZE)
+    hand = sample_hand()
+    hand.draw_hand(screen, 50, 150, 'vertical', 'left')
+    return lambda: hand.draw_hand(screen, 50, 150, 'vertical', 'left')
+
+@benchmark('hand.draw_hand.cold', per=5, unit='card')
+def draw_hand_cold():
+    screen = pygame.Surface(SCREEN_SIZE)
+    hand = sample_hand()
+
+    # Empty caches, so every card is decoded, rotated and scaled again
+    def draw():
+        card_atlas.clear()
+        sprite_cache.clear()
+        hand.draw_hand(screen, 50, 150, 'vertical', 'left')
+    return draw
@@ -1,28 +1,96 @@
-import random
 from src.deck import Deck
-from src.player import Player
-
+from src.engine import GameEngine, OUTCOMES
+from src.atlas import card_atlas
+from src.sprites import sprite_cache
+from src.hand import Hand, CARD_SIZE, SIDE_CARD_SIZE, HAND_LAYOUTS
+from src.renderer import DirtyRenderer
+from src.text import TextRenderer
+from src.scheduler import Scheduler
+from src.timeline import Timeline
+from src.rng import RandomStream
+from src.policy import Policy
+from src.odds import PerfectPolicy, advice
+from src.profiler import profiler
+from src.display import WindowTarget, OffscreenTarget, DEFAULT_RESOLUTION, parse_resolution
+from src.roundlog import RoundLogWriter
+
+import argparse
 import pygame
-import os
 
-class BlackjackGame:
-    def __init__(self, num_players=1):
-        """Initialize the game with settings for one or more players."""
-        
-        # Pygame setup: initialize screen, clock, and window title
+# Animation durations in seconds at normal speed
+DEAL_DURATION = 1 / 3
+FLIP_DURATION = 1 / 3
+BANNER_DURATION = 2.5
+
+# Seconds between cards of the opening deal leaving the deck, so their animations overlap
+DEAL_STAGGER = 0.15
+
+# Seconds between actions of a replay at normal speed, after the last one has finished animating
+REPLAY_PAUSE = 0.75
+
+# Slowest sections listed on the performance overlay
+PROFILE_SECTIONS = 3
+
+class BlackjackGame(GameEngine):
+    def __init__(self, num_players=1, shoe=None, rng=None, speed=1.0, fast_forward=False, policy=None, hints=False, perfect_ai=False, profile=False,
+                 target=None, log=None):
+        """Initialize the game with settings for one or more players, optionally dealing from a multi-deck shoe with a seeded random stream.
+
+        speed scales how fast deals, flips and opponent actions play out, 2.0 is
+        twice as fast as normal. With fast_forward, opponent turns are played out
+        at once and only their result is drawn, it can also be toggled with F.
+        policy is the Policy the opponents play by. With hints, the better of hit
+        and stand is shown from the exact odds, it can also be toggled with H.
+        With perfect_ai, opponents play by those odds instead of the policy.
+        With profile, every frame is timed and P shows the performance overlay.
+        target is where frames are drawn and presented, a window by default or an
+        OffscreenTarget to render with no display. log is a RoundLogWriter every
+        round is recorded to.
+        """
+        
+        if speed <= 0:
+            raise ValueError("Speed must be positive")
+        if num_players not in (1, 3):
+            raise ValueError("The table is laid out for 1 or 3 players")
+
+        # Pygame setup: initialize the render target, its screen surface and timers
         pygame.init()
-        self.screen = pygame.display.set_mode((1200, 700), pygame.NOFRAME)
-        pygame.display.set_caption("Blackjack Game")
-        self.clock = pygame.time.Clock()
+        self.target = target if target is not None else WindowTarget()
+        self.screen = self.target.surface
+        self.scheduler = Scheduler()
         self.running = True
 
+        # Animations are queued on a timeline and played back by the main loop,
+        # cards still being dealt are hidden from their hand until they land
+        self.timeline = Timeline()
+        self.speed = speed
+        self.fast_forward = fast_forward
+        self.autoplaying = False
+        self.hints = hints
+        self.hint = None
+        self.replay_error = None
+        self.in_flight = {}
+        self.flying = []
+        self.banners = []
+        self.deal_stagger = None
+        self.last_deal = None
+
+        # Frame and section timings, off unless profiling
+        self.profiler = profiler
+        self.profiler.enabled = self.profiler.enabled or profile
+        self.show_profile = False
+
+        # Nothing reacts to mouse movement, so it should not wake the idle loop
+        pygame.event.set_blocked(pygame.MOUSEMOTION)
+
         # Load and scale card back image for use in game
-        self.card_back_image = pygame.image.load(os.path.join("assets", "card_back_red.png"))
-        self.card_back_image = pygame.transform.scale(self.card_back_image, (175, 210))
+        self.card_back_image = sprite_cache.get(card_atlas.get(None, None, False), CARD_SIZE)
         
         # Background color and initial action setup
         self.green_color = (34, 139, 34)
         self.action = None
+        self.renderer = DirtyRenderer(self.green_color)
+        self.text = TextRenderer()
         
         # Button setups for quit and player actions
         self.quit_button_color = (255, 0, 0)
@@ -31,58 +99,126 @@ class BlackjackGame:
         self.stand_button_rect = pygame.Rect(self.screen.get_width() - 250, self.screen.get_height() - 110, 150, 50)
         self.buttons_enabled = True
         
-        # Game object initializations: deck and player(s)
-        self.deck = Deck()
-        self.player = Player()
-        self.deck.shuffle()
-        self.game_over = False
-        self.turns_completed = 0
+        # Game rules, deck and player(s) live in the engine
+        super().__init__(num_players, shoe, rng, policy, log)
+
+        # Hints and the perfect AI assume the other seats play the policy from file
+        self.table_policy = self.policy
+        if perfect_ai:
+            self.policy = PerfectPolicy(self, self.table_policy)
         
         # Handle multi-player mode setup
         if num_players > 1:
-            self.num_players = num_players
-            self.opponent_one = Player()
-            self.opponent_two = Player()
-            self.turn = 'player'  
             self.player_status = 'playing'
             self.opponent_one_status = 'playing'
             self.opponent_two_status = 'playing'
             
         # Handle single player mode setup
         else:
-            self.num_players = num_players
             self.player_status = 'playing'
-            self.turn = 'player' 
+
+        # Build every card sprite for this layout up front so drawing is only blits
+        self.warm_sprites()
+
+    def warm_sprites(self):
+        """Pre-builds the scaled and rotated card sprites used by the current layout."""
+        
+        # Hand layouts in use for the number of players
+        layouts = [HAND_LAYOUTS[('horizontal', 'normal')]]
+        if self.num_players > 1:
+            layouts += [HAND_LAYOUTS[('vertical', 'left')], HAND_LAYOUTS[('vertical', 'right')]]
+
+        # Every face plus the card back
+        images = [card_atlas.get(card.rank, card.suit, True) for card in Deck().cards]
+        images.append(card_atlas.get(None, None, False))
+        sprite_cache.warm(images, layouts)
+
+        # Card back variants used when animating a deal to the opponents
+        if self.num_players > 1:
+            sprite_cache.warm([self.card_back_image], [
+                ((SIDE_CARD_SIZE, 0), ((int(175 * 0.75), int(210 * 0.6)), 90)),
+                ((SIDE_CARD_SIZE, 0), (SIDE_CARD_SIZE, -90)),
+            ])
+
+    def deal_card(self, player):
+        """Deals a card to a player with the deal animation, fast-forwarded opponent hits go straight into the hand."""
+        
+        if self.fast_forward and player is not self.player and self.deal_stagger is None:
+            self.draw_to(player).face_up = True
+            return
+        self.animate_card_to_player(player)
+
+    def announce_action(self, opponent, action):
+        """Shows the action an opponent has taken, unless opponent turns are being fast-forwarded."""
+        
+        if not self.fast_forward:
+            self.display_opponent_action(opponent, action)
+
+    def finish_round(self, outcome, winners=None):
+        """Ends the round and shows the end game screen once the round's animations have played."""
+        
+        super().finish_round(outcome, winners)
+        if not self.autoplaying:
+            self.timeline.add(0, on_finish=lambda: self.end_game_screen(outcome, self.winners))
+
+    def toggle_fast_forward(self):
+        """Switches fast-forwarding opponent turns on or off, skipping any animations still playing when turned on."""
+        
+        self.fast_forward = not self.fast_forward
+        if self.fast_forward:
+            self.timeline.finish()
+
+    def reset_round(self, seed=None):
+        """Resets the round and drops any animations still queued from the last one."""
+        
+        super().reset_round(seed)
+        self.timeline.clear()
+        self.in_flight.clear()
+        self.flying = []
+        self.banners = []
+        self.last_deal = None
+        self.hint = None
+
+    def restore(self, data):
+        """Restores a round with no animations left to play, every card in a hand shown face up."""
+        
+        super().restore(data)
+        self.timeline.clear()
+        self.in_flight.clear()
+        self.flying = []
+        self.banners = []
+        self.last_deal = None
+        for player in self.players():
+            for card in player.hand.cards:
+                card.face_up = True
+        if self.hints:
+            self.update_hint()
+        self.renderer.invalidate()
 
     def deal_initial_cards(self):
-        """Deal 2 cards to each player (player and opponents)."""
+        """Deals 2 cards to each player, with the deal animations overlapping."""
         
-        # Deal 2 cards to player initially
-        for _ in range(2):
-            self.animate_card_to_player(self.player)
-            
-            # Deal 2 cards to opponents for multi player
-            if self.num_players > 1:
-                self.animate_card_to_player(self.opponent_one)
-                self.animate_card_to_player(self.opponent_two)
-        self.initial_cards_dealt = True
+        self.deal_stagger = DEAL_STAGGER
+        self.last_deal = None
+        super().deal_initial_cards()
+        self.deal_stagger = None
 
     def animate_card_to_player(self, player):
-        """Animates a card moving from the deck to the player's hand."""
+        """Deals a card to the player and queues its animation from the deck to the player's hand."""
         
         card_image = self.card_back_image
         
         # Hand properties for player
         if player == self.player:
             start_x, start_y = (self.screen.get_width() - 175) // 2, (self.screen.get_height() - 400) // 2
-            end_x, end_y = (self.screen.get_width() - 350) // 2 + len(self.player.hand.cards) * 50, self.screen.get_height() - 250
+            end_x, end_y = (self.screen.get_width() - 350) // 2 + len(player.hand.cards) * 50, self.screen.get_height() - 250
         
         # Hand properties for opponent one
         elif player == self.opponent_one:
             start_x, start_y = (self.screen.get_width() - 175) // 2, (self.screen.get_height() - 400) // 2
             end_x = (self.screen.get_width() // 4) - 87
             end_y = 200 + len(self.opponent_one.hand.cards) * 40
-            card_image = pygame.transform.scale(card_image,  (int(175 * 0.9), int(210 * 0.75)))
+            card_image = sprite_cache.get(card_image, SIDE_CARD_SIZE)
             scaled_width = int(175 * 0.75)
             scaled_height = int(210 * 0.6)
         
@@ -91,174 +227,201 @@ class BlackjackGame:
             start_x, start_y = (self.screen.get_width() - 175) // 2, (self.screen.get_height() - 400) // 2
             end_x = (self.screen.get_width() * 3 // 4) - 47
             end_y = self.screen.get_height() - 400 - len(self.opponent_two.hand.cards) * 40
-            card_image = pygame.transform.scale(card_image,  (int(175 * 0.9), int(210 * 0.75)))
+            card_image = sprite_cache.get(card_image, SIDE_CARD_SIZE)
             scaled_width = int(175 * 0.9)
             scaled_height = int(210 * 0.75)
 
-        # Animation steps for drawing card
-        current_x, current_y = start_x, start_y
-        step_x = (end_x - start_x) / 20
-        step_y = (end_y - start_y) / 20
+        # Sets card image with rotation and scaling for opponent card, built once from the sprite cache
+        rotated_card = card_image
+        if self.num_players == 3:
+            if player == self.opponent_one:
+                rotated_card = sprite_cache.get(card_image, (scaled_width, scaled_height), 90)
+            elif player == self.opponent_two:
+                rotated_card = sprite_cache.get(card_image, (scaled_width, scaled_height), -90)
 
-        # Static background rendering to avoid re-drawing static objects repeatedly
-        background_surface = pygame.Surface(self.screen.get_size())
-        background_surface.fill(self.green_color)
-        self.deck.draw_visual_stack(background_surface, self.card_back_image, start_x, start_y)
+        # The card joins the hand straight away and stays hidden until its animation lands
+        new_card = self.draw_to(player)
+        self.in_flight[player] = self.in_flight.get(player, 0) + 1
 
-        # Draw the hand for player
-        self.player.hand.draw_hand(background_surface, (self.screen.get_width() - 350) // 2, self.screen.get_height() - 250, 'horizontal')
+        # Opening deals overlap, any other deal waits for what is already playing
+        at = None
+        if self.deal_stagger is not None and self.last_deal is not None:
+            at = self.last_deal.begin + self.deal_stagger / self.speed
+        deal = self.timeline.add(DEAL_DURATION / self.speed, (start_x, start_y), (end_x, end_y), at=at,
+                                 on_finish=lambda: self.land_card(player, deal))
+        self.flying.append((deal, rotated_card))
+        self.last_deal = deal
 
-        # Draw the hand for opponents
-        if self.num_players > 1:
-            self.opponent_one.hand.draw_hand(background_surface, (self.screen.get_width() // 4) - 87, 200, 'vertical', facing='left')
-            self.opponent_two.hand.draw_hand(background_surface, (self.screen.get_width() * 3 // 4) - 47, self.screen.get_height() - 400,'vertical', facing='right')
+        # Work out the player's best move again now the deck has changed
+        if self.hints:
+            self.update_hint()
 
-        # Animation for drawing the card
-        for _ in range(20):
-            self.screen.blit(background_surface, (0, 0)) 
-            self.screen.blit(card_image, (current_x, current_y)) 
+        # Now flip the card after it lands in the player's hand
+        self.flip_card_animation(new_card, deal.finish)
 
-            # Sets card image for player
-            if self.num_players == 1:
-                rotated_card = card_image
-                
-            # Sets card image and apply rotation and scaling for opponent card
-            elif self.num_players == 3:
-                if player == self.opponent_one:
-                    rotated_card = pygame.transform.rotate(card_image, 90)
-                    rotated_card = pygame.transform.scale(rotated_card, (scaled_width, scaled_height))
-                elif player == self.opponent_two:
-                    rotated_card = pygame.transform.rotate(card_image, -90)
-                    rotated_card = pygame.transform.scale(rotated_card, (scaled_width, scaled_height))
-                else:
-                    rotated_card = card_image
-
-            # Draw the rotated/scaled card in the hand
-            self.screen.blit(rotated_card, (current_x, current_y))
-            pygame.display.flip()
-
-            # Update card position
-            current_x += step_x
-            current_y += step_y
-            self.clock.tick(60)
-
-        # Add the card to the player's hand after the animation
-        new_card = self.deck.draw_card()
-        player.add_card_to_hand(new_card)
-
-        # Now flip the card after it's added to the player's hand
-        self.flip_card_animation(player)
-
-    def flip_card_animation(self, player):
-        """Animates the card flip after it's added to the player's hand."""
-        
-        # Flip the last card in the player's hand
-        player.hand.flip_last_card()
-
-        # Allow time for the flip animation to be visible
-        for i in range(20):
-            self.screen.fill(self.green_color)
-
-            # Draw the deck stack player's hand
-            self.deck.draw_visual_stack(self.screen, self.card_back_image, (self.screen.get_width() - 175) // 2, (self.screen.get_height() - 400) // 2)
-            self.player.hand.draw_hand(self.screen, (self.screen.get_width() - 350) // 2, self.screen.get_height() - 250, 'horizontal')
-
-            # Draw opponent's hands
-            if self.num_players > 1:
-                self.opponent_one.hand.draw_hand(self.screen, (self.screen.get_width() // 4) - 87, 200, 'vertical', facing='left')
-                self.opponent_two.hand.draw_hand(self.screen, (self.screen.get_width() * 3 // 4) - 47, self.screen.get_height() - 400, 'vertical', facing='right')
-
-            font = pygame.font.Font(None, 36)
-            y_offset = 50
-            
-            # Single Player hand value
-            if self.num_players == 1: 
-                player_text = font.render(f"Hand Value: {self.player.hand_value()}", True, (255, 255, 255))
-                self.screen.blit(player_text, (50, y_offset))
-
-            # Multi Player hand value
-            if self.num_players > 1:
-                # Player hand value
-                player_text = font.render(f"Player 1 Hand Value: {self.player.hand_value()}", True, (255, 255, 255))
-                self.screen.blit(player_text, (50, y_offset))
-                y_offset += 40 
-                
-                # Opponent one hand value
-                opponent_one_text = font.render(f"Player 2 Hand Value: {self.opponent_one.hand_value()}", True, (255, 255, 255))
-                self.screen.blit(opponent_one_text, (50, y_offset))
-
-                # Opponent two hand value
-                y_offset += 40 
-                opponent_two_text = font.render(f"Player 3 Hand Value: {self.opponent_two.hand_value()}", True, (255, 255, 255))
-                self.screen.blit(opponent_two_text, (50, y_offset))
+    def update_hint(self):
+        """Works out whether the player should hit or stand from the exact odds, while they are still playing."""
+        
+        self.hint = None
+        if self.player.status == 'playing' and self.player.hand.cards:
+            self.hint = advice(self, self.player, self.table_policy)
 
-            # Draw the quit button
-            self.draw_quit_button()
+    def toggle_profile(self):
+        """Shows or hides the performance overlay, timing frames from now on if profiling was off."""
 
-            # Update the screen
-            pygame.display.flip()
-            self.clock.tick(60)
+        self.show_profile = not self.show_profile
+        self.profiler.enabled = self.profiler.enabled or self.show_profile
 
+    def toggle_hints(self):
+        """Switches the hit or stand hint on or off."""
         
-    def draw_screen(self):
-        """Draws the game screen with the table, hands, deck and buttons drawn."""
+        self.hints = not self.hints
+        if self.hints:
+            self.update_hint()
+
+    def land_card(self, player, deal):
+        """Shows a dealt card in the player's hand once its deal animation finishes."""
         
-        # Draw the table and player hand
-        self.screen.fill(self.green_color)
-        self.player.hand.draw_hand(self.screen, (self.screen.get_width() - 350) // 2, self.screen.get_height() - 250, 'horizontal')
+        self.flying = [(tween, image) for tween, image in self.flying if tween is not deal]
+        self.in_flight[player] -= 1
 
-        # draw opponent's hands for multi player
-        if self.num_players > 1:
-            self.opponent_one.hand.draw_hand(self.screen, (self.screen.get_width() // 4) - 87, 200, 'vertical', facing='left')
-            self.opponent_two.hand.draw_hand(self.screen, (self.screen.get_width() * 3 // 4) - 47, self.screen.get_height() - 400, 'vertical', facing='right')
-        font = pygame.font.Font(None, 36)
+    def flip_card_animation(self, card, at):
+        """Queues the card to flip face up after it has sat face down in the hand for a moment."""
         
-        # Single Player Hand Value
-        if self.num_players == 1:
-            y_offset = 50 
-            player_text = font.render(f"Hand Value: {self.player.hand_value()}", True, (255, 255, 255))
-            self.screen.blit(player_text, (50, y_offset))
+        self.timeline.add(FLIP_DURATION / self.speed, at=at, on_finish=card.flip)
 
-        # Multi player Hand Value
-        if self.num_players > 1:
-            # Player hand value
-            y_offset = 50 
-            player_text = font.render(f"Player 1 Hand Value: {self.player.hand_value()}", True, (255, 255, 255))
-            self.screen.blit(player_text, (50, y_offset))
-            
-            # Opponent 1 hand Value
-            y_offset += 40  
-            opponent_one_text = font.render(f"Player 2 Hand Value: {self.opponent_one.hand_value()}", True, (255, 255, 255))
-            self.screen.blit(opponent_one_text, (50, y_offset))
+    def shown_cards(self, player):
+        """Returns how many of the player's cards have landed in their hand."""
+        
+        return len(player.hand.cards) - self.in_flight.get(player, 0)
 
-            # Opponent 2 Hand Value
-            y_offset += 40 
-            opponent_two_text = font.render(f"Player 3 Hand Value: {self.opponent_two.hand_value()}", True, (255, 255, 255))
-            self.screen.blit(opponent_two_text, (50, y_offset))
+    def shown_value(self, player):
+        """Returns the value of the player's cards that have landed, so labels do not give away cards still being dealt."""
+        
+        if not self.in_flight.get(player):
+            return player.hand_value()
+        shown = Hand()
+        shown.cards = player.hand.cards[:self.shown_cards(player)]
+        return shown.value
 
-        # Draw the deck stack
-        self.deck.draw_visual_stack(self.screen, self.card_back_image, (self.screen.get_width() - 175) // 2, (self.screen.get_height() - 400) // 2)
+    def hand_positions(self):
+        """Returns (player, x, y, orientation, facing) for every hand on the table."""
+        
+        width, height = self.screen.get_size()
+        positions = [(self.player, (width - 350) // 2, height - 250, 'horizontal', 'normal')]
+        if self.num_players > 1:
+            positions.append((self.opponent_one, (width // 4) - 87, 200, 'vertical', 'left'))
+            positions.append((self.opponent_two, (width * 3 // 4) - 47, height - 400, 'vertical', 'right'))
+        return positions
 
-        # Draw window buttons
-        self.draw_quit_button()
-        self.draw_buttons()
+    def hand_value_labels(self):
+        """Returns the hand value text shown for each player."""
+        
+        if self.num_players == 1:
+            return [f"Hand Value: {self.shown_value(self.player)}"]
+        return [f"{self.player_label(player)} Hand Value: {self.shown_value(player)}" for player in self.players()]
+
+    def draw_label(self, surface, text, position):
+        """Draws a line of white text."""
+        
+        surface.blit(self.text.render(text, 36, (255, 255, 255)), position)
+
+    def scene_layers(self):
+        """Describes the table as (name, rect, state, draw) layers for the dirty-rectangle renderer."""
+        
+        width, height = self.screen.get_size()
+        layers = []
+
+        # Deck stack
+        deck_position = ((width - 175) // 2, (height - 400) // 2)
+        layers.append(('deck', pygame.Rect(deck_position, CARD_SIZE), None,
+                       lambda surface: self.deck.draw_visual_stack(surface, self.card_back_image, *deck_position)))
+
+        # Hands, redrawn when a card is added or flipped
+        for index, (player, x, y, orientation, facing) in enumerate(self.hand_positions()):
+            count = self.shown_cards(player)
+            layers.append((f'hand {index}', pygame.Rect(player.hand.bounds(x, y, orientation, facing, count)), player.hand.draw_state(count),
+                           lambda surface, hand=player.hand, x=x, y=y, orientation=orientation, facing=facing, count=count:
+                               hand.draw_hand(surface, x, y, orientation, facing, count)))
+
+        # Hand value labels, redrawn when the text changes
+        for index, text in enumerate(self.hand_value_labels()):
+            position = (50, 50 + index * 40)
+            layers.append((f'label {index}', pygame.Rect(position, (450, 30)), text,
+                           lambda surface, text=text, position=position: self.draw_label(surface, text, position)))
+
+        # Cards being dealt and opponent actions, once their animations have begun
+        now = self.timeline.clock()
+        for tween, image in self.flying:
+            if tween.started(now):
+                position = tuple(int(value) for value in tween.value(now))
+                layers.append((f'deal {id(tween)}', pygame.Rect(position, image.get_size()), position,
+                               lambda surface, image=image, position=position: surface.blit(image, position)))
+        for tween, text_surface, text_rect in self.banners:
+            if tween.started(now):
+                layers.append((f'banner {id(tween)}', text_rect, None,
+                               lambda surface, text_surface=text_surface, text_rect=text_rect: surface.blit(text_surface, text_rect)))
+
+        # Hit or stand hint, once the player can act on it
+        if self.hints and self.hint is not None and self.actions_enabled():
+            hit, hit_ev, stand_ev = self.hint
+            text = f"Hint: {'Hit' if hit else 'Stand'} (hit {hit_ev:+.2f}, stand {stand_ev:+.2f})"
+            position = (width - 560, self.hit_button_rect.y - 50)
+            layers.append(('hint', pygame.Rect(position, (560, 30)), text,
+                           lambda surface, text=text, position=position: self.draw_label(surface, text, position)))
+
+        # Why a replay stopped, until it is jumped to another action
+        if self.replay_error is not None:
+            text_surface = self.text.render(self.replay_error, 24, (255, 80, 80), name='Arial', sysfont=True)
+            text_rect = text_surface.get_rect(center=(width // 2, 90))
+            layers.append(('replay error', text_rect, self.replay_error,
+                           lambda surface: surface.blit(text_surface, text_rect)))
+
+        # Fast-forward indicator
+        if self.fast_forward:
+            position = (50, height - 60)
+            layers.append(('fast forward', pygame.Rect(position, (450, 30)), None,
+                           lambda surface: self.draw_label(surface, "Fast Forward (F)", position)))
+
+        # Performance overlay, redrawn when the numbers change
+        if self.show_profile:
+            lines = self.profiler.summary(PROFILE_SECTIONS)
+            for index, text in enumerate(lines):
+                position = (width - 460, 70 + index * 26)
+                layers.append((f'profile {index}', pygame.Rect(position, (460, 26)), text,
+                               lambda surface, text=text, position=position:
+                                   surface.blit(self.text.render(text, 24, (255, 255, 0)), position)))
+
+        # Window buttons, redrawn when they are enabled or disabled
+        layers.append(('quit', self.quit_button_rect.inflate(8, 8), None, lambda surface: self.draw_quit_button()))
+        layers.append(('buttons', self.hit_button_rect.union(self.stand_button_rect), self.actions_enabled(),
+                       lambda surface: self.draw_buttons()))
+        return layers
 
-        # Update the display
-        pygame.display.flip()
+    def draw_screen(self):
+        """Draws the game screen with the table, hands, deck and buttons drawn, updating only the areas that changed."""
+        
+        dirty_rects = self.renderer.render(self.screen, self.scene_layers())
+        if dirty_rects:
+            self.target.present(dirty_rects)
         
+    def actions_enabled(self):
+        """True when the player can hit or stand, which waits for animations to finish."""
+        
+        return self.buttons_enabled and self.timeline.idle
+
     def draw_quit_button(self):
         """Draws quit button."""
         
         # Draw the red 'X' button at the top-right corner
-        font = pygame.font.SysFont(None, 60)
-        quit_text = font.render('X', True, (255, 0, 0))
+        quit_text = self.text.render('X', 60, (255, 0, 0), sysfont=True)
         self.screen.blit(quit_text, (self.quit_button_rect.x + 2, self.quit_button_rect.y - 2)) 
     
     def draw_buttons(self):
         """Draws the Hit and Stand buttons."""
     
         # Check if buttons are enabled and set button colors
-        if self.buttons_enabled:
+        if self.actions_enabled():
             hit_color = (0, 123, 255) 
             stand_color = (255, 0, 0) 
         else:
@@ -269,9 +432,8 @@ class BlackjackGame:
         pygame.draw.rect(self.screen, stand_color, self.stand_button_rect)
 
         # Render 'Hit' and 'Stand' text
-        font = pygame.font.Font(None, 36)
-        hit_text = font.render("Hit", True, (255, 255, 255))
-        stand_text = font.render("Stand", True, (255, 255, 255))
+        hit_text = self.text.render("Hit", 36, (255, 255, 255))
+        stand_text = self.text.render("Stand", 36, (255, 255, 255))
         
         # Display the 'Hit' and 'Stand' text on the buttons
         self.screen.blit(hit_text, (self.hit_button_rect.x + 50, self.hit_button_rect.y + 10))
@@ -280,29 +442,11 @@ class BlackjackGame:
     def reset_game(self):
         """Resets the game state for a new round."""
         
-        # Resets for all modes
-        self.deck = Deck()
-        self.player = Player()
-        self.deck.shuffle()
+        # Resets the deck, hands and turns for all modes
+        self.reset_round()
         self.buttons_enabled = True
         self.initial_cards_dealt = False
-        self.game_over = False
-
-        # Resets for specifically multi player
-        if self.num_players > 1:
-            self.opponent_one = Player() 
-            self.opponent_two = Player()
-             
-            self.player.hand.cards = []  
-            self.opponent_one.hand.cards = [] 
-            self.opponent_two.hand.cards = [] 
-
-            self.opponent_one.status = 'playing'
-            self.opponent_two.status = 'playing'
-            self.player.status = 'playing'
-            
-            self.turn = "player"
-            self.turns_completed = 0
+        self.renderer.invalidate()
 
         # Runs the game again
         self.deal_initial_cards() 
@@ -311,16 +455,16 @@ class BlackjackGame:
     def end_game_screen(self, outcome, winners=None):
         """Display the end game screen with outcomes based on the game mode."""
         
+        # Bring the table up to date before darkening it
+        self.draw_screen()
+
         # Create an overlay to darken the screen background and indicate end of game
         overlay_surface = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
         overlay_surface.fill((0, 0, 0, 210))  # Semi-transparent black
         self.screen.blit(overlay_surface, (0, 0))
 
-        font_large = pygame.font.Font(None, 60)  # Large font for outcome text
-        font_small = pygame.font.Font(None, 36)  # Smaller font for additional text
-
-        # Display outcome text (win, lose, or tie)
-        outcome_text = font_large.render(outcome, True, (255, 255, 255))
+        # Display outcome text (win, lose, or tie) in the large font, other text is smaller
+        outcome_text = self.text.render(outcome, 60, (255, 255, 255))
 
         if self.num_players == 1:
             # Single-player mode: Show hand validity message and player's hand value
@@ -333,30 +477,24 @@ class BlackjackGame:
                 validity_message = "Hand is Valid"
 
             # Render and display validity and hand value text
-            validity_text = font_small.render(validity_message, True, (255, 255, 255))
-            hand_value_text = font_small.render(f"Hand Value: {hand_value}", True, (255, 255, 255))
+            validity_text = self.text.render(validity_message, 36, (255, 255, 255))
+            hand_value_text = self.text.render(f"Hand Value: {hand_value}", 36, (255, 255, 255))
             self.screen.blit(hand_value_text, (50, 50))
             self.screen.blit(validity_text, ((self.screen.get_width() - validity_text.get_width()) // 2, 150))
 
         else:
             # Multi-play mode: Display hand values for relevant players
-            player_map = {
-                self.player: "Player 1",
-                self.opponent_one: "Player 2",
-                self.opponent_two: "Player 3"
-            }
-
             y_offset = 50
             for winner in winners or []:
-                player_label = player_map[winner]
-                player_hand_text = font_small.render(f"{player_label}: {winner.hand_value()}", True, (255, 255, 255))
+                player_label = self.player_label(winner)
+                player_hand_text = self.text.render(f"{player_label}: {winner.hand_value()}", 36, (255, 255, 255))
                 self.screen.blit(player_hand_text, (525, y_offset))
                 y_offset += 40  
 
             # If only one valid player is left, show different message
-            if len(winners) == 1:
+            if winners and len(winners) == 1:
                 only_valid_message = f"Only Valid Player, hand value: {winners[0].hand_value()}"
-                validity_text = font_small.render(only_valid_message, True, (255, 255, 255))
+                validity_text = self.text.render(only_valid_message, 36, (255, 255, 255))
                 self.screen.blit(validity_text, ((self.screen.get_width() - validity_text.get_width()) // 2, 150))
 
         # Display outcome text in the center of the screen
@@ -366,13 +504,12 @@ class BlackjackGame:
         play_again_button = pygame.Rect((self.screen.get_width() // 2 - 150, 350, 300, 80))
         exit_button = pygame.Rect((self.screen.get_width() // 2 - 150, 450, 300, 80))
 
-        button_font = pygame.font.Font(None, 50)
         pygame.draw.rect(self.screen, (0, 255, 0), play_again_button)  #
         pygame.draw.rect(self.screen, (255, 0, 0), exit_button)
 
         # Render and position button text
-        play_again_text = button_font.render("Play Again", True, (0, 0, 0))
-        exit_text = button_font.render("Exit", True, (0, 0, 0))
+        play_again_text = self.text.render("Play Again", 50, (0, 0, 0))
+        exit_text = self.text.render("Exit", 50, (0, 0, 0))
 
         self.screen.blit(play_again_text,
                         (play_again_button.x + (play_again_button.width - play_again_text.get_width()) // 2,
@@ -381,12 +518,13 @@ class BlackjackGame:
                         (exit_button.x + (exit_button.width - exit_text.get_width()) // 2,
                         exit_button.y + (exit_button.height - exit_text.get_height()) // 2))
 
-        pygame.display.flip()
+        self.target.present()
 
         # Event handling loop to wait for button clicks (play again or exit)
+        # Block until there is input, rather than polling
         running_end_screen = True
         while running_end_screen:
-            for event in pygame.event.get():
+            for event in [pygame.event.wait()] + pygame.event.get():
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     exit()
@@ -405,45 +543,56 @@ class BlackjackGame:
                         exit()
 
 
-    def handle_input(self):
+    def wait_for_events(self):
+        """Sleeps until there is input or a scheduled timer is due, then returns the pending events."""
+        
+        # Block with no timeout when nothing is scheduled or animating, so an idle table uses no CPU
+        timeouts = [timeout for timeout in (self.scheduler.timeout(), self.timeline.timeout()) if timeout is not None]
+        if not timeouts:
+            event = pygame.event.wait()
+        else:
+            event = pygame.event.wait(max(int(min(timeouts) * 1000), 1))
+        events = pygame.event.get()
+        if event.type != pygame.NOEVENT:
+            events.insert(0, event)
+
+        # Run timers and finish animations that came due while waiting
+        self.scheduler.run_due()
+        self.timeline.update()
+        return events
+
+    def handle_input(self, events=None):
         """Handles user input, including mouse events for player actions like hitting, standing, and quitting."""
         
         # Current mouse position and quit event
         mouse_pos = pygame.mouse.get_pos()
-        for event in pygame.event.get():
+        for event in events if events is not None else pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
 
+            # F toggles fast-forwarding opponent turns, H toggles hints and P the performance overlay
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_f:
+                self.toggle_fast_forward()
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_h:
+                self.toggle_hints()
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_p:
+                self.toggle_profile()
+
             # Mouse button click event
             if event.type == pygame.MOUSEBUTTONDOWN:
                 mouse_pos = pygame.mouse.get_pos()
 
-                # Button action (hit)
-                if self.buttons_enabled:
+                # Button action (hit), once the previous action has finished animating
+                if self.actions_enabled():
                     if self.hit_button_rect.collidepoint(mouse_pos) and self.turn == 'player' and self.player_status == 'playing':
                         self.buttons_enabled = False
-                        self.animate_card_to_player(self.player)
-                        # Events based on no. of players
-                        if self.num_players == 1:
-                            hand_value = self.player.hand_value()
-                            if hand_value > 21:
-                                self.player.status = 'bust'
-                            self.evaluate_game_end()
-                        else:
-                            self.check_turn_end(self.player)
+                        self.player_hit()
                         self.buttons_enabled = True
                     
                     # Button action (stand)
                     elif self.stand_button_rect.collidepoint(mouse_pos) and self.turn == 'player' and self.player_status == 'playing':
                         self.buttons_enabled = False
-                        
-                        # Events based on no. of players
-                        if self.num_players == 1:
-                            self.player.status = 'stood'
-                            self.end_game_screen("You Chose to Stand.")
-                        else:
-                            self.player.status = 'stood'
-                            self.check_turn_end(self.player)
+                        self.player_stand()
                         self.buttons_enabled = True
 
             # Quit button
@@ -453,300 +602,189 @@ class BlackjackGame:
     def display_opponent_action(self, opponent, action):
         """Display the action taken by an opponent (hit or stand)."""
         
-        # Check opponent and assign a label
-        if opponent == self.opponent_one:
-            opponent_label = "Player 2"
-        elif opponent == self.opponent_two:
-            opponent_label = "Player 3"
-
-        message = f"{opponent_label} {action}"
+        message = f"{self.player_label(opponent)} {action}"
 
         # Create text surface
-        font = pygame.font.SysFont('Arial', 24)
-        text_surface = font.render(message, True, (255, 255, 255))
+        text_surface = self.text.render(message, 24, (255, 255, 255), name='Arial', sysfont=True)
         text_rect = text_surface.get_rect(center=(self.screen.get_width() // 2, 50))
 
-        # Display the new message on the screen
-        self.screen.blit(text_surface, text_rect)
-        pygame.display.flip() 
+        # Shown once the actions before it have played, for as long as the speed setting allows
+        banner = self.timeline.add(BANNER_DURATION / self.speed,
+                                   on_finish=lambda: self.banners.remove((banner, text_surface, text_rect)))
+        self.banners.append((banner, text_surface, text_rect))
+        
+    def play(self):
+        """Handles the main game loop, including card dealing, player input, and screen updates."""
 
-        # Wait for 2.5 seconds to let the player read the message
-        pygame.time.wait(2500)
+        # Deals the initial cards to all players
+        self.deal_initial_cards()
 
-        # Clear just the message area
-        self.screen.fill((34, 139, 34), text_rect) 
-        pygame.display.flip() 
-        
-    def opponent_turn(self, opponent):
-        """Handle the opponent's turn, deciding whether to hit or stand based on probability."""
-        hand_value = opponent.hand_value()
+        # Main game loop, which only wakes for input and scheduled timers
+        self.draw_screen()
+        while self.running:
+            events = self.wait_for_events()
 
-        # If the opponent's hand value is 15 or below, they always hit
-        if hand_value <= 15:
-            self.animate_card_to_player(opponent)  # Handle card drawing animation
-            self.display_opponent_action(opponent, "hit")
-            
-            # Check if the opponent busts
-            if opponent.hand_value() > 21:
-                opponent.status = 'busted' 
-                return
-
-        # Probability when the opponent's hand value is 16 to hit or stand
-        elif hand_value == 16:
-            if random.randint(1, 13) <= 4: 
-                self.animate_card_to_player(opponent)
-                self.display_opponent_action(opponent, "hit")
-
-                if opponent.hand_value() > 21:
-                    opponent.status = 'busted'
-                    return 
-            else:
-                opponent.status = 'stood'
-                self.display_opponent_action(opponent, "stood")
-        
-        # Probability when the opponent's hand value is 17 to hit or stand
-        elif hand_value == 17:
-            if random.randint(1, 13) <= 3: 
-                self.animate_card_to_player(opponent)
-                self.display_opponent_action(opponent, "hit")
-                
-                if opponent.hand_value() > 21:
-                    opponent.status = 'busted'
-                    return 
-            else:
-                opponent.status = 'stood'
-                self.display_opponent_action(opponent, "stood")
-        
-        # Probability when the opponent's hand value is 18 to hit or stand
-        elif hand_value == 18:
-            if random.randint(1, 13) <= 2:
-                self.animate_card_to_player(opponent)
-                self.display_opponent_action(opponent, "hit")
-                
-                if opponent.hand_value() > 21:
-                    opponent.status = 'busted'
-                    return
-            else:
-                opponent.status = 'stood'
-                self.display_opponent_action(opponent, "stood")
-        
-        # Probability when the opponent's hand value is 19 to hit or stand
-        elif hand_value == 19:
-            if random.randint(1, 13) == 1:
-                self.animate_card_to_player(opponent)
-                self.display_opponent_action(opponent, "hit")
-                
-                if opponent.hand_value() > 21:
-                    opponent.status = 'busted'
-                    return 
-            else:
-                opponent.status = 'stood'
-                self.display_opponent_action(opponent, "stood")
+            # Handles user input (hit, stand, quit), timed as one frame with the drawing while profiling
+            self.profiler.begin_frame()
+            with self.profiler.section('handle_input'):
+                self.handle_input(events)
 
-        # If the opponent's hand value is 20 or above, they always stand
-        elif hand_value >= 20:
-            opponent.status = 'stood'
-            self.display_opponent_action(opponent, "stood")
-            
-    def check_turn_end(self, player):
-        """Check if the current player's turn is over and queue the next player."""
-        if player.status == 'stood' or player.hand_value() > 21:
-            # Update player status if needed
-            if player.status == 'playing':
-                player.status = 'stood' if player.hand_value() <= 21 else 'busted'
-        
-        # Checks if players have all stood/busted
-        if self.check_valid_players():
-            return
-        
-        # Handles turn rotation
-        self.queue_next_turn()
-        self.turns_completed += 1
+            # Draws the current game state (cards, hand values, etc.), only where it changed
+            with self.profiler.section('draw_screen'):
+                self.draw_screen()
+            self.profiler.end_frame()
 
-        
-        # If all players have taken their turn this round, evaluate the game
-        if self.turns_completed % 3 == 0:
-            self.evaluate_game_end()
+        # Quits Pygame when the game ends
+        pygame.quit()
 
-        # The game hasn't ended so it continues
-        self.process_next_player_turn()
+    def replay(self, replay, start=0):
+        """Plays a recorded round back in the window an action at a time, paced by the game's speed.
 
-    def queue_next_turn(self):
-        """Queue the next player's turn, skipping players who are not 'playing'."""
-        
-        # Loop until a valid player is found or the game ends
-        while True:
-            if self.turn == 'player':
-                self.next_turn = 'opponent_one'
-            elif self.turn == 'opponent_one':
-                self.next_turn = 'opponent_two'
-            elif self.turn == 'opponent_two':
-                self.next_turn = 'player'
-            
-            # Check if the next player is valid
-            next_player = self.get_player_by_turn(self.next_turn)
-            if next_player.status == 'playing' and next_player.hand_value() <= 21:
-                break  # Found a valid player
-            else:
-                # Skip to the next turn
-                self.turn = self.next_turn
-
-            # Check if there are no valid players left
-            if all(
-                p.status != 'playing' or p.hand_value() > 21
-                for p in [self.player, self.opponent_one, self.opponent_two]
-            ):
-                # Exit the loop since the game is effectively over
-                return
-
-    def process_next_player_turn(self):
-        """Process the next player's turn if they are still 'playing'."""
-        next_player = self.get_player_by_turn(self.next_turn)
-
-        if next_player == self.player:
-            # Player's turn is handled via button input
-            self.turn = self.next_turn
-            return
+        The replay starts from the action at start, jumped to without animating.
+        Left and right arrows jump an action back or forward the same way. The
+        Hit and Stand buttons stay disabled, as the recording plays for the player.
+        A recording the rules no longer follow stops the replay with the reason
+        shown over the table.
+        """
 
-        # Process opponent's turn
-        if next_player.status == 'playing' and next_player.hand_value() <= 21:
-            self.turn = self.next_turn
-            
-            # Handle opponent's turn and end logic
-            self.opponent_turn(next_player)
-            self.check_turn_end(next_player)
+        self.buttons_enabled = False
+        self.replay_pending = False
+        self.jump_replay(replay, start)
 
-    def evaluate_game_end(self):
-        """Evaluate if the game has ended after all players have completed their turn."""
-        
-        # Game status flag
-        game_should_continue = False
-        
-        # Handle based on single/multi-player mode
-        if self.num_players == 1:
-            hand_value = self.player.hand_value()
+        # The same loop as play, with the recording taking the player's turns
+        self.draw_screen()
+        while self.running:
+            if not self.replay_pending and not replay.finished and self.replay_error is None and self.timeline.idle:
+                self.schedule_replay_step(replay)
+            events = self.wait_for_events()
+
+            self.profiler.begin_frame()
+            with self.profiler.section('handle_input'):
+                for event in events:
+                    if event.type == pygame.KEYDOWN and event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                        self.jump_replay(replay, replay.position + (1 if event.key == pygame.K_RIGHT else -1))
+                self.handle_input(events)
+            with self.profiler.section('draw_screen'):
+                self.draw_screen()
+            self.profiler.end_frame()
 
-            # Check if the player's hand value leads to a loss or a win
-            if hand_value > 21:
-                self.end_game_screen("Bust! You Lose.")
-            elif hand_value == 21:
-                self.end_game_screen("Blackjack! You Win!")
+        pygame.quit()
 
-        else:
-            # Check and update status for each player
-            for player in [self.player, self.opponent_one, self.opponent_two]:
-                if player.hand_value() == 21 and player.status != 'stood':
-                    player.status = 'stood'  # Mark the player as stood if they reached 21
-                elif player.hand_value() > 21 and player.status != 'busted':
-                    player.status = 'busted'  # Mark the player as busted if they exceed 21
-
-            # The game continues if any player still has 'playing' status
-            game_should_continue = any(player.status == 'playing' for player in [self.player, self.opponent_one, self.opponent_two])
-            if game_should_continue:
-                self.game_over = False
-                return
-            
-            # Check for players who have exactly 21
-            players_with_21 = [
-                p for p in [self.player, self.opponent_one, self.opponent_two]
-                if p.hand_value() == 21
-            ]
-
-            # Handle the scenario where multiple players have 21
-            if len(players_with_21) > 1:
-                self.end_game_screen("It's a tie! Multiple players have 21.", winners=players_with_21)
-                self.game_over = True
-                return
-
-            # If only one player has 21, declare them as the winner
-            if len(players_with_21) == 1:
-                winner = players_with_21[0]
-                self.end_game_screen(f"{'Player 1' if winner == self.player else 'Player 2' if winner == self.opponent_one else 'Player 3'} wins with 21!",
-                                    winners=[winner])
-                self.game_over = True
-                return
-
-
-    def check_valid_players(self):
-        """Check if the game should end and determine the winner based on the highest valid hand."""
-        
-        # If no players are still "playing", determine the winner
-        if all(p.status != 'playing' for p in [self.player, self.opponent_one, self.opponent_two]):
-            # Filter players who have not busted (hand value ≤ 21)
-            valid_players = [
-                p for p in [self.player, self.opponent_one, self.opponent_two]
-                if p.hand_value() <= 21
-            ]
-
-            if valid_players:
-                # Determine the player(s) with the highest valid hand
-                highest_score = max(p.hand_value() for p in valid_players)
-                winners = [p for p in valid_players if p.hand_value() == highest_score]
-
-                # Convert winners to their respective player labels
-                winner_names = [
-                    "Player 1" if p == self.player else "Player 2" if p == self.opponent_one else "Player 3"
-                    for p in winners
-                ]
-
-                # If multiple players have the highest score, it's a tie
-                if len(winners) > 1:
-                    self.end_game_screen(f"{', '.join(winner_names)} have tied!", winners=winners)
-                else:
-                    self.end_game_screen(f"{winner_names[0]} wins!", winners=winners)
-
-                self.game_over = True
-                return True  # Game is over
-
-            # If all players busted, no winner
-            self.end_game_screen("All players busted! No winner.")
-            self.game_over = True
-            return True  # Game is over
-        
-        return False  # Game continues
-
-    def get_player_by_turn(self, turn):
-        """Returns the player object based on the current turn."""
-
-        # Determines which player to return based on the turn
-        if turn == 'player':
-            return self.player
-        elif turn == 'opponent_one':
-            return self.opponent_one
-        elif turn == 'opponent_two':
-            return self.opponent_two
-        
-    def play(self):
-        """Handles the main game loop, including card dealing, player input, and screen updates."""
+    def schedule_replay_step(self, replay):
+        """Plays the replay's next action after a pause, unless it has been jumped somewhere else by then."""
 
-        # Deals the initial cards to all players
-        self.deal_initial_cards()
+        position = replay.position
 
-        # Main game loop
-        while self.running:
-            # Handles user input (hit, stand, quit)
-            self.handle_input()
+        def step():
+            self.replay_pending = False
+            if replay.position == position:
+                try:
+                    replay.step()
+                except ValueError as error:
+                    self.replay_error = str(error)
 
-            # Draws the current game state (cards, hand values, etc.)
-            self.draw_screen()
+        self.replay_pending = True
+        self.scheduler.call_later(REPLAY_PAUSE / self.speed, step)
 
-            # Limits the game loop to 30 frames per second
-            self.clock.tick(30)
+    def jump_replay(self, replay, index):
+        """Moves a replay to an action index with no animations, redrawing the whole table."""
 
-        # Quits Pygame when the game ends
-        pygame.quit()
+        self.autoplaying = True
+        self.replay_error = None
+        try:
+            replay.play_to(max(index, 0))
+        except ValueError as error:
+            self.replay_error = str(error)
+        finally:
+            self.timeline.finish()
+            self.autoplaying = False
+        self.renderer.invalidate()
+
+    def autoplay(self, rounds):
+        """Plays rounds with no human input and returns how often each seat won, tied, bust or lost.
+
+        The player follows the opponent policy, opponent turns are fast-forwarded
+        and animations are skipped, but every decision still goes through the
+        game's rendering, so this soak-tests the game build without a window.
+        """
+
+        # Draws the table before every decision the player makes
+        def policy(player):
+            self.timeline.finish()
+            self.draw_screen()
+            pygame.event.pump()
+            return self.opponent_decision(player)
+
+        # Fast-forwarding is put back afterwards, so the game can still be played normally
+        fast_forward = self.fast_forward
+        self.autoplaying = True
+        self.fast_forward = True
+        counts = [dict.fromkeys(OUTCOMES, 0) for _ in self.players()]
+        try:
+            for _ in range(rounds):
+                self.reset_round()
+                self.renderer.invalidate()
+                self.play_round(policy)
+                self.timeline.finish()
+                self.draw_screen()
+                for seat, result in enumerate(self.seat_results()):
+                    counts[seat][result] += 1
+        finally:
+            self.autoplaying = False
+            self.fast_forward = fast_forward
+        return counts
 
 if __name__ == '__main__':
-    while True:
+    parser = argparse.ArgumentParser(description="Play Blackjack.")
+    parser.add_argument('--players', type=int, choices=[1, 3], default=None, help="1 for single player or 3 for multi player")
+    parser.add_argument('--speed', type=float, default=1.0, help="animation speed, 2.0 is twice as fast")
+    parser.add_argument('--fast-forward', action='store_true', help="play opponent turns out at once")
+    parser.add_argument('--autoplay', type=int, default=None, metavar='N', help="play N rounds headless with no input and print the results")
+    parser.add_argument('--seed', type=int, default=None, help="seed for a reproducible run")
+    parser.add_argument('--policy', default=None, help="policy JSON file the opponents play by")
+    parser.add_argument('--hints', action='store_true', help="show whether to hit or stand from the exact odds")
+    parser.add_argument('--perfect', action='store_true', help="opponents play by the exact odds")
+    parser.add_argument('--resolution', type=parse_resolution, default=DEFAULT_RESOLUTION, metavar='WIDTHxHEIGHT',
+                        help="size of the window, or of the offscreen frames when autoplaying")
+    parser.add_argument('--profile', nargs='?', const='profile.json', default=None, metavar='PATH',
+                        help="time every frame and write a Chrome trace to PATH on exit, P shows the overlay")
+    parser.add_argument('--log', default=None, metavar='PATH', help="append every round to a binary round log")
+    args = parser.parse_args()
+    policy = Policy.load(args.policy) if args.policy else None
+    log = RoundLogWriter(args.log) if args.log else None
+
+    # Autoplay renders offscreen without a window
+    if args.autoplay is not None:
+        game = BlackjackGame(args.players or 3, rng=RandomStream(args.seed), policy=policy, perfect_ai=args.perfect,
+                             target=OffscreenTarget(args.resolution), log=log)
+        for seat, counts in enumerate(game.autoplay(args.autoplay)):
+            summary = ', '.join(f"{outcome} {count}" for outcome, count in counts.items())
+            print(f"Player {seat + 1}: {summary}")
+        if log is not None:
+            log.close()
+        pygame.quit()
+        raise SystemExit
+
+    num_players = args.players
+    while num_players is None:
         try:
             num_players = int(input("Enter 1 for Single Player or 3 for Multi Player: "))
-            if num_players in [1, 3]:
-                break
-            else:
+            if num_players not in [1, 3]:
                 print("Invalid input. Please enter 1 or 3.")
+                num_players = None
         except ValueError:
             print("Invalid input. Please enter a number (1 or 3).")
 
-    game = BlackjackGame(num_players)
-    game.play()
+    game = BlackjackGame(num_players, rng=RandomStream(args.seed), speed=args.speed, fast_forward=args.fast_forward, policy=policy,
+                         hints=args.hints, perfect_ai=args.perfect, profile=args.profile is not None,
+                         target=WindowTarget(args.resolution), log=log)
+
+    # The end screen exits directly, so the trace is written however the game is closed
+    try:
+        game.play()
+    finally:
+        if args.profile:
+            profiler.dump(args.profile)
+        if log is not None:
+            log.close()
     
@@ -0,0 +1,82 @@
+import os
+from collections import OrderedDict
+
+import pygame
+
+from .profiler import profiler
+
+CARD_BACK_KEY = (None, None, False)
+
+
+class CardAtlas:
+    def __init__(self, max_size=64):
+        """Initialise an empty atlas of decoded card surfaces."""
+
+        # Surfaces are kept in least recently used order, bounded by max_size
+        # 64 leaves room for the 52 faces and the card back of a full deck
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key_for(rank, suit, face_up):
+        """Builds the atlas key for a card, sharing one key for every card back."""
+
+        if not face_up:
+            return CARD_BACK_KEY
+        return (rank, suit, True)
+
+    @staticmethod
+    def path_for(key):
+        """Returns the asset path for an atlas key."""
+
+        rank, suit, face_up = key
+        if not face_up:
+            return os.path.join("assets", "card_back_red.png")
+        return os.path.join("assets", f"cards/{rank.lower()}_of_{suit.lower()}.png")
+
+    def get(self, rank, suit, face_up):
+        """Returns the shared surface for a card, decoding it on first use."""
+
+        key = self.key_for(rank, suit, face_up)
+        surface = self.surfaces.get(key)
+
+        # Cached surface, mark as most recently used
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        # Decode from disk once and evict the least recently used surface if full
+        self.misses += 1
+        with profiler.section('get_image load'):
+            surface = pygame.image.load(self.path_for(key))
+        self.surfaces[key] = surface
+        while len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        """Drops every cached surface and resets the counters."""
+
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self):
+        """Returns the hit, miss and eviction counters for the atlas."""
+
+        return {
+            'size': len(self.surfaces),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
+# Process-wide atlas shared by every card
+card_atlas = CardAtlas()
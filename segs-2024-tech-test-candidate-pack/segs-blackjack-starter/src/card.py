@@ -1,17 +1,37 @@
 import os
-import pygame
+
+# Suits and ranks in deck order
+SUITS = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
+RANKS = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'Queen', 'King', 'Jack', 'Ace']
+
+# Hard value of each rank, an ace counts 1 here and may count 11 in a hand
+RANK_VALUES = {'2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9, '10': 10,
+               'Jack': 10, 'Queen': 10, 'King': 10, 'Ace': 1}
 
 class Card:
+    # Fixed attributes, so cards carry no per-instance __dict__
+    __slots__ = ('suit', 'rank', 'face_up')
+
     def __init__(self,suit,rank, face_up=False):
         """Initialises a single card and its properties."""
         
-        # Properties of card, image for card and cover, and face up flag
+        # Properties of card and face up flag, image paths are only worked out when asked for
         self.suit = suit
         self.rank = rank
-        self.image_path = os.path.join("assets", f"cards/{rank.lower()}_of_{suit.lower()}.png")
-        self.image_path_two = os.path.join("assets","")
         self.face_up = face_up
 
+    @property
+    def image_path(self):
+        """Path of the image for the card's face."""
+
+        return os.path.join("assets", f"cards/{self.rank.lower()}_of_{self.suit.lower()}.png")
+
+    @property
+    def image_path_two(self):
+        """Path of the folder holding the card cover."""
+
+        return os.path.join("assets", "")
+
     def flip(self):
         """Flips card appropriately."""
         
@@ -23,10 +43,9 @@ class Card:
         return f"{self.rank} of {self.suit}" 
     
     def get_image(self):
-        """Builds image based on card from assets."""
+        """Returns the shared image for the card from the card atlas."""
         
-        if self.face_up:
-            return pygame.image.load(self.image_path)
-        else:
-            return pygame.image.load(os.path.join("assets", "card_back_red.png"))
+        # Imported here so the rules can run without pygame installed
+        from .atlas import card_atlas
+        return card_atlas.get(self.rank, self.suit, self.face_up)
     
\ No newline at end of file
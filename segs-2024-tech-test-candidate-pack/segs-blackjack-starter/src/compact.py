@@ -0,0 +1,80 @@
+import random
+from array import array
+from .card import Card, SUITS, RANKS, RANK_VALUES
+
+# A card id is suit index * 13 + rank index, in the same order as Deck.create_deck
+CARD_IDS = {(rank, suit): index * 13 + rank_index
+            for index, suit in enumerate(SUITS) for rank_index, rank in enumerate(RANKS)}
+
+# Lookup tables indexed by card id
+CARD_VALUES = bytes(RANK_VALUES[rank] for suit in SUITS for rank in RANKS)
+CARD_IS_ACE = bytes(rank == 'Ace' for suit in SUITS for rank in RANKS)
+
+def card_id(card):
+    """Returns the compact id (0-51) of a card object."""
+    
+    return CARD_IDS[(card.rank, card.suit)]
+
+def to_card(card_id, face_up=False):
+    """Builds a card object from a compact id, for rendering."""
+    
+    return Card(SUITS[card_id // 13], RANKS[card_id % 13], face_up)
+
+class CompactDeck:
+    __slots__ = ('cards',)
+
+    def __init__(self):
+        """Initialise the deck as a byte array of card ids."""
+        
+        self.cards = array('B', range(52))
+
+    def shuffle(self, rng=random):
+        """Shuffle the deck in place."""
+        
+        rng.shuffle(self.cards)
+
+    def draw_card(self):
+        """Draw a card id from the deck."""
+        
+        if not self.cards:
+            raise ValueError("No cards left in the deck")
+        return self.cards.pop()
+
+    def __len__(self):
+        """Number of cards left in the deck."""
+        
+        return len(self.cards)
+
+class CompactHand:
+    __slots__ = ('cards', 'hard', 'aces')
+
+    def __init__(self):
+        """Initialise hand as a byte array of card ids with a running total."""
+        
+        self.cards = array('B')
+        self.hard = 0
+        self.aces = 0
+
+    def add_card(self, card_id):
+        """Add card id to hand, updating the running total from the lookup tables."""
+        
+        self.cards.append(card_id)
+        self.hard += CARD_VALUES[card_id]
+        self.aces += CARD_IS_ACE[card_id]
+
+    def calculate_value(self):
+        """Returns the hand value, counting one ace as 11 where it does not bust."""
+        
+        if self.aces and self.hard <= 11:
+            return self.hard + 10
+        return self.hard
+
+    def to_cards(self, face_up=True):
+        """Builds card objects for the hand, for rendering."""
+        
+        return [to_card(card_id, face_up) for card_id in self.cards]
+
+    def __str__(self):
+        """String method for the hand"""
+        
+        return ', '.join(str(to_card(card_id)) for card_id in self.cards)
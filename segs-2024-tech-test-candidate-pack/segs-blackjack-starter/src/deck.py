@@ -1,25 +1,24 @@
 import random
-from .card import Card
+from .card import Card, SUITS, RANKS
 
 class Deck:
-    def __init__(self):
-        """Initialise the deck."""
+    def __init__(self, rng=None):
+        """Initialise the deck, shuffling with the given random stream or the global random module."""
         
         self.cards= self.create_deck()
+        self.rng = rng if rng is not None else random
     
     def create_deck(self):
         """Builds deck as list of cards."""
         
         # Cards are formed by suits and rank
-        suits = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
-        ranks = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'Queen', 'King', 'Jack', 'Ace']
-        cards = [Card(s, r) for s in suits for r in ranks]
+        cards = [Card(s, r) for s in SUITS for r in RANKS]
         return cards
 
     def shuffle(self):
         """Shuffle the deck."""
         
-        random.shuffle(self.cards)
+        self.rng.shuffle(self.cards)
     
     def draw_card(self):
         """Draw a card from the deck."""
@@ -0,0 +1,61 @@
+import hashlib
+import os
+
+import pygame
+
+# Window size the table layout was designed for
+DEFAULT_RESOLUTION = (1200, 700)
+
+def parse_resolution(text):
+    """Parses a resolution written as WIDTHxHEIGHT, e.g. 1600x900."""
+
+    try:
+        width, height = (int(value) for value in text.lower().split('x'))
+    except ValueError:
+        raise ValueError(f"Resolution must be WIDTHxHEIGHT, not {text!r}") from None
+    if width <= 0 or height <= 0:
+        raise ValueError("Resolution must be positive")
+    return width, height
+
+def frame_hash(surface):
+    """Returns a hash of a surface's pixels, equal for frames that look identical."""
+
+    return hashlib.sha256(pygame.image.tobytes(surface, 'RGB')).hexdigest()
+
+class WindowTarget:
+    def __init__(self, resolution=DEFAULT_RESOLUTION, caption="Blackjack Game"):
+        """Initialise a borderless window of the given resolution to draw the game in."""
+
+        self.surface = pygame.display.set_mode(resolution, pygame.NOFRAME)
+        pygame.display.set_caption(caption)
+
+    def present(self, rects=None):
+        """Shows the given areas of the frame in the window, or all of it."""
+
+        if rects:
+            pygame.display.update(rects)
+        else:
+            pygame.display.flip()
+
+class OffscreenTarget:
+    def __init__(self, resolution=DEFAULT_RESOLUTION, on_frame=None):
+        """Initialise an offscreen surface of the given resolution to draw the game on, with no window.
+
+        Frames are never waited on, so the game renders as fast as it can.
+        on_frame is called with the surface and the areas that changed each time
+        a frame is presented, to capture or hash it.
+        """
+
+        # Events still need a video driver, the dummy one works in containers with no display
+        if not pygame.display.get_init():
+            os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        self.surface = pygame.Surface(resolution)
+        self.on_frame = on_frame
+        self.frames = 0
+
+    def present(self, rects=None):
+        """Counts the frame and hands it to the capture hook."""
+
+        self.frames += 1
+        if self.on_frame is not None:
+            self.on_frame(self.surface, rects)
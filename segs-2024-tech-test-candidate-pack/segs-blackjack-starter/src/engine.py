@@ -0,0 +1,483 @@
+from .compact import card_id
+from .deck import Deck
+from .player import Player
+from .rng import RandomStream
+from .policy import default_policy
+from .snapshot import pack_table, unpack_table
+
+# Chance out of 13 that an opponent hits on each hand value between 16 and 19, from the default policy file
+OPPONENT_HIT_CHANCES = default_policy.hit_chances
+
+# Outcomes reported for each seat by seat_results
+OUTCOMES = ('win', 'tie', 'bust', 'lose')
+
+# Turn names of the first three seats, later seats are named opponent_3, opponent_4 and so on
+SEAT_NAMES = ('player', 'opponent_one', 'opponent_two')
+
+def turn_name(seat):
+    """Returns the turn name of a seat index."""
+
+    return SEAT_NAMES[seat] if seat < len(SEAT_NAMES) else f"opponent_{seat}"
+
+class GameEngine:
+    def __init__(self, num_players=1, shoe=None, rng=None, policy=None, log=None):
+        """Initialise the rules and table state for one or more players, without any display.
+
+        One player plays the single-player rules, any more play the table rules
+        with the first seat as the human player and the rest as opponents. Large
+        tables need a Shoe, as a single deck runs out at around eight seats.
+        With a Shoe, cards are reused across rounds and reshuffled at the cut card,
+        otherwise every round is played with a fresh deck. rng is the table's
+        RandomStream, each round is played from its own seed drawn from it.
+        policy is the Policy opponents play by, loaded from policies/default.json
+        by default. log is a RoundLogWriter every round is recorded to.
+        """
+
+        if num_players < 1:
+            raise ValueError("A table needs at least one player")
+
+        # Seeded random stream for the table and the first round
+        self.rng = rng if rng is not None else RandomStream()
+        self.seed_round()
+        self.policy = policy if policy is not None else default_policy
+
+        # Game object initializations: deck and player(s)
+        self.num_players = num_players
+        self.shoe = shoe
+        self.deck = shoe if shoe is not None else Deck()
+        self.deck.rng = self.round_rng
+        self.deck.shuffle()
+
+        # Seats in turn order, the human player first and opponents after them in multi player mode
+        self.seats = [Player() for _ in range(num_players)]
+        self.player = self.seats[0]
+        self.turn_seats = {turn_name(seat): seat for seat in range(num_players)}
+        self.seat_numbers = {player: seat for seat, player in enumerate(self.seats)}
+
+        # Turn and round state
+        self.reset_turns()
+        self.game_over = False
+        self.outcome = None
+        self.winners = []
+        self.log = log
+        self.log_round(shuffled=True)
+
+
+    @property
+    def opponent_one(self):
+        """The second seat, the first opponent."""
+
+        return self.seats[1]
+
+    @property
+    def opponent_two(self):
+        """The third seat, the second opponent."""
+
+        return self.seats[2]
+
+    @property
+    def turn(self):
+        """Name of the seat whose turn it is, 'player', 'opponent_one', 'opponent_two' and so on."""
+
+        return turn_name(self.turn_index)
+
+    @turn.setter
+    def turn(self, name):
+        """Gives the turn to the seat with the given name."""
+
+        self.turn_index = self.turn_seats[name]
+
+    @property
+    def next_turn(self):
+        """Name of the seat queued to play next."""
+
+        return turn_name(self.next_index)
+
+    @next_turn.setter
+    def next_turn(self, name):
+        """Queues the seat with the given name to play next."""
+
+        self.next_index = self.turn_seats[name]
+
+    def players(self):
+        """Returns every player at the table in turn order."""
+
+        return self.seats
+
+    def reset_turns(self):
+        """Gives the turn to the first seat and puts every seat back in the ring of seats still playing.
+
+        The ring is a circular doubly linked list over seat indexes, so a seat
+        that finishes is unlinked in O(1) and never looked at again this round.
+        """
+
+        count = len(self.seats)
+        self.turn_index = 0
+        self.next_index = 0
+        self.turns_completed = 0
+        self.next_seat = [(seat + 1) % count for seat in range(count)]
+        self.prev_seat = [(seat - 1) % count for seat in range(count)]
+        self.in_ring = [True] * count
+        self.ring_head = 0
+        self.seats_left = count
+
+    def seat_finished(self, seat):
+        """True when the seat has stood or busted."""
+
+        player = self.seats[seat]
+        return player.status != 'playing' or player.hand.is_bust
+
+    def drop_seat(self, seat):
+        """Unlinks a finished seat from the ring.
+
+        Its own links are kept, so walking on from it still reaches the next
+        seat that was playing when it was dropped.
+        """
+
+        before, after = self.prev_seat[seat], self.next_seat[seat]
+        self.next_seat[before] = after
+        self.prev_seat[after] = before
+        self.in_ring[seat] = False
+        self.seats_left -= 1
+        if self.ring_head == seat:
+            self.ring_head = after
+
+    def seat_in_play(self):
+        """Returns the index of a seat still playing, or None once every seat has finished.
+
+        Finished seats are dropped from the ring as they are found, so this is
+        O(1) amortised over a round however many seats there are.
+        """
+
+        while self.seats_left:
+            if not self.seat_finished(self.ring_head):
+                return self.ring_head
+            self.drop_seat(self.ring_head)
+        return None
+
+    def player_label(self, player):
+        """Returns the display label for a player."""
+
+        return f"Player {self.players().index(player) + 1}"
+
+    def seed_round(self, seed=None):
+        """Seeds the next round from the table's stream, or from a recorded seed to replay it."""
+
+        self.round_seed = self.rng.next_seed() if seed is None else seed
+        self.round_rng = RandomStream(self.round_seed, self.rng.backend)
+
+    def snapshot(self):
+        """Returns the round so far as compact bytes, to restore after a crash or to play out alternatives from."""
+
+        return pack_table(self)
+
+    def restore(self, data):
+        """Puts the round back as it was when snapshot was taken, on a table with the same seats and shoe."""
+
+        unpack_table(self, data)
+
+    def reset_round(self, seed=None):
+        """Resets the deck, hands and turn state for a new round, optionally replaying a recorded round seed.
+
+        Without a shoe the round seed alone decides every shuffle and decision in
+        the round. With a shoe the cards left in it carry over between rounds.
+        """
+
+        self.seed_round(seed)
+
+        # Played cards go back to the shoe, or a fresh shuffled deck is used
+        shuffled = True
+        if self.shoe is not None:
+            for player in self.players():
+                self.shoe.discard(player.hand.cards)
+            self.shoe.rng = self.round_rng
+            shuffled = self.shoe.needs_shuffle()
+            if shuffled:
+                self.shoe.reshuffle()
+        else:
+            self.deck = Deck(self.round_rng)
+            self.deck.shuffle()
+
+        # Empty hands, reusing the same players
+        for player in self.players():
+            player.reset()
+
+        # Turn and round state
+        self.reset_turns()
+        self.game_over = False
+        self.outcome = None
+        self.winners = []
+        self.log_round(shuffled)
+
+    def log_round(self, shuffled):
+        """Records the start of a round to the log, with the deck order when it was just shuffled."""
+
+        if self.log is not None:
+            self.log.start_round(self.round_seed, len(self.seats))
+            if shuffled and self.log.shuffles:
+                self.log.shuffle([card_id(card) for card in self.deck.cards])
+
+    def draw_to(self, player):
+        """Draws the top card of the deck into a player's hand and returns it."""
+
+        card = self.deck.draw_card()
+        player.add_card_to_hand(card)
+        if self.log is not None:
+            self.log.draw(self.seat_numbers[player], card_id(card), player.hand.value)
+        return card
+
+    def deal_card(self, player):
+        """Deals the top card of the deck to a player, renderers override this to animate the deal."""
+
+        self.draw_to(player)
+
+    def announce_action(self, opponent, action):
+        """Called after an opponent hits or stands, renderers override this to show the action."""
+
+    def finish_round(self, outcome, winners=None):
+        """Ends the round with an outcome message and the winning players."""
+
+        self.game_over = True
+        self.outcome = outcome
+        self.winners = winners or []
+        if self.log is not None:
+            for seat, result in enumerate(self.seat_results()):
+                self.log.outcome(seat, OUTCOMES.index(result), self.seats[seat].hand.value)
+
+    def deal_initial_cards(self):
+        """Deal 2 cards to each player (player and opponents)."""
+
+        # One card to each seat in turn order, twice
+        for _ in range(2):
+            for player in self.seats:
+                self.deal_card(player)
+        self.initial_cards_dealt = True
+
+    def player_hit(self):
+        """Deals a card to the human player and moves the game on."""
+
+        if self.log is not None:
+            self.log.decision(0, True, self.player.hand.value)
+        self.deal_card(self.player)
+
+        # Events based on no. of players
+        if self.num_players == 1:
+            if self.player.hand.is_bust:
+                self.player.status = 'busted'
+            self.evaluate_game_end()
+        else:
+            self.check_turn_end(self.player)
+
+    def player_stand(self):
+        """Stands the human player and moves the game on."""
+
+        if self.log is not None:
+            self.log.decision(0, False, self.player.hand.value)
+        self.player.status = 'stood'
+
+        # Events based on no. of players
+        if self.num_players == 1:
+            self.finish_round("You Chose to Stand.")
+        else:
+            self.check_turn_end(self.player)
+
+    def opponent_decision(self, opponent):
+        """Decides whether an opponent hits, based on probability for their hand value."""
+
+        # One table lookup, with a random draw only for hands the policy may hit or stand on
+        return self.policy.decide(opponent.hand, self.round_rng)
+
+    def opponent_turn(self, opponent):
+        """Handle the opponent's turn, deciding whether to hit or stand based on probability."""
+
+        hit = self.opponent_decision(opponent)
+        if self.log is not None:
+            self.log.decision(self.seat_numbers[opponent], hit, opponent.hand.value)
+        if hit:
+            self.deal_card(opponent)
+            self.announce_action(opponent, "hit")
+
+            # Check if the opponent busts
+            if opponent.hand.is_bust:
+                opponent.status = 'busted'
+        else:
+            opponent.status = 'stood'
+            self.announce_action(opponent, "stood")
+
+    def check_turn_end(self, player):
+        """Check if the current player's turn is over, then play opponent turns until it is the human player's turn or the game ends."""
+
+        while player is not None:
+            if player.status == 'stood' or player.hand.is_bust:
+                # Update player status if needed
+                if player.status == 'playing':
+                    player.status = 'busted' if player.hand.is_bust else 'stood'
+
+            # Checks if players have all stood/busted
+            if self.check_valid_players():
+                return
+
+            # Handles turn rotation
+            self.queue_next_turn()
+            self.turns_completed += 1
+
+            # If all players have taken their turn this round, evaluate the game
+            if self.turns_completed % len(self.seats) == 0 and self.evaluate_game_end():
+                return
+
+            # The game hasn't ended so it continues with the opponent who just played, if any
+            player = self.process_next_player_turn()
+
+    def queue_next_turn(self):
+        """Queue the next player's turn, skipping players who are not 'playing'.
+
+        Walks the ring of seats still playing from the current turn, dropping
+        finished seats on the way, so skipping them is O(1) amortised.
+        """
+
+        count = len(self.seats)
+        start = self.turn_index
+        seat = self.next_seat[start]
+        while self.seats_left and self.seat_finished(seat):
+            if self.in_ring[seat]:
+                self.drop_seat(seat)
+            seat = self.next_seat[seat]
+
+        # With no valid players left the turn moves on one seat, as the game is effectively over
+        if not self.seats_left:
+            self.turn_index = self.next_index = (start + 1) % count
+            return
+
+        # A dropped seat is pointed straight at the seat found, so the walk is not repeated
+        if not self.in_ring[start]:
+            self.next_seat[start] = seat
+        self.next_index = seat
+        self.turn_index = (seat - 1) % count
+
+    def process_next_player_turn(self):
+        """Process the next player's turn if they are still 'playing', returning the opponent who played or None."""
+
+        next_player = self.seats[self.next_index]
+
+        if next_player == self.player:
+            # Player's turn is handled by the caller (button input or a policy)
+            self.turn_index = self.next_index
+            return None
+
+        # Process opponent's turn, the caller checks whether it ended
+        if not self.seat_finished(self.next_index):
+            self.turn_index = self.next_index
+            self.opponent_turn(next_player)
+            return next_player
+        return None
+
+    def evaluate_game_end(self):
+        """Evaluate if the game has ended after all players have completed their turn, returns True when it has."""
+
+        # Handle based on single/multi-player mode
+        if self.num_players == 1:
+            hand_value = self.player.hand_value()
+
+            # Check if the player's hand value leads to a loss or a win
+            if hand_value > 21:
+                self.finish_round("Bust! You Lose.")
+            elif hand_value == 21:
+                self.finish_round("Blackjack! You Win!", winners=[self.player])
+            return self.game_over
+
+        # Check and update status for each player
+        for player in self.players():
+            if player.hand_value() == 21 and player.status != 'stood':
+                player.status = 'stood'  # Mark the player as stood if they reached 21
+            elif player.hand.is_bust and player.status != 'busted':
+                player.status = 'busted'  # Mark the player as busted if they exceed 21
+
+        # The game continues if any player still has 'playing' status
+        if self.seat_in_play() is not None:
+            self.game_over = False
+            return False
+
+        # Check for players who have exactly 21
+        players_with_21 = [p for p in self.players() if p.hand_value() == 21]
+
+        # Handle the scenario where multiple players have 21
+        if len(players_with_21) > 1:
+            self.finish_round("It's a tie! Multiple players have 21.", winners=players_with_21)
+            return True
+
+        # If only one player has 21, declare them as the winner
+        if len(players_with_21) == 1:
+            winner = players_with_21[0]
+            self.finish_round(f"{self.player_label(winner)} wins with 21!", winners=[winner])
+            return True
+
+        # Nobody is playing, so the highest valid hand wins
+        return self.check_valid_players()
+
+    def check_valid_players(self):
+        """Check if the game should end and determine the winner based on the highest valid hand."""
+
+        # If no players are still "playing", determine the winner
+        if self.seat_in_play() is None:
+            # Filter players who have not busted (hand value ≤ 21)
+            valid_players = [p for p in self.players() if not p.hand.is_bust]
+
+            if valid_players:
+                # Determine the player(s) with the highest valid hand
+                highest_score = max(p.hand_value() for p in valid_players)
+                winners = [p for p in valid_players if p.hand_value() == highest_score]
+
+                # Convert winners to their respective player labels
+                winner_names = [self.player_label(p) for p in winners]
+
+                # If multiple players have the highest score, it's a tie
+                if len(winners) > 1:
+                    self.finish_round(f"{', '.join(winner_names)} have tied!", winners=winners)
+                else:
+                    self.finish_round(f"{winner_names[0]} wins!", winners=winners)
+                return True  # Game is over
+
+            # If all players busted, no winner
+            self.finish_round("All players busted! No winner.")
+            return True  # Game is over
+
+        return False  # Game continues
+
+    def get_player_by_turn(self, turn):
+        """Returns the player object based on the current turn."""
+
+        return self.seats[self.turn_seats[turn]]
+
+    def seat_results(self):
+        """Returns 'win', 'tie', 'bust' or 'lose' for each player once the round is over."""
+
+        results = []
+        for player in self.players():
+            if player in self.winners:
+                results.append('win' if len(self.winners) == 1 else 'tie')
+            elif player.hand.is_bust:
+                results.append('bust')
+            else:
+                results.append('lose')
+        return results
+
+    def play_round(self, player_policy=None):
+        """Deals and plays a whole round with no display, returning the winners.
+
+        The human player's decisions come from player_policy, a callable taking the
+        player and returning True to hit, which defaults to the opponent policy.
+        """
+
+        policy = player_policy or self.opponent_decision
+        self.deal_initial_cards()
+
+        # The engine hands control back whenever it is the human player's turn
+        while not self.game_over:
+            if self.player.status == 'playing' and self.turn == 'player':
+                if policy(self.player):
+                    self.player_hit()
+                else:
+                    self.player_stand()
+            else:
+                self.check_turn_end(self.player)
+        return self.winners
@@ -1,5 +1,17 @@
-from .card import Card
-import pygame
+from .card import Card, RANK_VALUES
+from .profiler import profiler
+
+# Card sizes used by the table layout
+CARD_SIZE = (175, 210)
+SIDE_CARD_SIZE = (int(175 * 0.9), int(210 * 0.75))
+
+# Transform steps (size, rotation) applied to a card image for each hand layout
+HAND_LAYOUTS = {
+    ('horizontal', 'normal'): ((CARD_SIZE, 0),),
+    ('vertical', 'normal'): ((CARD_SIZE, 0),),
+    ('vertical', 'left'): ((CARD_SIZE, 0), (SIDE_CARD_SIZE, 90)),
+    ('vertical', 'right'): ((CARD_SIZE, 0), (SIDE_CARD_SIZE, -90)),
+}
 
 class Hand:
     def __init__(self):
@@ -7,41 +19,102 @@ class Hand:
         
         self.cards = []
 
+    @property
+    def cards(self):
+        """Cards in the hand, add cards with add_card so the running total stays correct."""
+        
+        return self._cards
+
+    @cards.setter
+    def cards(self, cards):
+        """Replaces the cards in the hand and recounts the running total."""
+        
+        # Hard total counts every ace as 1, aces counts how many could count 11
+        self._cards = cards
+        self.hard_total = sum(RANK_VALUES[card.rank] for card in cards)
+        self.aces = sum(1 for card in cards if card.rank == 'Ace')
+
     def add_card(self, card):
         """Add card to hand."""
         
-        self.cards.append(card)
+        self._cards.append(card)
+        self.hard_total += RANK_VALUES[card.rank]
+        if card.rank == 'Ace':
+            self.aces += 1
+
+    def clear(self):
+        """Empties the hand, keeping the same list."""
+        
+        self._cards.clear()
+        self.hard_total = 0
+        self.aces = 0
+
+    @property
+    def is_soft(self):
+        """True when an ace is counting as 11."""
+        
+        return self.aces > 0 and self.hard_total <= 11
+
+    @property
+    def value(self):
+        """Value of the hand, counting one ace as 11 where it does not bust."""
+        
+        if self.is_soft:
+            return self.hard_total + 10
+        return self.hard_total
+
+    @property
+    def is_bust(self):
+        """True when the hand is over 21."""
+        
+        return self.hard_total > 21
+
+    @property
+    def is_blackjack(self):
+        """True when the hand is 21 with its first two cards."""
+        
+        return len(self._cards) == 2 and self.value == 21
     
-    def draw_hand(self, screen, x, y, orientation, facing='normal'):
-        """Draw each card in the hand at a given position (x, y) with specified orientation."""
+    def draw_hand(self, screen, x, y, orientation, facing='normal', count=None):
+        """Draw each card in the hand at a given position (x, y) with specified orientation, or only the first count cards."""
         
-        for index, card in enumerate(self.cards):
-            card_image = card.get_image()
-            card_image = pygame.transform.scale(card_image, (175, 210))
+        # Imported here so the rules can run without pygame installed
+        from .sprites import sprite_cache
+
+        # Timed as one section while profiling is on
+        with profiler.section('draw_hand'):
+            steps = HAND_LAYOUTS.get((orientation, facing), HAND_LAYOUTS[('horizontal', 'normal')])
+            for index, card in enumerate(self.cards[:count]):
+                card_image = sprite_cache.get_chain(card.get_image(), steps)
             
-            # Draw horizontally for the player (left to right)
-            if orientation == 'horizontal':
-                screen.blit(card_image, (x + index * 50, y))
+                # Draw horizontally for the player (left to right)
+                if orientation == 'horizontal':
+                    screen.blit(card_image, (x + index * 50, y))
             
-            # Draw vertically for the opponents
-            elif orientation == 'vertical':
-                
-                # Rotate the card 90 degrees clockwise to face the opponent
-                if facing == 'left':
-                    rotated_card = pygame.transform.rotate(card_image, 90)
-                    rotated_card = pygame.transform.scale(rotated_card, (int(175 * 0.9), int(210 * 0.75)))
-                    screen.blit(rotated_card, (x, y + index * 50))
-                
-                # Rotate the card 90 degrees clockwise to face the opponent
-                elif facing == 'right':
-                    rotated_card = pygame.transform.rotate(card_image, -90)
-                    rotated_card = pygame.transform.scale(rotated_card, (int(175 * 0.9), int(210 * 0.75)))
-                    screen.blit(rotated_card, (x, y - index * 50)) 
-
-                # Default orientation (normal)
-                else:
-                    screen.blit(card_image, (x, y + index * 50))
+                # Draw vertically for the opponents, cards are pre-rotated to face them
+                elif orientation == 'vertical':
+                    if facing == 'right':
+                        screen.blit(card_image, (x, y - index * 50)) 
+                    else:
+                        screen.blit(card_image, (x, y + index * 50))
                     
+    def bounds(self, x, y, orientation, facing='normal', count=None):
+        """Returns the (x, y, width, height) area covered when the hand, or its first count cards, is drawn at (x, y)."""
+        
+        spread = 50 * max(len(self.cards[:count]) - 1, 0)
+        if orientation == 'horizontal':
+            return (x, y, CARD_SIZE[0] + spread, CARD_SIZE[1])
+        if facing == 'right':
+            return (x, y - spread, SIDE_CARD_SIZE[0], SIDE_CARD_SIZE[1] + spread)
+        if facing == 'left':
+            return (x, y, SIDE_CARD_SIZE[0], SIDE_CARD_SIZE[1] + spread)
+        return (x, y, CARD_SIZE[0], CARD_SIZE[1] + spread)
+
+    def draw_state(self, count=None):
+        """Returns what the hand, or its first count cards, looks like, so renderers can tell when it changed."""
+        
+        return tuple((card.rank, card.suit, card.face_up) for card in self.cards[:count])
+
     def flip_last_card(self):
         """Flip card to reveal value in the hand."""
         
@@ -51,29 +124,7 @@ class Hand:
     def calculate_value(self):
         """Calculates the values of the hands based on the cards."""
         
-        # Initialise hand value and ace counter
-        value = 0
-        aces = 0
-        
-        # Loop through each card in the player's hand
-        # Assign the value based on the card
-        for card in self.cards:
-            if card.rank in ['Jack', 'Queen', 'King']:
-                value += 10
-            elif card.rank == 'Ace':
-                aces += 1
-                value += 11 
-                
-                # Decrement ace 11 value to 1 when it causes a bust 
-                while value > 21 and aces:
-                    value -= 10
-                    aces -= 1
-            
-            # Apply the value
-            else:
-                value += int(card.rank)
-        
-        return value
+        return self.value
 
     def __str__(self):
         """String method for the hand"""
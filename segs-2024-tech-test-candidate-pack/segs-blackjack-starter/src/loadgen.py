@@ -0,0 +1,114 @@
+import argparse
+import asyncio
+import json
+import time
+
+from .server import TableServer
+
+# Clients hit below this hand value and stand on it or above
+STAND_ON = 17
+
+def percentile(samples, percent):
+    """Returns the value below which the given percent of sorted samples fall, or 0 with no samples."""
+
+    if not samples:
+        return 0.0
+    return samples[min(int(len(samples) * percent / 100), len(samples) - 1)]
+
+class Client:
+    def __init__(self, reader, writer, latencies):
+        """Initialise a client on an open connection, adding the latency of every request to latencies."""
+
+        self.reader = reader
+        self.writer = writer
+        self.latencies = latencies
+        self.requests = 0
+
+    async def request(self, op, **fields):
+        """Sends a request and returns its reply, skipping any events pushed before it."""
+
+        start = time.perf_counter()
+        self.writer.write(json.dumps({'op': op, **fields}).encode() + b'\n')
+        await self.writer.drain()
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                raise ConnectionError("The server closed the connection")
+            reply = json.loads(line)
+            if 'event' not in reply:
+                break
+        self.latencies.append(time.perf_counter() - start)
+        self.requests += 1
+        if not reply['ok']:
+            raise ValueError(reply['error'])
+        return reply
+
+    async def play(self, rounds, players):
+        """Joins a table, plays rounds hitting below STAND_ON, and leaves."""
+
+        await self.request('join', players=players)
+        for _ in range(rounds):
+            state = (await self.request('deal'))['state']
+            while not state['game_over']:
+                op = 'hit' if state['seats'][0]['value'] < STAND_ON else 'stand'
+                state = (await self.request(op))['state']
+        await self.request('leave')
+        self.writer.close()
+        await self.writer.wait_closed()
+
+async def connect(host='127.0.0.1', port=None, path=None):
+    """Opens a connection to a table server on a TCP port or Unix socket."""
+
+    if path is not None:
+        return await asyncio.open_unix_connection(path)
+    return await asyncio.open_connection(host, port)
+
+async def run_load(clients=100, rounds=10, players=3, host='127.0.0.1', port=None, path=None):
+    """Plays rounds on a table server from many concurrent clients and returns the throughput and latency.
+
+    With no port or path, a server is started in this process on a free port,
+    so the whole load test runs locally in one event loop.
+    """
+
+    server = None
+    if port is None and path is None:
+        server = TableServer(players)
+        await server.start(host, 0)
+        port = server.address[1]
+
+    latencies = []
+    try:
+        connections = [Client(*await connect(host, port, path), latencies) for _ in range(clients)]
+        start = time.perf_counter()
+        await asyncio.gather(*(client.play(rounds, players) for client in connections))
+        elapsed = time.perf_counter() - start
+    finally:
+        if server is not None:
+            await server.close()
+
+    latencies.sort()
+    return {
+        'clients': clients,
+        'rounds': clients * rounds,
+        'actions': len(latencies),
+        'elapsed': elapsed,
+        'actions_per_second': len(latencies) / elapsed if elapsed else float('inf'),
+        'p50': percentile(latencies, 50),
+        'p99': percentile(latencies, 99),
+        'max': latencies[-1] if latencies else 0.0,
+    }
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Load test a table server with many concurrent clients.")
+    parser.add_argument('--clients', type=int, default=100, help="number of concurrent clients, each at its own table")
+    parser.add_argument('--rounds', type=int, default=10, help="rounds each client plays")
+    parser.add_argument('--players', type=int, default=3, help="players at each table")
+    parser.add_argument('--host', default='127.0.0.1', help="server address")
+    parser.add_argument('--port', type=int, default=None, help="server port, with neither this nor --unix a server is started in process")
+    parser.add_argument('--unix', default=None, metavar='PATH', help="server Unix socket")
+    args = parser.parse_args()
+
+    result = asyncio.run(run_load(args.clients, args.rounds, args.players, args.host, args.port, args.unix))
+    print(f"{result['clients']} clients played {result['rounds']} rounds with {result['actions']} requests in {result['elapsed']:.2f}s")
+    print(f"{result['actions_per_second']:,.0f} requests/s, latency p50 {result['p50'] * 1e3:.2f} ms, "
+          f"p99 {result['p99'] * 1e3:.2f} ms, max {result['max'] * 1e3:.2f} ms")
@@ -0,0 +1,155 @@
+import argparse
+
+import numpy as np
+
+from .engine import OUTCOMES
+from .policy import Policy, default_policy
+
+# Hard value of each card in a 52-card deck, aces count 1 and are flagged separately
+DECK_VALUES = np.array([2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, 1] * 4, dtype=np.uint8)
+
+
+def hit_table(policy=None):
+    """Builds a table of hit probabilities indexed by [soft, hard total] from a Policy or a {hand value: chance out of 13} dict."""
+
+    if policy is None:
+        policy = default_policy
+    elif not isinstance(policy, Policy):
+        policy = Policy(policy)
+
+    # The same decision table the engine uses, as probabilities
+    return np.array([list(row) for row in policy.table], dtype=np.float64) / policy.sides
+
+
+def is_soft(hard, aces):
+    """Returns where an ace is counting as 11."""
+
+    return aces & (hard <= 11)
+
+
+def hand_values(hard, aces):
+    """Returns the best hand values, counting one ace as 11 where it does not bust."""
+
+    return np.where(is_soft(hard, aces), hard + 10, hard)
+
+
+def draw_cards(rng, shoes, position, games):
+    """Draws the next card for each of the given games from their unshuffled decks.
+
+    Each draw is one step of a Fisher-Yates shuffle, so decks are only shuffled as
+    deep as the cards actually dealt, which is far cheaper than shuffling all 52.
+    """
+
+    top = position[games]
+    swap = rng.integers(top, 52)
+    cards = shoes[games, swap]
+    shoes[games, swap] = shoes[games, top]
+    position[games] += 1
+    return cards
+
+
+def play_games(rng, num_games, tables, num_seats=3):
+    """Plays a batch of games at once and returns the final hand values per seat."""
+
+    # One deck per game, shuffled lazily as cards are drawn
+    shoes = np.tile(DECK_VALUES, (num_games, 1))
+    position = np.zeros(num_games, dtype=np.int64)
+    games = np.arange(num_games)
+
+    # Deal 2 cards to every seat in seat order, as in deal_initial_cards
+    hard = np.zeros((num_seats, num_games), dtype=np.int16)
+    aces = np.zeros((num_seats, num_games), dtype=bool)
+    for _ in range(2):
+        for seat in range(num_seats):
+            cards = draw_cards(rng, shoes, position, games)
+            hard[seat] += cards
+            aces[seat] |= cards == 1
+    playing = np.ones((num_seats, num_games), dtype=bool)
+
+    # Rotate turns over the seats still playing until everyone has stood or busted
+    while playing.any():
+        for seat in range(num_seats):
+            active = games[playing[seat]]
+            if not active.size:
+                continue
+
+            # Look up a decision for every active game and deal to those that hit
+            seat_hard = hard[seat, active]
+            hits = rng.random(active.size) < tables[seat][is_soft(seat_hard, aces[seat, active]).astype(np.intp), seat_hard]
+            hitters = active[hits]
+            cards = draw_cards(rng, shoes, position, hitters)
+            hard[seat, hitters] += cards
+            aces[seat, hitters] |= cards == 1
+
+            # Standing or busting ends the seat's turns
+            playing[seat, active[~hits]] = False
+            playing[seat, hitters[hard[seat, hitters] > 21]] = False
+
+    return hand_values(hard, aces)
+
+
+def count_outcomes(values):
+    """Counts wins, ties, busts and losses per seat from the final hand values."""
+
+    # The highest valid hand wins, sharing the win is a tie
+    valid = np.where(values <= 21, values, -1)
+    best = valid.max(axis=0)
+    top = (valid == best) & (best >= 0)
+    shared = top.sum(axis=0) > 1
+
+    counts = []
+    for seat in range(values.shape[0]):
+        wins = int((top[seat] & ~shared).sum())
+        ties = int((top[seat] & shared).sum())
+        busts = int((values[seat] > 21).sum())
+        counts.append({
+            'win': wins,
+            'tie': ties,
+            'bust': busts,
+            'lose': values.shape[1] - wins - ties - busts,
+        })
+    return counts
+
+
+def simulate(num_games, hit_chances=None, num_seats=3, seed=None, chunk_size=500_000):
+    """Simulates num_games rounds and returns outcome counts and rates per seat.
+
+    hit_chances is either one Policy or {hand value: chance out of 13} dict shared
+    by every seat, or a list with one per seat. Games are played in chunks to
+    bound memory, so tens of millions of rounds run in seconds.
+    """
+
+    if num_games < 1:
+        raise ValueError("A simulation needs at least one game")
+    rng = np.random.default_rng(seed)
+    if isinstance(hit_chances, (list, tuple)):
+        tables = [hit_table(chances) for chances in hit_chances]
+    else:
+        tables = [hit_table(hit_chances)] * num_seats
+
+    # Play every chunk and merge the per-seat counters
+    totals = [dict.fromkeys(OUTCOMES, 0) for _ in range(num_seats)]
+    remaining = num_games
+    while remaining > 0:
+        size = min(chunk_size, remaining)
+        for seat, counts in enumerate(count_outcomes(play_games(rng, size, tables, num_seats))):
+            for outcome in OUTCOMES:
+                totals[seat][outcome] += counts[outcome]
+        remaining -= size
+
+    rates = [{outcome: counts[outcome] / num_games for outcome in OUTCOMES} for counts in totals]
+    return {'games': num_games, 'counts': totals, 'rates': rates}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Simulate the three-seat game with the opponent policy.")
+    parser.add_argument('--games', type=int, default=1_000_000, help="number of rounds to simulate")
+    parser.add_argument('--seed', type=int, default=None, help="seed for a reproducible run")
+    parser.add_argument('--policy', default=None, help="policy JSON file the seats play by, policies/default.json by default")
+    args = parser.parse_args()
+
+    policy = Policy.load(args.policy) if args.policy else None
+    result = simulate(args.games, hit_chances=policy, seed=args.seed)
+    for seat, rates in enumerate(result['rates']):
+        summary = ', '.join(f"{outcome} {rate:.2%}" for outcome, rate in rates.items())
+        print(f"Player {seat + 1}: {summary}")
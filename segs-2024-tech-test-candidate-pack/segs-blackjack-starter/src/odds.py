@@ -0,0 +1,155 @@
+from functools import lru_cache
+
+from .card import RANK_VALUES
+from .policy import MAX_HARD_TOTAL, default_policy
+
+# Index of the bust entry in a final total distribution, entries 0 to 21 are final hand values
+BUST = 22
+
+# Memoized results kept per function, enough for every state seen across many rounds
+CACHE_SIZE = 1 << 16
+
+def deck_counts(cards):
+    """Returns how many cards of each value are left, indexed by value - 1 with aces first and ten-value cards last."""
+
+    counts = [0] * 10
+    for card in cards:
+        counts[RANK_VALUES[card.rank] - 1] += 1
+    return tuple(counts)
+
+def hand_value(hard, ace):
+    """Returns the value of a hand from its hard total and whether it holds an ace."""
+
+    return hard + 10 if ace and hard <= 11 else hard
+
+def draws(counts):
+    """Yields (card value, probability, counts left after drawing it) for every card value left in the deck."""
+
+    total = sum(counts)
+    for index, count in enumerate(counts):
+        if count:
+            left = counts[:index] + (count - 1,) + counts[index + 1:]
+            yield index + 1, count / total, left
+
+@lru_cache(maxsize=CACHE_SIZE)
+def final_totals(hard, ace, counts, policy=default_policy):
+    """Returns the exact chance of each final total for a hand played by policy from the remaining deck counts.
+
+    The result is indexed by final hand value, with BUST for a bust. Each state
+    is memoized on the hand and the remaining deck count vector, so repeated
+    lookups as cards are dealt are free.
+    """
+
+    totals = [0.0] * (BUST + 1)
+    if hard > 21:
+        totals[BUST] = 1.0
+        return tuple(totals)
+
+    # Standing keeps the current value, hitting averages over every card left
+    p_hit = policy.table[ace][min(hard, MAX_HARD_TOTAL)] / policy.sides if sum(counts) else 0.0
+    totals[hand_value(hard, ace)] += 1.0 - p_hit
+    if p_hit:
+        for value, probability, left in draws(counts):
+            for total, chance in enumerate(final_totals(hard + value, ace or value == 1, left, policy)):
+                totals[total] += p_hit * probability * chance
+    return tuple(totals)
+
+@lru_cache(maxsize=CACHE_SIZE)
+def best_of_others(others, counts, policy=default_policy):
+    """Returns the chance of each best valid final value among the other seats, with index 0 when they all bust.
+
+    others is a tuple of (hard total, has ace, still playing) for each other seat.
+    Seats still playing are played out from the remaining deck by policy, and
+    are treated as independent of each other given the deck.
+    """
+
+    best = [0.0] * (BUST + 1)
+    best[0] = 1.0
+    for hard, ace, playing in others:
+        if playing:
+            totals = final_totals(hard, ace, counts, policy)
+        else:
+            totals = [0.0] * (BUST + 1)
+            totals[hand_value(hard, ace) if hard <= 21 else BUST] = 1.0
+
+        # Combine the best so far with this seat's final value, busts count as nothing
+        combined = [0.0] * (BUST + 1)
+        for current, p_current in enumerate(best):
+            if not p_current:
+                continue
+            for total, p_total in enumerate(totals):
+                if p_total:
+                    combined[max(current, total if total < BUST else 0)] += p_current * p_total
+        best = combined
+    return tuple(best)
+
+def stand_evs(others, counts, policy=default_policy):
+    """Returns the expected result of standing on each value from 0 to 21, counting a win as 1, a tie as 0 and a loss as -1.
+
+    With no other seats the single-player rules apply, where only 21 wins.
+    """
+
+    if others is None:
+        return tuple(1.0 if value == 21 else -1.0 for value in range(22))
+    best = best_of_others(others, counts, policy)
+    return tuple(sum(best[:value]) - sum(best[value + 1:]) for value in range(22))
+
+@lru_cache(maxsize=CACHE_SIZE)
+def hit_ev(hard, ace, counts, stands):
+    """Returns the expected result of hitting once and then playing on whichever way is better, given the results of standing."""
+
+    ev = 0.0
+    for value, probability, left in draws(counts):
+        new_hard, new_ace = hard + value, ace or value == 1
+        if new_hard > 21:
+            ev -= probability
+        else:
+            ev += probability * max(stands[hand_value(new_hard, new_ace)], hit_ev(new_hard, new_ace, left, stands))
+    return ev
+
+def seat_state(engine, player):
+    """Returns the hand state of a seat as (hard total, has ace, still playing)."""
+
+    return (player.hand.hard_total, player.hand.aces > 0, player.status == 'playing' and not player.hand.is_bust)
+
+def advice(engine, player, policy=default_policy):
+    """Returns (hit, hit EV, stand EV) for a player at the engine's table from the cards left in the deck.
+
+    Every hand is face up, so the other seats' cards are known. Seats still
+    playing are assumed to play policy and are played out from the deck as it
+    is now, while the player's own draws deplete the deck exactly. Results are
+    memoized, so asking again for the same table is sub-millisecond.
+    """
+
+    counts = deck_counts(engine.deck.cards)
+    others = None
+    if engine.num_players > 1:
+        others = tuple(seat_state(engine, other) for other in engine.players() if other is not player)
+
+    hand = player.hand
+    stands = stand_evs(others, counts, policy)
+    standing = stands[hand.value] if not hand.is_bust else -1.0
+    hitting = hit_ev(hand.hard_total, hand.aces > 0, counts, stands) if sum(counts) and not hand.is_bust else -1.0
+    return hitting > standing, hitting, standing
+
+def cache_info():
+    """Returns the memo cache statistics of the recursive functions, by name."""
+
+    return {function.__name__: function.cache_info() for function in (final_totals, best_of_others, hit_ev)}
+
+class PerfectPolicy:
+    def __init__(self, engine, policy=default_policy):
+        """Initialise a policy that hits whenever hitting has the better expected result at the engine's table.
+
+        The other seats are assumed to play policy. It can be used anywhere a
+        Policy is, e.g. engine.policy = PerfectPolicy(engine).
+        """
+
+        self.engine = engine
+        self.policy = policy
+
+    def decide(self, hand, rng):
+        """Returns True to hit, the random stream is not used as the decision is exact."""
+
+        player = next(player for player in self.engine.players() if player.hand is hand)
+        return advice(self.engine, player, self.policy)[0]
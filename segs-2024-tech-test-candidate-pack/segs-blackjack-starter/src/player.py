@@ -12,10 +12,16 @@ class Player:
         
         self.hand.add_card(card)
 
+    def reset(self):
+        """Empties the player's hand and puts them back in play."""
+        
+        self.hand.clear()
+        self.status = 'playing'
+
     def hand_value(self):
         """Calculate player's hand value."""
         
-        return self.hand.calculate_value()
+        return self.hand.value
 
     def __str__(self):
         """String method for player's hand."""
@@ -0,0 +1,81 @@
+import json
+import os
+
+# Policy the opponents play by default
+DEFAULT_POLICY_PATH = os.path.join(os.path.dirname(__file__), '..', 'policies', 'default.json')
+
+# Highest hard total a hand can reach, 21 plus a card worth 10
+MAX_HARD_TOTAL = 31
+
+class Policy:
+    def __init__(self, hit_chances, soft_hit_chances=None, always_hit_to=15, sides=13, name=None):
+        """Initialise a hit or stand policy from chances out of sides to hit on each hand value.
+
+        Values not listed in hit_chances always hit up to always_hit_to and always
+        stand above it. soft_hit_chances overrides the chance for soft hands, where
+        an ace is counting as 11.
+        """
+
+        self.name = name
+        self.sides = sides
+        self.always_hit_to = always_hit_to
+        self.hit_chances = {int(value): chance for value, chance in hit_chances.items()}
+        self.soft_hit_chances = {int(value): chance for value, chance in (soft_hit_chances or {}).items()}
+
+        # Decision table indexed by [soft][hard total], soft is 1 when an ace counts 11
+        self.table = (
+            bytes(self.chance_for(hard, False) for hard in range(MAX_HARD_TOTAL + 1)),
+            bytes(self.chance_for(hard + 10, True) if hard <= 11 else self.chance_for(hard, False)
+                  for hard in range(MAX_HARD_TOTAL + 1)),
+        )
+
+    @classmethod
+    def load(cls, path=DEFAULT_POLICY_PATH):
+        """Loads a policy from a JSON file."""
+
+        with open(path) as file:
+            data = json.load(file)
+        return cls(data['hit_chances'], data.get('soft_hit_chances'), data.get('always_hit_to', 15),
+                   data.get('sides', 13), data.get('name', os.path.splitext(os.path.basename(path))[0]))
+
+    def save(self, path):
+        """Writes the policy to a JSON file that load reads back."""
+
+        data = {
+            'name': self.name,
+            'sides': self.sides,
+            'always_hit_to': self.always_hit_to,
+            'hit_chances': {str(value): chance for value, chance in sorted(self.hit_chances.items())},
+            'soft_hit_chances': {str(value): chance for value, chance in sorted(self.soft_hit_chances.items())},
+        }
+        with open(path, 'w') as file:
+            json.dump(data, file, indent=4)
+
+    def chance_for(self, value, soft=False):
+        """Returns the chance out of sides to hit on a hand value, clamped to between 0 and sides."""
+
+        if soft and value in self.soft_hit_chances:
+            chance = self.soft_hit_chances[value]
+        elif value in self.hit_chances:
+            chance = self.hit_chances[value]
+        else:
+            chance = self.sides if value <= self.always_hit_to else 0
+        return min(max(chance, 0), self.sides)
+
+    def chance(self, hand):
+        """Returns the chance out of sides that the policy hits on a hand."""
+
+        return self.table[hand.aces > 0][min(hand.hard_total, MAX_HARD_TOTAL)]
+
+    def decide(self, hand, rng):
+        """Returns True to hit, only drawing from rng when the hand is not a certain hit or stand."""
+
+        chance = self.chance(hand)
+        if chance >= self.sides:
+            return True
+        if chance <= 0:
+            return False
+        return rng.randint(1, self.sides) <= chance
+
+# Loaded once and shared, as policies are never changed after loading
+default_policy = Policy.load()
@@ -0,0 +1,161 @@
+import json
+import time
+from collections import deque
+
+# Frames kept for the overlay statistics, ten seconds at 60 frames per second
+FRAME_HISTORY = 600
+
+# Trace events kept for the dump, the oldest are dropped beyond this
+TRACE_LIMIT = 200_000
+
+class NullSection:
+    """Section returned while profiling is off, entering and leaving it does nothing."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+NULL_SECTION = NullSection()
+
+class Section:
+    def __init__(self, profiler, name):
+        """Initialise a timed section of the given name."""
+
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = self.profiler.clock()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, self.start, self.profiler.clock() - self.start)
+        return False
+
+def add_section(sections, name, calls, total, worst):
+    """Adds calls to a section's (calls, total, worst) in a dict of sections."""
+
+    all_calls, all_total, all_worst = sections.get(name, (0, 0.0, 0.0))
+    sections[name] = (all_calls + calls, all_total + total, max(all_worst, worst))
+
+def rank(sections, count):
+    """Returns (name, calls, total, worst) for the sections taking the most time, slowest first."""
+
+    ranked = sorted(sections.items(), key=lambda item: item[1][1], reverse=True)
+    return [(name, calls, total, worst) for name, (calls, total, worst) in ranked[:count]]
+
+class Profiler:
+    def __init__(self, frames=FRAME_HISTORY, clock=time.perf_counter):
+        """Initialise a profiler that is off until enabled, timing sections and frames with the given clock in seconds.
+
+        Each frame's total time and time per section go into a ring buffer of the
+        last frames, and every section is kept as a trace event for dump.
+        Sections timed outside a frame, such as loading at startup, are summed
+        separately so they are not lost when the next frame begins.
+        """
+
+        self.enabled = False
+        self.clock = clock
+        self.frames = deque(maxlen=frames)
+        self.events = deque(maxlen=TRACE_LIMIT)
+        self.origin = clock()
+        self.frame_start = None
+        self.frame_sections = {}
+        self.outside_sections = {}
+
+    def section(self, name):
+        """Returns a context manager timing the code inside it as the named section."""
+
+        if not self.enabled:
+            return NULL_SECTION
+        return Section(self, name)
+
+    def record(self, name, start, duration):
+        """Records a finished section against the current frame, or outside frames when none is being timed, and in the trace."""
+
+        add_section(self.frame_sections if self.frame_start is not None else self.outside_sections, name, 1, duration, duration)
+        self.events.append((name, start, duration))
+
+    def begin_frame(self):
+        """Starts timing a frame."""
+
+        if self.enabled:
+            self.frame_start = self.clock()
+            self.frame_sections = {}
+
+    def end_frame(self):
+        """Finishes the frame and adds it to the ring buffer."""
+
+        if not self.enabled or self.frame_start is None:
+            return
+        duration = self.clock() - self.frame_start
+        self.frames.append((self.frame_start, duration, self.frame_sections))
+        self.events.append(('frame', self.frame_start, duration))
+        self.frame_start = None
+        self.frame_sections = {}
+
+    def percentile(self, percent):
+        """Returns the frame time below which the given percent of buffered frames fall, or 0 with no frames."""
+
+        times = sorted(duration for _, duration, _ in self.frames)
+        if not times:
+            return 0.0
+        return times[min(int(len(times) * percent / 100), len(times) - 1)]
+
+    def fps(self):
+        """Returns how many frames were drawn in the last second."""
+
+        now = self.clock()
+        return sum(1 for start, _, _ in self.frames if now - start <= 1.0)
+
+    def slowest(self, count=3):
+        """Returns (name, calls, total, worst) for the sections taking the most time over the buffered frames."""
+
+        totals = {}
+        for _, _, sections in self.frames:
+            for name, section in sections.items():
+                add_section(totals, name, *section)
+        return rank(totals, count)
+
+    def outside(self, count=3):
+        """Returns (name, calls, total, worst) for the sections taking the most time outside any frame."""
+
+        return rank(self.outside_sections, count)
+
+    def summary(self, count=3):
+        """Returns the overlay text, fps and frame times then the slowest sections, one line each."""
+
+        lines = [f"{self.fps()} fps  p50 {self.percentile(50) * 1e3:.1f} ms  p99 {self.percentile(99) * 1e3:.1f} ms"]
+        for name, calls, total, worst in self.slowest(count):
+            lines.append(f"{name} {total / calls * 1e3:.2f} ms avg {worst * 1e3:.2f} max")
+        if self.outside_sections:
+            total = sum(total for _, total, _ in self.outside_sections.values())
+            lines.append(f"outside frames {total * 1e3:.1f} ms, most in {self.outside(1)[0][0]}")
+        return lines
+
+    def trace(self):
+        """Returns the recorded sections and frames in the Chrome trace event format."""
+
+        events = [{'name': name, 'ph': 'X', 'ts': (start - self.origin) * 1e6, 'dur': duration * 1e6, 'pid': 0, 'tid': 0}
+                  for name, start, duration in self.events]
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def dump(self, path):
+        """Writes the trace to a JSON file that chrome://tracing or Perfetto opens."""
+
+        with open(path, 'w') as file:
+            json.dump(self.trace(), file)
+
+    def clear(self):
+        """Drops every buffered frame and trace event."""
+
+        self.frames.clear()
+        self.events.clear()
+        self.frame_start = None
+        self.frame_sections = {}
+        self.outside_sections = {}
+
+# Process-wide profiler shared by the game and the card, hand and text code it times
+profiler = Profiler()
@@ -0,0 +1,52 @@
+class DirtyRenderer:
+    def __init__(self, background):
+        """Initialise a retained-mode renderer that only redraws what changed."""
+
+        # Layers drawn last frame, by name, as (rect, state)
+        self.background = background
+        self.drawn = {}
+        self.full_redraw = True
+
+    def invalidate(self):
+        """Forces the whole screen to be redrawn, after something else has drawn over it."""
+
+        self.full_redraw = True
+
+    def render(self, screen, layers):
+        """Redraws the areas whose layers changed and returns the rects to update.
+
+        layers is a list of (name, rect, state, draw) in drawing order, where draw
+        takes the surface to draw on. A layer is redrawn when its rect or state
+        differs from last frame, along with any layers overlapping it.
+        """
+
+        # Find the areas that changed, including where moved or removed layers used to be
+        dirty = []
+        current = {}
+        for name, rect, state, draw in layers:
+            current[name] = (rect, state)
+            previous = self.drawn.get(name)
+            if previous != (rect, state):
+                dirty.append(rect)
+                if previous is not None and previous[0] != rect:
+                    dirty.append(previous[0])
+        for name, (rect, state) in self.drawn.items():
+            if name not in current:
+                dirty.append(rect)
+
+        if self.full_redraw:
+            dirty = [screen.get_rect()]
+        self.drawn = current
+        self.full_redraw = False
+        if not dirty:
+            return []
+
+        # Repaint each dirty area with every layer that overlaps it
+        for area in dirty:
+            screen.set_clip(area)
+            screen.fill(self.background, area)
+            for name, rect, state, draw in layers:
+                if rect.colliderect(area):
+                    draw(screen)
+        screen.set_clip(None)
+        return dirty
@@ -0,0 +1,263 @@
+import argparse
+import time
+
+from .compact import to_card
+from .engine import GameEngine, OUTCOMES
+from .roundlog import RoundLogReader, ROUND, DRAW, HIT, STAND, OUTCOME
+
+class Paused(Exception):
+    """Raised inside the engine to stop a replay before the action it is seeking to."""
+
+class RecordedRound:
+    def __init__(self, seed, num_seats, cards=None, actions=None, outcomes=None, number=None):
+        """Initialise a round to replay from its seed, with what is known of how it was played.
+
+        cards are the card ids in the order they were drawn, without them the
+        deck is shuffled again from the seed, which only deals the same cards
+        for rounds played from a fresh deck. actions are (seat, hit, hand value)
+        in the order they were decided, and decisions past the end of them are
+        made by the table's policy from the round seed. outcomes are
+        (result, hand value) for each seat, checked once the replay is over.
+        """
+
+        self.seed = seed
+        self.num_seats = num_seats
+        self.cards = cards
+        self.actions = actions or []
+        self.outcomes = outcomes
+        self.number = number
+
+    @classmethod
+    def from_log(cls, reader, number):
+        """Reads a round from a RoundLogReader, raising ValueError if it is not in the log."""
+
+        records = reader.round(number)
+        codes = records['code']
+        start = records[codes == ROUND]
+        if not len(start):
+            raise ValueError(f"Round {number} is not in the log")
+        draws = records[codes == DRAW]
+        decisions = records[(codes == HIT) | (codes == STAND)]
+        outcomes = records[codes == OUTCOME]
+        return cls(
+            int(start['data'][0]),
+            int(start['seat'][0]),
+            [int(card) for card in draws['card']],
+            [(int(seat), code == HIT, int(value)) for seat, code, value in zip(decisions['seat'], decisions['code'], decisions['value'])],
+            [(OUTCOMES[result], int(value)) for result, value in zip(outcomes['data'], outcomes['value'])] or None,
+            number,
+        )
+
+class ScriptedPolicy:
+    def __init__(self, engine, actions, fallback):
+        """Initialise a policy that hits or stands as recorded, checking each decision is asked for the seat and hand recorded.
+
+        Once the recorded actions run out, decisions are made by fallback from the
+        engine's round random stream.
+        """
+
+        self.engine = engine
+        self.actions = actions
+        self.fallback = fallback
+        self.position = 0
+        self.stop = None
+        self.seat = None
+
+    def decide(self, hand, rng=None):
+        """Returns the next recorded decision, raising Paused at the stop position."""
+
+        engine = self.engine
+        self.seat = next(seat for seat, player in enumerate(engine.seats) if player.hand is hand)
+        if self.position == self.stop:
+            raise Paused
+        if self.position < len(self.actions):
+            seat, hit, value = self.actions[self.position]
+            if (seat, value) != (self.seat, hand.value):
+                raise ValueError(f"Replay diverged at action {self.position}: recorded {engine.player_label(engine.seats[seat])} "
+                                 f"on {value}, replayed {engine.player_label(engine.seats[self.seat])} on {hand.value}")
+        else:
+            hit = self.fallback.decide(hand, engine.round_rng)
+        self.position += 1
+        return hit
+
+class Replay:
+    def __init__(self, engine, recorded):
+        """Initialise a replay of a recorded round on an engine with the same number of seats.
+
+        The engine's policy is swapped for the recorded decisions while the
+        replay plays and put back after, so the rules themselves play the round
+        out and later rounds on the engine play by its own policy again. A
+        BlackjackGame replays through its renderer, any other engine headless.
+        """
+
+        if len(engine.seats) != recorded.num_seats:
+            raise ValueError(f"The round was played with {recorded.num_seats} seats, not {len(engine.seats)}")
+        self.engine = engine
+        self.recorded = recorded
+        self.script = ScriptedPolicy(engine, recorded.actions, engine.policy)
+        self.restart()
+
+    @property
+    def position(self):
+        """Index of the next action to be played."""
+
+        return self.script.position
+
+    @property
+    def finished(self):
+        """True once the round is over."""
+
+        return self.dealt and self.engine.game_over
+
+    def restart(self):
+        """Puts the round back to before the deal."""
+
+        engine = self.engine
+        engine.reset_round(self.recorded.seed)
+        if self.recorded.cards is not None:
+            engine.deck.cards = [to_card(card) for card in reversed(self.recorded.cards)]
+        self.script.position = 0
+        self.dealt = False
+        self.waiting = None
+
+    def play_to(self, index=None):
+        """Plays on until the action at index is next or the round is over, going back to the start first if it is behind.
+
+        Actions are hit or stand decisions in the order they were made, so
+        any action index can be jumped to without playing each one out. With no
+        index the round is played to the end.
+        """
+
+        if index is not None and index < self.position:
+            self.restart()
+        engine = self.engine
+        self.script.stop = index
+        engine.policy = self.script
+        try:
+            if not self.dealt:
+                self.dealt = True
+                engine.deal_initial_cards()
+
+            # The same loop as GameEngine.play_round, resuming an opponent stopped before deciding
+            while not engine.game_over:
+                if self.waiting is not None:
+                    opponent, self.waiting = self.waiting, None
+                    engine.opponent_turn(opponent)
+                    engine.check_turn_end(opponent)
+                elif engine.player.status == 'playing' and engine.turn == 'player':
+                    if self.script.decide(engine.player.hand):
+                        engine.player_hit()
+                    else:
+                        engine.player_stand()
+                else:
+                    engine.check_turn_end(engine.player)
+        except Paused:
+            # Nothing has changed for the seat that was about to decide, the human player is asked again by the loop
+            if self.script.seat != 0:
+                self.waiting = engine.seats[self.script.seat]
+        finally:
+            self.script.stop = None
+            engine.policy = self.script.fallback
+        return self.position
+
+    def step(self):
+        """Plays the next action and everything that follows from it up to the next decision."""
+
+        return self.play_to(self.position + 1)
+
+    def differences(self):
+        """Returns how the replayed round differs from the recording, empty when they match."""
+
+        engine = self.engine
+        differences = []
+        if self.position < len(self.recorded.actions):
+            differences.append(f"Only {self.position} of {len(self.recorded.actions)} recorded actions were played")
+        if self.recorded.outcomes is not None and engine.game_over:
+            replayed = list(zip(engine.seat_results(), (player.hand.value for player in engine.players())))
+            for seat, (recorded, played) in enumerate(zip(self.recorded.outcomes, replayed)):
+                if recorded != played:
+                    differences.append(f"{engine.player_label(engine.seats[seat])} {recorded[0]} on {recorded[1]} "
+                                       f"was replayed as {played[0]} on {played[1]}")
+        return differences
+
+def check_log(path, engine_class=GameEngine):
+    """Replays every round of a log headless and returns the rounds that play out differently with the current rules.
+
+    Returns (rounds checked, {round number: differences}), where a round the
+    rules can no longer play, e.g. one that runs out of recorded cards, lists
+    the error as its difference.
+    """
+
+    reader = RoundLogReader(path)
+    engines = {}
+    mismatches = {}
+    rounds = reader.rounds()['round']
+    for number in rounds:
+        number = int(number)
+        recorded = RecordedRound.from_log(reader, number)
+
+        # Rounds reset before they were dealt have nothing to check
+        if recorded.outcomes is None:
+            continue
+        engine = engines.get(recorded.num_seats)
+        if engine is None:
+            engine = engines[recorded.num_seats] = engine_class(recorded.num_seats)
+        try:
+            replay = Replay(engine, recorded)
+            replay.play_to()
+            differences = replay.differences()
+        except ValueError as error:
+            differences = [str(error)]
+        if differences:
+            mismatches[number] = differences
+    return len(rounds), mismatches
+
+def replay_in_window(recorded, speed=1.0, start=0, resolution=None):
+    """Replays a round in the game window at the given speed, starting from an action index.
+
+    Left and right arrows jump an action back or forward without animating it.
+    """
+
+    # Imported here, so headless replays never load pygame
+    from blackjack import BlackjackGame
+    from .display import WindowTarget, DEFAULT_RESOLUTION
+
+    game = BlackjackGame(recorded.num_seats, speed=speed, target=WindowTarget(resolution or DEFAULT_RESOLUTION))
+    game.replay(Replay(game, recorded), start)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Replay recorded rounds from a round log.")
+    parser.add_argument('path', help="round log file")
+    parser.add_argument('--round', type=int, default=None, help="round number to replay")
+    parser.add_argument('--to', type=int, default=None, metavar='INDEX', help="stop before this action instead of playing the round out")
+    parser.add_argument('--window', action='store_true', help="replay the round in the game window, starting from --to")
+    parser.add_argument('--speed', type=float, default=1.0, help="animation speed in the window, 2.0 is twice as fast")
+    args = parser.parse_args()
+
+    # With no round, every round in the log is checked against the current rules
+    if args.round is None:
+        start = time.perf_counter()
+        checked, mismatches = check_log(args.path)
+        elapsed = time.perf_counter() - start
+        for number, differences in mismatches.items():
+            print(f"Round {number}: " + '; '.join(differences))
+        print(f"Replayed {checked} rounds in {elapsed:.2f}s, {len(mismatches)} played out differently")
+        raise SystemExit(1 if mismatches else 0)
+
+    recorded = RecordedRound.from_log(RoundLogReader(args.path), args.round)
+    if args.window:
+        replay_in_window(recorded, args.speed, args.to or 0)
+        raise SystemExit
+
+    engine = GameEngine(recorded.num_seats)
+    start = time.perf_counter()
+    replay = Replay(engine, recorded)
+    replay.play_to(args.to)
+    elapsed = time.perf_counter() - start
+    print(f"Round {args.round} at action {replay.position} of {len(recorded.actions)} in {elapsed * 1e3:.2f} ms")
+    for player in engine.players():
+        print(f"{engine.player_label(player)}: {player.hand} ({player.hand.value}) {player.status}")
+    if engine.game_over:
+        print(engine.outcome)
+        for difference in replay.differences():
+            print(difference)
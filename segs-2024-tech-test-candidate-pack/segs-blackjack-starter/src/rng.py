@@ -0,0 +1,64 @@
+import hashlib
+import random
+import secrets
+
+def derive_seed(seed, index):
+    """Derives an independent 63-bit child seed from a parent seed and an index."""
+
+    digest = hashlib.sha256(f"{seed}:{index}".encode()).digest()
+    return int.from_bytes(digest[:8], 'big') >> 1
+
+class RandomStream:
+    def __init__(self, seed=None, backend='python'):
+        """Initialise a seeded random stream backed by random.Random or a NumPy Generator."""
+
+        if backend not in ('python', 'numpy'):
+            raise ValueError("Backend must be 'python' or 'numpy'")
+        if seed is not None and not 0 <= seed < 2 ** 64:
+            raise ValueError("Seed must be between 0 and 2**64 - 1")
+
+        # Unseeded streams pick a seed from the OS, and keep it so runs can be replayed
+        self.seed = secrets.randbits(63) if seed is None else seed
+        self.backend = backend
+        self.spawned = 0
+        if backend == 'numpy':
+            # NumPy is only needed when asked for
+            import numpy as np
+            self.generator = np.random.default_rng(self.seed)
+        else:
+            self.generator = random.Random(self.seed)
+
+    def spawn(self, count=1):
+        """Returns independent child streams, e.g. one per table or per worker.
+
+        Child seeds depend only on this stream's seed and how many children were
+        spawned before, so splitting a batch across processes is deterministic.
+        """
+
+        children = [RandomStream(derive_seed(self.seed, self.spawned + index), self.backend) for index in range(count)]
+        self.spawned += count
+        return children
+
+    def next_seed(self):
+        """Draws a 63-bit seed, used to seed each round."""
+
+        if self.backend == 'numpy':
+            return int(self.generator.integers(2 ** 63))
+        return self.generator.getrandbits(63)
+
+    def shuffle(self, items):
+        """Shuffles a mutable sequence in place."""
+
+        self.generator.shuffle(items)
+
+    def randint(self, low, high):
+        """Returns a random integer between low and high inclusive."""
+
+        if self.backend == 'numpy':
+            return int(self.generator.integers(low, high + 1))
+        return self.generator.randint(low, high)
+
+    def random(self):
+        """Returns a random float in [0, 1)."""
+
+        return float(self.generator.random())
@@ -0,0 +1,249 @@
+import argparse
+import bisect
+import os
+import struct
+
+from .engine import GameEngine, OUTCOMES
+from .rng import RandomStream
+from .shoe import Shoe
+
+# File header, magic then format version, padded to one record
+MAGIC = b'BJLOG'
+VERSION = 1
+
+# Every record is 16 bytes: round number, code, seat, card id and hand value, then 8 bytes of data
+RECORD = struct.Struct('<IBBBBQ')
+HEADER = struct.Struct('<5sB10x')
+
+# Record codes, a round is a ROUND record followed by its shuffles, draws, decisions and outcomes
+ROUND, SHUFFLE, DRAW, HIT, STAND, OUTCOME = range(6)
+CODE_NAMES = ('round', 'shuffle', 'draw', 'hit', 'stand', 'outcome')
+
+# Seat and card fields of records that are not about a seat or a card
+NO_SEAT = NO_CARD = 255
+
+# Records buffered before they are written to the file
+BUFFER_RECORDS = 8192
+
+def record_dtype():
+    """Returns the NumPy structured dtype of a record, matching RECORD."""
+
+    # NumPy is only needed for reading logs
+    import numpy as np
+    return np.dtype([('round', '<u4'), ('code', 'u1'), ('seat', 'u1'), ('card', 'u1'), ('value', 'u1'), ('data', '<u8')])
+
+def check_header(path, header):
+    """Raises ValueError unless header is the header of a round log this version can read."""
+
+    if len(header) < HEADER.size:
+        raise ValueError(f"{path} is not a round log")
+    magic, version = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a round log")
+    if version != VERSION:
+        raise ValueError(f"Round log version {version} is not supported")
+
+class RoundLogWriter:
+    def __init__(self, path, shuffles=False, buffer_records=BUFFER_RECORDS):
+        """Opens a log for appending, writing the header if the file is new.
+
+        Records are packed into a buffer and written in blocks, so logging costs
+        a struct pack per event. The shuffle order can be replayed from each
+        round's seed, so with shuffles off only the seed is kept, and with it on
+        every card of every shuffle is written too.
+        """
+
+        self.shuffles = shuffles
+        self.buffer_size = buffer_records * RECORD.size
+        self.buffer = bytearray()
+        self.round = self.next_round = 0
+
+        # Only an existing log is appended to, never another file
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        if size:
+            with open(path, 'rb') as file:
+                header = file.read(HEADER.size)
+            if size < HEADER.size:
+                # A header cut short by a crash is written again
+                if not HEADER.pack(MAGIC, VERSION).startswith(header):
+                    raise ValueError(f"{path} is not a round log")
+                os.truncate(path, 0)
+                size = 0
+            else:
+                check_header(path, header)
+
+        # Appending carries on the round numbers, after dropping any record cut short by a crash
+        if size > HEADER.size:
+            count = (size - HEADER.size) // RECORD.size
+            os.truncate(path, HEADER.size + count * RECORD.size)
+            with open(path, 'rb') as file:
+                file.seek(-RECORD.size, os.SEEK_END)
+                self.next_round = RECORD.unpack(file.read(RECORD.size))[0] + 1 if count else 0
+        self.file = open(path, 'ab')
+        if size == 0:
+            self.file.write(HEADER.pack(MAGIC, VERSION))
+
+    def write(self, code, seat=NO_SEAT, card=NO_CARD, value=0, data=0):
+        """Adds a record for the current round to the buffer, writing the buffer out when it is full."""
+
+        buffer = self.buffer
+        buffer += RECORD.pack(self.round, code, seat, card, value, data)
+        if len(buffer) >= self.buffer_size:
+            self.flush()
+
+    def start_round(self, seed, num_seats):
+        """Starts a new round, recording its seed and the number of seats."""
+
+        self.round = self.next_round
+        self.next_round += 1
+        self.write(ROUND, num_seats, NO_CARD, 0, seed)
+
+    def shuffle(self, card_ids):
+        """Records the order of a shuffled deck, top card last, when shuffles are being logged."""
+
+        if self.shuffles:
+            for position, card in enumerate(card_ids):
+                self.write(SHUFFLE, NO_SEAT, card, 0, position)
+
+    def draw(self, seat, card, value):
+        """Records a card drawn into a seat's hand and the hand value after it."""
+
+        self.write(DRAW, seat, card, value)
+
+    def decision(self, seat, hit, value):
+        """Records a seat hitting or standing on a hand value."""
+
+        self.write(HIT if hit else STAND, seat, NO_CARD, value)
+
+    def outcome(self, seat, result, value):
+        """Records a seat's result, an index into OUTCOMES, and final hand value."""
+
+        self.write(OUTCOME, seat, NO_CARD, value, result)
+
+    def flush(self):
+        """Writes the buffered records to the file."""
+
+        self.file.write(self.buffer)
+        self.buffer.clear()
+        self.file.flush()
+
+    def close(self):
+        """Writes anything buffered and closes the file."""
+
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+class RoundLogReader:
+    def __init__(self, path):
+        """Maps a log file into memory as a NumPy structured array of records, without reading or parsing it."""
+
+        import numpy as np
+
+        with open(path, 'rb') as file:
+            check_header(path, file.read(HEADER.size))
+
+        # An empty log cannot be mapped, and a record cut short by a crash is left out
+        count = (os.path.getsize(path) - HEADER.size) // RECORD.size
+        if count:
+            self.records = np.memmap(path, dtype=record_dtype(), mode='r', offset=HEADER.size, shape=(count,))
+        else:
+            self.records = np.empty(0, dtype=record_dtype())
+
+    def __len__(self):
+        """Number of records in the log."""
+
+        return len(self.records)
+
+    def of(self, code):
+        """Returns the records with the given code."""
+
+        return self.records[self.records['code'] == code]
+
+    def rounds(self):
+        """Returns the ROUND records, one per round with its seed in data and number of seats in seat.
+
+        A round reset before it was dealt, as when a game starts a fresh one,
+        has its ROUND record and nothing else.
+        """
+
+        return self.of(ROUND)
+
+    def round(self, number):
+        """Returns the records of one round, found by binary search as rounds are written in order."""
+
+        numbers = self.records['round']
+        start = bisect.bisect_left(numbers, number)
+        return self.records[start:bisect.bisect_right(numbers, number, lo=start)]
+
+    def draws(self):
+        """Returns the DRAW records."""
+
+        return self.of(DRAW)
+
+    def decisions(self):
+        """Returns the HIT and STAND records."""
+
+        codes = self.records['code']
+        return self.records[(codes == HIT) | (codes == STAND)]
+
+    def outcomes(self):
+        """Returns the OUTCOME records, with the result index in data and final hand value in value."""
+
+        return self.of(OUTCOME)
+
+    def summary(self):
+        """Returns counts of rounds played, draws and decisions, and the rate of each outcome per seat."""
+
+        import numpy as np
+
+        outcomes = self.outcomes()
+        rates = []
+        if len(outcomes):
+            seats = int(outcomes['seat'].max()) + 1
+            counts = np.zeros((seats, len(OUTCOMES)), dtype=np.int64)
+            np.add.at(counts, (outcomes['seat'], outcomes['data'].astype(np.int64)), 1)
+            rates = [dict(zip(OUTCOMES, row / max(row.sum(), 1))) for row in counts]
+        decisions = self.decisions()
+        return {
+            'rounds': len(np.unique(outcomes['round'])),
+            'draws': len(self.draws()),
+            'hits': int((decisions['code'] == HIT).sum()),
+            'stands': int((decisions['code'] == STAND).sum()),
+            'rates': rates,
+        }
+
+def record_rounds(path, rounds, num_seats=3, seed=None, num_decks=None, shuffles=False):
+    """Plays headless rounds with logging on, appending them to the log at path."""
+
+    with RoundLogWriter(path, shuffles) as log:
+        engine = GameEngine(num_seats, shoe=Shoe(num_decks) if num_decks else None, rng=RandomStream(seed), log=log)
+        for index in range(rounds):
+            # The first round is dealt from the table as it was set up
+            if index:
+                engine.reset_round()
+            engine.play_round()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Record headless rounds to a binary round log, or summarise a log.")
+    parser.add_argument('path', help="round log file")
+    parser.add_argument('--record', type=int, default=None, metavar='ROUNDS', help="play and append this many rounds first")
+    parser.add_argument('--seats', type=int, default=3, help="number of seats when recording")
+    parser.add_argument('--decks', type=int, default=None, help="deal from a shoe of this many decks when recording")
+    parser.add_argument('--seed', type=int, default=None, help="seed for reproducible recording")
+    parser.add_argument('--shuffles', action='store_true', help="log the full order of every shuffle")
+    args = parser.parse_args()
+
+    if args.record:
+        record_rounds(args.path, args.record, args.seats, args.seed, args.decks, args.shuffles)
+    summary = RoundLogReader(args.path).summary()
+    print(f"{summary['rounds']} rounds, {summary['draws']} draws, {summary['hits']} hits, {summary['stands']} stands")
+    for seat, rates in enumerate(summary['rates']):
+        print(f"Player {seat + 1}: " + ', '.join(f"{outcome} {rate:.2%}" for outcome, rate in rates.items()))
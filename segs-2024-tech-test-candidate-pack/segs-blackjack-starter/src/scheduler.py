@@ -0,0 +1,32 @@
+import heapq
+import itertools
+import time
+
+class Scheduler:
+    def __init__(self, clock=time.monotonic):
+        """Initialise an empty timer queue measured with the given clock in seconds."""
+
+        # Timers are kept in a heap of (deadline, order, callback)
+        self.clock = clock
+        self.timers = []
+        self.order = itertools.count()
+
+    def call_later(self, delay, callback):
+        """Runs the callback once, delay seconds from now."""
+
+        heapq.heappush(self.timers, (self.clock() + delay, next(self.order), callback))
+
+    def timeout(self):
+        """Returns the seconds until the next timer is due, or None when nothing is pending."""
+
+        if not self.timers:
+            return None
+        return max(self.timers[0][0] - self.clock(), 0)
+
+    def run_due(self):
+        """Runs every timer whose deadline has passed."""
+
+        now = self.clock()
+        while self.timers and self.timers[0][0] <= now:
+            callback = heapq.heappop(self.timers)[2]
+            callback()
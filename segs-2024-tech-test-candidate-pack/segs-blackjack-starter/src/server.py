@@ -0,0 +1,360 @@
+import argparse
+import asyncio
+import itertools
+import json
+
+from .engine import GameEngine
+from .policy import Policy
+from .rng import RandomStream
+
+# Longest request line accepted, a longer one closes the connection
+MAX_LINE = 4096
+
+# Replies and events queued for a client before it counts as too slow and is dropped
+OUTBOX_SIZE = 64
+
+# Bytes buffered in the socket for a client before writing to it waits
+WRITE_BUFFER = 64 * 1024
+
+# Seconds to finish writing to a client that has disconnected before dropping what is left
+FLUSH_TIMEOUT = 5.0
+
+# Seconds a player has to hit or stand before standing automatically
+TURN_TIMEOUT = 30.0
+
+# A single deck runs out at around eight seats
+MAX_SEATS = 7
+
+class TableEngine(GameEngine):
+    def __init__(self, num_players=3, rng=None, policy=None):
+        """Initialise a headless table that records opponent actions for the client instead of showing them."""
+
+        super().__init__(num_players, rng=rng, policy=policy)
+        self.actions = []
+
+    def announce_action(self, opponent, action):
+        """Records an opponent hit or stand, sent with the next reply."""
+
+        self.actions.append((self.player_label(opponent), action))
+
+class Table:
+    def __init__(self, table_id, num_players, rng, policy=None, turn_timeout=TURN_TIMEOUT, on_timeout=None):
+        """Initialise a table with one client in the first seat and the policy playing the rest.
+
+        When the client is to play, a timer stands for them after turn_timeout
+        seconds and on_timeout is called with the table.
+        """
+
+        self.id = table_id
+        self.engine = TableEngine(num_players, rng, policy)
+        self.turn_timeout = turn_timeout
+        self.on_timeout = on_timeout
+        self.rounds = 0
+        self.timer = None
+
+    @property
+    def in_round(self):
+        """True while a round is being played."""
+
+        return self.rounds > 0 and not self.engine.game_over
+
+    def deal(self):
+        """Starts a new round and plays the opponents up to the client's first decision."""
+
+        if self.in_round:
+            raise ValueError("The round is still being played")
+        self.engine.reset_round()
+        self.engine.actions.clear()
+        self.engine.deal_initial_cards()
+        self.rounds += 1
+        self.advance()
+
+    def act(self, hit):
+        """Hits or stands for the client and plays the opponents up to the client's next decision."""
+
+        engine = self.engine
+        if not self.in_round:
+            raise ValueError("No round is being played, deal first")
+        if engine.turn != 'player' or engine.player.status != 'playing':
+            raise ValueError("It is not your turn")
+        engine.actions.clear()
+        if hit:
+            engine.player_hit()
+        else:
+            engine.player_stand()
+        self.advance()
+
+    def advance(self):
+        """Plays on until the client has to decide or the round is over, then sets the turn timer."""
+
+        # The same loop as GameEngine.play_round, stopping where it would ask the player
+        engine = self.engine
+        while not engine.game_over and not (engine.player.status == 'playing' and engine.turn == 'player'):
+            engine.check_turn_end(engine.player)
+
+        self.cancel_timer()
+        if not engine.game_over and self.turn_timeout is not None:
+            self.timer = asyncio.get_running_loop().call_later(self.turn_timeout, self.expire)
+
+    def expire(self):
+        """Stands for a client that took too long to act."""
+
+        self.timer = None
+        self.act(False)
+        if self.on_timeout is not None:
+            self.on_timeout(self)
+
+    def cancel_timer(self):
+        """Stops the turn timer, if it is running."""
+
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+    def state(self):
+        """Returns the table as JSON-ready data, every hand is face up."""
+
+        engine = self.engine
+        state = {
+            'table': self.id,
+            'round': self.rounds,
+            'turn': engine.turn,
+            'seats': [{'cards': [str(card) for card in player.hand.cards], 'value': player.hand_value(), 'status': player.status}
+                      for player in engine.players()],
+            'actions': [list(action) for action in engine.actions],
+            'game_over': not self.in_round,
+        }
+        if self.rounds and engine.game_over:
+            state['outcome'] = engine.outcome
+            state['results'] = engine.seat_results()
+        return state
+
+class Connection:
+    def __init__(self, writer, outbox_size=OUTBOX_SIZE):
+        """Initialise a client connection with a bounded queue of messages waiting to be written."""
+
+        self.writer = writer
+        self.outbox = asyncio.Queue(outbox_size)
+        self.table = None
+        self.closed = False
+
+    async def send(self, message):
+        """Queues a reply, waiting while the client is behind, so a slow reader stops its own requests being read."""
+
+        await self.outbox.put(message)
+
+    def push(self, message):
+        """Queues an event from a timer, dropping the client if it has fallen too far behind to take it."""
+
+        try:
+            self.outbox.put_nowait(message)
+        except asyncio.QueueFull:
+            self.close()
+
+    async def write_messages(self):
+        """Writes queued messages as JSON lines, waiting for the socket to drain after each."""
+
+        try:
+            while True:
+                message = await self.outbox.get()
+                if message is None:
+                    return
+                self.writer.write(json.dumps(message).encode() + b'\n')
+                await self.writer.drain()
+        except ConnectionError:
+            self.closed = True
+
+    def close(self):
+        """Closes the connection straight away, dropping anything not yet written."""
+
+        self.closed = True
+        self.writer.transport.abort()
+
+class TableServer:
+    def __init__(self, num_players=3, seed=None, policy=None, turn_timeout=TURN_TIMEOUT, outbox_size=OUTBOX_SIZE):
+        """Initialise a server hosting a table for every client in one event loop.
+
+        Each table is seeded from its own stream spawned from the server seed,
+        so a seeded server deals the same cards to the nth table it opens.
+        """
+
+        self.num_players = num_players
+        self.rng = RandomStream(seed)
+        self.policy = policy
+        self.turn_timeout = turn_timeout
+        self.outbox_size = outbox_size
+        self.tables = {}
+        self.table_ids = itertools.count(1)
+        self.server = None
+        self.connections = {}
+        self.requests = 0
+        self.ops = {
+            'join': self.join,
+            'deal': self.deal,
+            'hit': self.hit,
+            'stand': self.stand,
+            'state': self.table_state,
+            'leave': self.leave,
+        }
+
+    async def start(self, host='127.0.0.1', port=0, path=None):
+        """Starts listening on a TCP port, or on a Unix socket when path is given, and returns the asyncio server."""
+
+        if path is not None:
+            self.server = await asyncio.start_unix_server(self.handle, path, limit=MAX_LINE)
+        else:
+            self.server = await asyncio.start_server(self.handle, host, port, limit=MAX_LINE)
+        return self.server
+
+    @property
+    def address(self):
+        """The (host, port) or socket path being listened on."""
+
+        return self.server.sockets[0].getsockname()
+
+    async def close(self):
+        """Stops listening, drops every client and waits for their handlers to finish."""
+
+        self.server.close()
+        for connection in list(self.connections):
+            connection.close()
+        await asyncio.gather(*self.connections.values(), return_exceptions=True)
+        await self.server.wait_closed()
+
+    async def handle(self, reader, writer):
+        """Serves one client, reading a request per line and replying to each in order."""
+
+        writer.transport.set_write_buffer_limits(high=WRITE_BUFFER)
+        connection = Connection(writer, self.outbox_size)
+        self.connections[connection] = asyncio.current_task()
+        writing = asyncio.create_task(connection.write_messages())
+        try:
+            while not connection.closed:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    await connection.send({'ok': False, 'error': f"Requests are limited to {MAX_LINE} bytes"})
+                    break
+                except ConnectionError:
+                    break
+                if not line:
+                    break
+                await connection.send(self.dispatch(connection, line))
+        finally:
+            # Replies already queued are written before closing, unless the client stopped reading them
+            self.leave(connection)
+            if not connection.closed:
+                connection.push(None)
+            if connection.closed:
+                writing.cancel()
+            done, _ = await asyncio.wait({writing}, timeout=FLUSH_TIMEOUT)
+            if not done:
+                writing.cancel()
+                connection.close()
+            writer.close()
+            del self.connections[connection]
+
+    def dispatch(self, connection, line):
+        """Runs one request line and returns the reply."""
+
+        self.requests += 1
+        request = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("Requests must be JSON objects")
+            op = request.get('op')
+            if not isinstance(op, str):
+                raise ValueError("The op must be a string")
+            handler = self.ops.get(op)
+            if handler is None:
+                raise ValueError(f"Unknown op {op!r}")
+            reply = {'ok': True, **handler(connection, request)}
+        except ValueError as error:
+            reply = {'ok': False, 'error': str(error)}
+
+        # Echoing the request id lets clients match replies to requests
+        if isinstance(request, dict) and 'id' in request:
+            reply['id'] = request['id']
+        return reply
+
+    def table_for(self, connection):
+        """Returns the connection's table, raising ValueError if it has not joined one."""
+
+        if connection.table is None:
+            raise ValueError("Join a table first")
+        return connection.table
+
+    def join(self, connection, request):
+        """Opens a table for the connection, with the number of players asked for or the server default."""
+
+        if connection.table is not None:
+            raise ValueError("Already at a table")
+        num_players = request.get('players', self.num_players)
+        if not isinstance(num_players, int) or isinstance(num_players, bool) or not 1 <= num_players <= MAX_SEATS:
+            raise ValueError(f"Players must be between 1 and {MAX_SEATS}")
+        table = Table(next(self.table_ids), num_players, self.rng.spawn()[0], self.policy, self.turn_timeout,
+                      on_timeout=lambda table: connection.push({'event': 'timeout', 'state': table.state()}))
+        self.tables[table.id] = table
+        connection.table = table
+        return {'state': table.state()}
+
+    def deal(self, connection, request):
+        """Deals a new round at the connection's table."""
+
+        table = self.table_for(connection)
+        table.deal()
+        return {'state': table.state()}
+
+    def hit(self, connection, request):
+        """Hits for the connection's player."""
+
+        table = self.table_for(connection)
+        table.act(True)
+        return {'state': table.state()}
+
+    def stand(self, connection, request):
+        """Stands for the connection's player."""
+
+        table = self.table_for(connection)
+        table.act(False)
+        return {'state': table.state()}
+
+    def table_state(self, connection, request):
+        """Returns the connection's table without changing it."""
+
+        return {'state': self.table_for(connection).state()}
+
+    def leave(self, connection, request=None):
+        """Closes the connection's table, if it has one."""
+
+        table = connection.table
+        if table is not None:
+            table.cancel_timer()
+            del self.tables[table.id]
+            connection.table = None
+        return {}
+
+async def serve(args):
+    """Runs the server until it is interrupted."""
+
+    policy = Policy.load(args.policy) if args.policy else None
+    server = TableServer(args.players, args.seed, policy, args.timeout)
+    await server.start(args.host, args.port, args.unix)
+    print(f"Serving tables on {server.address}")
+    async with server.server:
+        await server.server.serve_forever()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Host a blackjack table for every client, with a JSON request per line.")
+    parser.add_argument('--host', default='127.0.0.1', help="address to listen on")
+    parser.add_argument('--port', type=int, default=8765, help="TCP port to listen on")
+    parser.add_argument('--unix', default=None, metavar='PATH', help="listen on a Unix socket instead of TCP")
+    parser.add_argument('--players', type=int, default=3, help="players per table when a client does not ask")
+    parser.add_argument('--seed', type=int, default=None, help="seed for reproducible tables")
+    parser.add_argument('--policy', default=None, help="policy JSON file the opponents play by")
+    parser.add_argument('--timeout', type=float, default=TURN_TIMEOUT, help="seconds to act before standing automatically")
+    try:
+        asyncio.run(serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
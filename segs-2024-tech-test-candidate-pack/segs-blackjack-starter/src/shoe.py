@@ -0,0 +1,51 @@
+from .deck import Deck
+
+class Shoe(Deck):
+    def __init__(self, num_decks=6, penetration=0.75, rng=None):
+        """Initialise a shoe of several decks with a cut card at the given penetration."""
+        
+        # Casino shoes hold between 1 and 8 decks
+        if not 1 <= num_decks <= 8:
+            raise ValueError("A shoe holds between 1 and 8 decks")
+        if not 0 < penetration <= 1:
+            raise ValueError("Penetration must be above 0 and at most 1")
+        self.num_decks = num_decks
+        self.penetration = penetration
+        super().__init__(rng)
+
+        # Played cards wait here until the next reshuffle, so no card is ever rebuilt
+        self.discards = []
+        
+        # The cut card sits after this share of the shoe, counted as cards left to deal
+        self.cut_card = len(self.cards) - int(len(self.cards) * penetration)
+
+    def create_deck(self):
+        """Builds the shoe as one list holding every deck."""
+        
+        return [card for _ in range(self.num_decks) for card in Deck.create_deck(self)]
+
+    def needs_shuffle(self):
+        """True once the cut card has been reached."""
+        
+        return len(self.cards) <= self.cut_card
+
+    def discard(self, cards):
+        """Puts played cards on the discard pile face down."""
+        
+        for card in cards:
+            card.face_up = False
+        self.discards.extend(cards)
+
+    def reshuffle(self):
+        """Returns the discards to the shoe and shuffles it in place."""
+        
+        self.cards.extend(self.discards)
+        self.discards.clear()
+        self.shuffle()
+
+    def draw_card(self):
+        """Draw a card from the shoe, reshuffling the discards in if it runs out mid-round."""
+        
+        if not self.cards and self.discards:
+            self.reshuffle()
+        return super().draw_card()
@@ -0,0 +1,218 @@
+import functools
+import random
+import struct
+
+from .card import Card, SUITS, RANKS
+from .compact import CARD_IDS
+
+# Snapshot header, magic then format version
+MAGIC = b'BJSS'
+VERSION = 1
+
+# Table state: flags, seat count, turn and ring positions, turns completed, round seed,
+# then how many cards are in the deck and discards, how many winners and the outcome's length
+HEADER = struct.Struct('<4sBBHHHHHIQHHHH')
+
+# Header flags
+GAME_OVER = 1
+SHOE = 2
+
+# Seat statuses, stored as their index
+STATUSES = ('playing', 'stood', 'busted')
+
+# A card is its id, with the top bit set when it is face up
+FACE_UP = 0x80
+CARD_ARGS = {card | face: (SUITS[card // 13], RANKS[card % 13], bool(face)) for card in range(52) for face in (0, FACE_UP)}
+CARD_BYTES = bytes(CARD_ARGS)
+
+# Random stream: backend, seed and children spawned, then the generator state
+STREAM = struct.Struct('<BQI')
+PYTHON_STATE = struct.Struct('<625I')
+GAUSS = struct.Struct('<?d')
+NUMPY_STATE = struct.Struct('<QQQQBI')
+BACKENDS = ('python', 'numpy')
+
+# Generator states kept unpacked, as search restores the same snapshot many times over
+STATE_CACHE_SIZE = 64
+
+def pack_cards(cards):
+    """Packs cards into one byte each."""
+
+    return bytes([CARD_IDS[(card.rank, card.suit)] | (FACE_UP if card.face_up else 0) for card in cards])
+
+def unpack_cards(data):
+    """Builds new card objects from packed bytes."""
+
+    return [Card(*CARD_ARGS[byte]) for byte in data]
+
+@functools.lru_cache(maxsize=STATE_CACHE_SIZE)
+def python_state(data):
+    """Unpacks the words of a Python generator state."""
+
+    return PYTHON_STATE.unpack(data)
+
+def stream_size(data, offset):
+    """Returns the packed size of the random stream at offset, from its backend, checking its state can be restored."""
+
+    if len(data) < offset + STREAM.size or data[offset] >= len(BACKENDS):
+        raise ValueError("The snapshot is truncated")
+    if BACKENDS[data[offset]] == 'numpy':
+        return STREAM.size + NUMPY_STATE.size
+
+    # The last word of a Python generator state is its position in the other 624
+    position = offset + STREAM.size + PYTHON_STATE.size - 4
+    if len(data) >= position + 4 and struct.unpack_from('<I', data, position)[0] > 624:
+        raise ValueError("The snapshot is corrupt")
+    return STREAM.size + PYTHON_STATE.size + GAUSS.size
+
+def pack_stream(stream):
+    """Packs a RandomStream's seed, spawn count and generator state."""
+
+    header = STREAM.pack(BACKENDS.index(stream.backend), stream.seed, stream.spawned)
+    if stream.backend == 'numpy':
+        # Only NumPy's default PCG64 generator is supported, its state is two 128-bit numbers
+        state = stream.generator.bit_generator.state
+        if state['bit_generator'] != 'PCG64':
+            raise ValueError(f"Cannot snapshot a {state['bit_generator']} generator")
+        value, increment = state['state']['state'], state['state']['inc']
+        return header + NUMPY_STATE.pack(value >> 64, value & (2 ** 64 - 1), increment >> 64, increment & (2 ** 64 - 1),
+                                         state['has_uint32'], state['uinteger'])
+    _, words, gauss = stream.generator.getstate()
+    return header + PYTHON_STATE.pack(*words) + GAUSS.pack(gauss is not None, gauss or 0.0)
+
+def unpack_stream(stream, data, offset):
+    """Restores a RandomStream in place from packed data at offset, returning the offset after it."""
+
+    backend, stream.seed, stream.spawned = STREAM.unpack_from(data, offset)
+    offset += STREAM.size
+    backend = BACKENDS[backend]
+    if backend == 'numpy':
+        value_high, value_low, increment_high, increment_low, has_uint32, uinteger = NUMPY_STATE.unpack_from(data, offset)
+        if stream.backend != 'numpy':
+            import numpy as np
+            stream.generator = np.random.default_rng()
+        stream.generator.bit_generator.state = {
+            'bit_generator': 'PCG64',
+            'state': {'state': value_high << 64 | value_low, 'inc': increment_high << 64 | increment_low},
+            'has_uint32': has_uint32,
+            'uinteger': uinteger,
+        }
+        stream.backend = backend
+        return offset + NUMPY_STATE.size
+    words = python_state(bytes(data[offset:offset + PYTHON_STATE.size]))
+    offset += PYTHON_STATE.size
+    has_gauss, gauss = GAUSS.unpack_from(data, offset)
+    if stream.backend != 'python':
+        stream.generator = random.Random()
+    stream.generator.setstate((3, words, gauss if has_gauss else None))
+    stream.backend = backend
+    return offset + GAUSS.size
+
+def pack_table(engine):
+    """Packs a table's round into bytes: the deck, every hand and status, the turn order and both random streams.
+
+    Rules, the policy and the shoe's size are settings rather than state, so
+    a snapshot restores onto an engine set up the same way.
+    """
+
+    seats = engine.seats
+    count = len(seats)
+    shoe = engine.shoe is not None
+    discards = engine.shoe.discards if shoe else []
+    outcome = (engine.outcome or '').encode()
+    winners = [seat for seat, player in enumerate(seats) if player in engine.winners]
+    flags = (GAME_OVER if engine.game_over else 0) | (SHOE if shoe else 0)
+
+    parts = [
+        HEADER.pack(MAGIC, VERSION, flags, count, engine.turn_index, engine.next_index, engine.ring_head,
+                    engine.seats_left, engine.turns_completed, engine.round_seed,
+                    len(engine.deck.cards), len(discards), len(winners), len(outcome)),
+        bytes([STATUSES.index(player.status) for player in seats]),
+        bytes([len(player.hand.cards) for player in seats]),
+        struct.pack(f'<{count}H{count}H{len(winners)}H', *engine.next_seat, *engine.prev_seat, *winners),
+        bytes(engine.in_ring),
+        pack_cards(engine.deck.cards),
+        pack_cards(discards),
+    ]
+    parts.extend(pack_cards(player.hand.cards) for player in seats)
+    parts.append(outcome)
+    parts.append(pack_stream(engine.rng))
+    parts.append(pack_stream(engine.round_rng))
+    return b''.join(parts)
+
+def unpack_table(engine, data):
+    """Restores a table's round from snapshot bytes, reusing the engine's players and random streams."""
+
+    if len(data) < HEADER.size:
+        raise ValueError("Not a table snapshot")
+    magic, version, flags, count, turn_index, next_index, ring_head, seats_left, turns_completed, round_seed, \
+        deck_size, discard_size, winner_count, outcome_size = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Not a table snapshot")
+    if version != VERSION:
+        raise ValueError(f"Snapshot version {version} is not supported")
+    if count != len(engine.seats):
+        raise ValueError(f"The snapshot has {count} seats, not {len(engine.seats)}")
+    if bool(flags & SHOE) != (engine.shoe is not None):
+        raise ValueError("The snapshot and the table must both deal from a shoe or both from a single deck")
+
+    # Check every section is there before the table is changed
+    end = HEADER.size + 7 * count + 2 * winner_count
+    if len(data) < end:
+        raise ValueError("The snapshot is truncated")
+    end += deck_size + discard_size + sum(data[HEADER.size + count:HEADER.size + 2 * count]) + outcome_size
+    end += stream_size(data, end)
+    end += stream_size(data, end)
+    if len(data) < end:
+        raise ValueError("The snapshot is truncated")
+
+    # Seats and turn order
+    offset = HEADER.size
+    statuses = data[offset:offset + count]
+    sizes = data[offset + count:offset + 2 * count]
+    offset += 2 * count
+    ring = struct.unpack_from(f'<{count}H{count}H{winner_count}H', data, offset)
+    offset += 2 * (2 * count + winner_count)
+    in_ring = data[offset:offset + count]
+    offset += count
+
+    # Check every index, status and card is in range, and the outcome is text, before the table is changed
+    cards_end = offset + deck_size + discard_size + sum(sizes)
+    if (max(turn_index, next_index, ring_head, *ring) >= count or seats_left > count
+            or max(statuses) >= len(STATUSES) or data[offset:cards_end].translate(None, CARD_BYTES)):
+        raise ValueError("The snapshot is corrupt")
+    game_over = bool(flags & GAME_OVER)
+    outcome = data[cards_end:cards_end + outcome_size].decode() if game_over else None
+
+    engine.turn_index = turn_index
+    engine.next_index = next_index
+    engine.ring_head = ring_head
+    engine.seats_left = seats_left
+    engine.turns_completed = turns_completed
+    engine.next_seat = list(ring[:count])
+    engine.prev_seat = list(ring[count:2 * count])
+    engine.in_ring = [bool(seat) for seat in in_ring]
+    engine.winners = [engine.seats[seat] for seat in ring[2 * count:]]
+
+    # Cards, the deck and discards first and then each hand
+    cards = unpack_cards(data[offset:offset + deck_size])
+    offset += deck_size
+    if engine.shoe is not None:
+        engine.shoe.discards = unpack_cards(data[offset:offset + discard_size])
+    offset += discard_size
+    engine.deck.cards = cards
+    for player, status, size in zip(engine.seats, statuses, sizes):
+        player.hand.cards = unpack_cards(data[offset:offset + size])
+        player.status = STATUSES[status]
+        offset += size
+
+    engine.game_over = game_over
+    engine.outcome = outcome
+    offset += outcome_size
+
+    # Random streams, the round's stream is the one the deck shuffles with
+    offset = unpack_stream(engine.rng, data, offset)
+    offset = unpack_stream(engine.round_rng, data, offset)
+    engine.round_seed = round_seed
+    engine.deck.rng = engine.round_rng
+    return offset
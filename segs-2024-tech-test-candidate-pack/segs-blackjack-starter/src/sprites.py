@@ -0,0 +1,60 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class SpriteCache:
+    def __init__(self, max_size=256):
+        """Initialise an empty cache of scaled and rotated card surfaces."""
+
+        # Variants are kept in least recently used order, bounded by max_size
+        # 256 covers every face and the card back in all three hand layouts
+        self.max_size = max_size
+        self.variants = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, image, size, rotation=0):
+        """Returns the image rotated by the given angle and then scaled to size."""
+
+        # Surfaces hash by identity, so shared atlas surfaces make stable keys
+        key = (image, size, rotation)
+        variant = self.variants.get(key)
+        if variant is not None:
+            self.hits += 1
+            self.variants.move_to_end(key)
+            return variant
+
+        # Produce the variant once and evict the least recently used if full
+        self.misses += 1
+        variant = pygame.transform.rotate(image, rotation) if rotation else image
+        variant = pygame.transform.scale(variant, size)
+        self.variants[key] = variant
+        while len(self.variants) > self.max_size:
+            self.variants.popitem(last=False)
+        return variant
+
+    def get_chain(self, image, steps):
+        """Applies a sequence of (size, rotation) steps, caching every stage."""
+
+        for size, rotation in steps:
+            image = self.get(image, size, rotation)
+        return image
+
+    def warm(self, images, chains):
+        """Pre-builds every variant of the given images for each transform chain."""
+
+        for image in images:
+            for steps in chains:
+                self.get_chain(image, steps)
+
+    def clear(self):
+        """Drops every cached variant and resets the counters."""
+
+        self.variants.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Process-wide sprite cache shared by hands and animations
+sprite_cache = SpriteCache()
@@ -0,0 +1,155 @@
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+
+from .card import RANK_VALUES
+from .odds import hit_ev, hand_value, stand_evs
+from .policy import Policy, default_policy
+
+# Charts are cached here, one JSON file per rule configuration hash
+CACHE_DIR = os.path.join(os.path.dirname(__file__), '..', '.cache', 'strategy')
+
+# Bumped whenever the generator changes, so old cached charts are not reused
+CHART_VERSION = 1
+
+# Chart columns are the other seats' visible card, 2 to 10 then the ace
+UP_CARDS = (2, 3, 4, 5, 6, 7, 8, 9, 10, 1)
+
+# Chart rows, hard totals from two cards and soft totals with an ace counting 11
+HARD_TOTALS = range(4, 22)
+SOFT_TOTALS = range(12, 22)
+
+def rule_config(num_decks=1, num_seats=3, policy=default_policy):
+    """Returns the rule configuration a chart is generated for, as plain data."""
+
+    return {
+        'version': CHART_VERSION,
+        'format': 'no dealer, highest valid hand wins',
+        'decks': num_decks,
+        'seats': num_seats,
+        'policy': {'sides': policy.sides, 'table': [list(row) for row in policy.table]},
+    }
+
+def config_hash(config):
+    """Returns a stable hash of a rule configuration, used to name its cached chart."""
+
+    return hashlib.sha256(json.dumps(config, sort_keys=True).encode()).hexdigest()[:16]
+
+def stand_results(up, counts, others, policy):
+    """Returns the expected result of standing on each value from 0 to 21 against other seats each showing up.
+
+    The other seats are treated as independent and played out by policy from
+    their visible card.
+    """
+
+    return stand_evs(((up, up == 1, True),) * others if others else None, counts, policy)
+
+class StrategyChart:
+    def __init__(self, config, hard, soft):
+        """Initialise a chart of 'H' to hit or 'S' to stand, one string per total with a letter per up card."""
+
+        self.config = config
+        self.hard = hard
+        self.soft = soft
+
+    @classmethod
+    def generate(cls, num_decks=1, num_seats=3, policy=default_policy):
+        """Works out the chart with dynamic programming over the deck composition, no simulation.
+
+        For each up card the other seats' final totals and the player's hit
+        results come from the memoized recursions in src/odds.py, starting from
+        a full shoe with the other seats' visible cards removed.
+        """
+
+        config = rule_config(num_decks, num_seats, policy)
+        others = num_seats - 1
+        hard = {total: '' for total in HARD_TOTALS}
+        soft = {total: '' for total in SOFT_TOTALS}
+        for up in UP_CARDS:
+            counts = [4 * num_decks] * 9 + [16 * num_decks]
+            counts[up - 1] -= others
+            counts = tuple(counts)
+            stands = stand_results(up, counts, others, policy)
+
+            # Hit whenever it has the better expected result than standing
+            for total in HARD_TOTALS:
+                hard[total] += 'H' if hit_ev(total, False, counts, stands) > stands[total] else 'S'
+            for total in SOFT_TOTALS:
+                soft[total] += 'H' if hit_ev(total - 10, True, counts, stands) > stands[total] else 'S'
+        return cls(config, hard, soft)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Builds a chart from the data written by to_dict."""
+
+        return cls(data['config'], {int(total): row for total, row in data['hard'].items()},
+                   {int(total): row for total, row in data['soft'].items()})
+
+    def to_dict(self):
+        """Returns the chart as JSON-ready data."""
+
+        return {'config': self.config, 'hard': {str(total): row for total, row in self.hard.items()},
+                'soft': {str(total): row for total, row in self.soft.items()}}
+
+    def action(self, hard_total, ace, up):
+        """Returns 'H' or 'S' for a hand against a visible card value, aces being 1."""
+
+        column = UP_CARDS.index(up)
+        value = hand_value(hard_total, ace)
+        if value > 21:
+            return 'S'
+        if value != hard_total:
+            return self.soft[value][column]
+        return self.hard[max(value, HARD_TOTALS[0])][column]
+
+    def player_policy(self, engine):
+        """Returns a player policy for GameEngine.play_round that follows the chart.
+
+        The column is the highest first card showing among the other seats,
+        counting the ace highest.
+        """
+
+        def policy(player):
+            shown = [other.hand.cards[0] for other in engine.players() if other is not player and other.hand.cards]
+            values = [RANK_VALUES[card.rank] for card in shown]
+            up = max(values, key=lambda value: 11 if value == 1 else value) if values else 10
+            return self.action(player.hand.hard_total, player.hand.aces > 0, up) == 'H'
+        return policy
+
+    def __str__(self):
+        """Formats the chart as a table of totals against up cards."""
+
+        header = 'Total ' + ' '.join(f"{'A' if up == 1 else up:>2}" for up in UP_CARDS)
+        lines = [header]
+        lines += [f"{'H' + str(total):>5} " + ' '.join(f"{action:>2}" for action in row) for total, row in self.hard.items()]
+        lines += [f"{'S' + str(total):>5} " + ' '.join(f"{action:>2}" for action in row) for total, row in self.soft.items()]
+        return '\n'.join(lines)
+
+def load_chart(num_decks=1, num_seats=3, policy=default_policy, cache_dir=CACHE_DIR):
+    """Returns the chart for a rule configuration, reading it from the disk cache or generating and caching it."""
+
+    path = os.path.join(cache_dir, f"{config_hash(rule_config(num_decks, num_seats, policy))}.json")
+    if os.path.exists(path):
+        with open(path) as file:
+            return StrategyChart.from_dict(json.load(file))
+
+    # Written to a temporary file first, so readers never see half a chart
+    chart = StrategyChart.generate(num_decks, num_seats, policy)
+    os.makedirs(cache_dir, exist_ok=True)
+    handle, temporary = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    with os.fdopen(handle, 'w') as file:
+        json.dump(chart.to_dict(), file)
+    os.replace(temporary, path)
+    return chart
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Print the hit or stand chart for a rule configuration, generating it if it is not cached.")
+    parser.add_argument('--decks', type=int, default=1, help="number of decks in the shoe")
+    parser.add_argument('--seats', type=int, default=3, help="number of seats at the table")
+    parser.add_argument('--policy', default=None, help="policy JSON file the other seats play by")
+    args = parser.parse_args()
+
+    policy = Policy.load(args.policy) if args.policy else default_policy
+    print(load_chart(args.decks, args.seats, policy))
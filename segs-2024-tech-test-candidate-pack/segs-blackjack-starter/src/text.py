@@ -0,0 +1,45 @@
+from collections import OrderedDict
+
+import pygame
+
+from .profiler import profiler
+
+class TextRenderer:
+    def __init__(self, max_size=128):
+        """Initialise the font store and a cache of rendered text surfaces."""
+
+        # Fonts are created once, rendered text is kept in least recently used order
+        self.fonts = {}
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, size, name=None, sysfont=False):
+        """Returns the font for a size, creating it or looking it up in the system fonts once."""
+
+        key = (name, size, sysfont)
+        font = self.fonts.get(key)
+        if font is None:
+            with profiler.section('font creation'):
+                font = pygame.font.SysFont(name, size) if sysfont else pygame.font.Font(name, size)
+            self.fonts[key] = font
+        return font
+
+    def render(self, text, size, colour, name=None, sysfont=False):
+        """Returns an antialiased surface for the text, only rendering it the first time."""
+
+        key = (name, size, sysfont, text, colour)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        # Render once and evict the least recently used text if full
+        self.misses += 1
+        surface = self.font(size, name, sysfont).render(text, True, colour)
+        self.surfaces[key] = surface
+        while len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
@@ -0,0 +1,125 @@
+import time
+
+# Redraw rate while something is moving on screen
+FRAME_INTERVAL = 1 / 60
+
+class Tween:
+    def __init__(self, begin, duration, start=None, end=None, on_finish=None):
+        """Initialise an animation from start to end over duration seconds, beginning at time begin.
+
+        start and end are tuples of numbers such as positions, or None for a tween
+        that only holds something on screen for a while, like a banner.
+        """
+
+        self.begin = begin
+        self.duration = duration
+        self.finish = begin + duration
+        self.start = start
+        self.end = end
+        self.on_finish = on_finish
+
+    def started(self, now):
+        """True once the tween has begun."""
+
+        return now >= self.begin
+
+    def moving(self):
+        """True when the tween changes what is drawn every frame."""
+
+        return self.start is not None and self.start != self.end
+
+    def value(self, now):
+        """Returns the interpolated value at the given time."""
+
+        if self.start is None:
+            return None
+        progress = min(max((now - self.begin) / self.duration, 0), 1) if self.duration > 0 else 1
+        return tuple(a + (b - a) * progress for a, b in zip(self.start, self.end))
+
+class Timeline:
+    def __init__(self, clock=time.monotonic):
+        """Initialise an empty timeline of tweens measured with the given clock in seconds."""
+
+        # Tweens in the order they were added, when the last one queued finishes, and how many times it was cleared
+        self.clock = clock
+        self.tweens = []
+        self.end = 0.0
+        self.generation = 0
+
+    @property
+    def idle(self):
+        """True when nothing is queued or playing."""
+
+        return not self.tweens
+
+    def add(self, duration, start=None, end=None, on_finish=None, at=None):
+        """Queues a tween and returns it.
+
+        By default the tween begins once everything already queued has finished,
+        so actions play back in order. Passing at begins it at that time instead,
+        which lets tweens overlap.
+        """
+
+        now = self.clock()
+        begin = max(now, self.end if at is None else at)
+        tween = Tween(begin, duration, start, end, on_finish)
+        self.tweens.append(tween)
+        self.end = max(self.end, tween.finish)
+        return tween
+
+    def clear(self):
+        """Drops every queued tween without running their callbacks."""
+
+        self.tweens = []
+        self.end = 0.0
+        self.generation += 1
+
+    def finish(self):
+        """Finishes every queued tween straight away, running their callbacks in order, to skip to the final state."""
+
+        generation = self.generation
+        while self.tweens:
+            finished = sorted(self.tweens, key=lambda tween: tween.finish)
+            self.tweens = []
+            self.end = self.clock()
+            for tween in finished:
+                if self.generation != generation:
+                    return
+                if tween.on_finish is not None:
+                    tween.on_finish()
+
+    def active(self):
+        """Returns the tweens that have begun and not yet finished."""
+
+        now = self.clock()
+        return [tween for tween in self.tweens if tween.started(now)]
+
+    def timeout(self):
+        """Returns the seconds until the timeline next needs a frame, or None when it is idle."""
+
+        if not self.tweens:
+            return None
+
+        # Moving tweens need a frame every interval, otherwise wake when a tween begins or ends
+        now = self.clock()
+        wake = min(tween.begin if tween.begin > now else tween.finish for tween in self.tweens)
+        if any(tween.moving() and tween.started(now) for tween in self.tweens):
+            wake = min(wake, now + FRAME_INTERVAL)
+        return max(wake - now, 0)
+
+    def update(self):
+        """Removes finished tweens and runs their callbacks in the order they finished."""
+
+        now = self.clock()
+        finished = [tween for tween in self.tweens if tween.finish <= now]
+        if not finished:
+            return
+        self.tweens = [tween for tween in self.tweens if tween.finish > now]
+
+        # Callbacks may queue more tweens, or clear the timeline for a new round
+        generation = self.generation
+        for tween in sorted(finished, key=lambda tween: tween.finish):
+            if self.generation != generation:
+                return
+            if tween.on_finish is not None:
+                tween.on_finish()
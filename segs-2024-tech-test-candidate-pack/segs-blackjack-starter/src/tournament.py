@@ -0,0 +1,83 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .engine import GameEngine, OUTCOMES
+from .policy import Policy, default_policy
+from .rng import RandomStream
+from .shoe import Shoe
+from .strategy import load_chart
+
+def run_chunk(seed, rounds, num_decks=None, policy=None, chart=None, num_seats=3):
+    """Plays a chunk of rounds on one headless table and returns outcome counts per seat.
+
+    With a StrategyChart the first seat plays by the chart instead of the policy.
+    Only the counters go back to the parent process, never the rounds themselves.
+    """
+
+    shoe = Shoe(num_decks) if num_decks else None
+    engine = GameEngine(num_seats, shoe=shoe, rng=RandomStream(seed), policy=policy)
+    counts = [[0] * len(OUTCOMES) for _ in engine.players()]
+    index = {outcome: position for position, outcome in enumerate(OUTCOMES)}
+    player_policy = chart.player_policy(engine) if chart is not None else None
+
+    for _ in range(rounds):
+        engine.reset_round()
+        engine.play_round(player_policy)
+        for seat, result in enumerate(engine.seat_results()):
+            counts[seat][index[result]] += 1
+    return counts
+
+def run_tournament(rounds, workers=None, chunk_size=20_000, seed=None, num_decks=None, policy=None, basic_strategy=False,
+                   num_seats=3):
+    """Shards rounds of the game at a table of num_seats across processes and merges the per-seat counts.
+
+    Each chunk gets its own seed spawned from the tournament seed, so results
+    are the same for a given seed whatever the number of workers. With
+    basic_strategy the first seat plays the strategy chart for the rules, which
+    is loaded from the chart cache once and shared with every worker.
+    """
+
+    if rounds < 1:
+        raise ValueError("A tournament needs at least one round")
+    chart = load_chart(num_decks or 1, num_seats, policy or default_policy) if basic_strategy else None
+    stream = RandomStream(seed)
+    sizes = [min(chunk_size, rounds - start) for start in range(0, rounds, chunk_size)]
+    seeds = [child.seed for child in stream.spawn(len(sizes))]
+
+    # Merge counters as chunks complete
+    totals = [[0] * len(OUTCOMES) for _ in range(num_seats)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for counts in pool.map(run_chunk, seeds, sizes, [num_decks] * len(sizes), [policy] * len(sizes), [chart] * len(sizes),
+                               [num_seats] * len(sizes)):
+            for seat, seat_counts in enumerate(counts):
+                for position, count in enumerate(seat_counts):
+                    totals[seat][position] += count
+
+    counts = [dict(zip(OUTCOMES, seat_counts)) for seat_counts in totals]
+    rates = [{outcome: count / rounds for outcome, count in seat_counts.items()} for seat_counts in counts]
+    return {'rounds': rounds, 'seed': stream.seed, 'counts': counts, 'rates': rates}
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Play many headless rounds of the table game across all cores.")
+    parser.add_argument('--rounds', type=int, default=1_000_000, help="number of rounds to play")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument('--chunk-size', type=int, default=20_000, help="rounds per work unit")
+    parser.add_argument('--seed', type=int, default=None, help="seed for a reproducible tournament")
+    parser.add_argument('--seats', type=int, default=3, help="number of seats at the table, large tables need --decks")
+    parser.add_argument('--decks', type=int, default=None, help="deal from a shoe of this many decks")
+    parser.add_argument('--policy', default=None, help="policy JSON file the seats play by")
+    parser.add_argument('--basic-strategy', action='store_true', help="the first seat plays the strategy chart for these rules")
+    args = parser.parse_args()
+
+    policy = Policy.load(args.policy) if args.policy else None
+    start = time.perf_counter()
+    result = run_tournament(args.rounds, args.workers, args.chunk_size, args.seed, args.decks, policy, args.basic_strategy,
+                            args.seats)
+    elapsed = time.perf_counter() - start
+
+    print(f"{result['rounds']} rounds in {elapsed:.1f}s ({result['rounds'] / elapsed:,.0f} rounds/s), seed {result['seed']}")
+    for seat, rates in enumerate(result['rates']):
+        summary = ', '.join(f"{outcome} {rate:.2%}" for outcome, rate in rates.items())
+        print(f"Player {seat + 1}: {summary}")
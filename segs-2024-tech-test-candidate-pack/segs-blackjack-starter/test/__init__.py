@@ -0,0 +1,4 @@
+import os
+
+# Tests render offscreen with the dummy video driver, so they run with no display
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
@@ -0,0 +1,117 @@
+import unittest
+import pygame
+
+from src.atlas import CardAtlas
+from src.card import Card
+from src.sprites import SpriteCache
+from src.text import TextRenderer
+
+class TestCardAtlas(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a fresh atlas for each test."""
+        self.atlas = CardAtlas(max_size=3)
+
+    def test_surface_is_decoded_once(self):
+        """Test that repeated lookups return the same shared surface."""
+
+        first = self.atlas.get('King', 'Hearts', True)
+        second = self.atlas.get('King', 'Hearts', True)
+
+        self.assertIs(first, second, "The atlas should hand out the same surface for the same card.")
+        self.assertEqual(self.atlas.misses, 1, "The card should only be decoded once.")
+        self.assertEqual(self.atlas.hits, 1, "The second lookup should be a cache hit.")
+
+    def test_card_backs_share_one_surface(self):
+        """Test that every face down card uses the same card back surface."""
+
+        back_one = self.atlas.get('2', 'Clubs', False)
+        back_two = self.atlas.get('Ace', 'Spades', False)
+
+        self.assertIs(back_one, back_two, "All face down cards should share the card back.")
+        self.assertEqual(self.atlas.stats()['size'], 1, "Only the card back should be cached.")
+
+    def test_least_recently_used_is_evicted(self):
+        """Test that the atlas stays bounded and evicts the least recently used surface."""
+
+        for rank in ['2', '3', '4']:
+            self.atlas.get(rank, 'Hearts', True)
+        self.atlas.get('2', 'Hearts', True)  # Mark the 2 as recently used
+        self.atlas.get('5', 'Hearts', True)
+
+        self.assertEqual(len(self.atlas.surfaces), 3, "The atlas should never exceed its maximum size.")
+        self.assertNotIn(('3', 'Hearts', True), self.atlas.surfaces, "The least recently used card should be evicted.")
+        self.assertIn(('2', 'Hearts', True), self.atlas.surfaces, "A recently used card should be kept.")
+        self.assertEqual(self.atlas.evictions, 1)
+
+    def test_card_get_image_uses_atlas(self):
+        """Test that a card image is a pygame surface served by the shared atlas."""
+
+        card = Card('Spades', 'Queen', True)
+        self.assertIsInstance(card.get_image(), pygame.Surface)
+        self.assertIs(card.get_image(), card.get_image(), "Card images should be shared between calls.")
+
+class TestSpriteCache(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a fresh sprite cache and a plain source surface."""
+        self.cache = SpriteCache(max_size=4)
+        self.image = pygame.Surface((100, 120))
+
+    def test_variant_is_built_once(self):
+        """Test that a scaled variant is produced once and reused."""
+
+        first = self.cache.get(self.image, (175, 210))
+        second = self.cache.get(self.image, (175, 210))
+
+        self.assertIs(first, second, "The same variant should be returned from the cache.")
+        self.assertEqual(first.get_size(), (175, 210), "The variant should be scaled to the target size.")
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_rotation_is_part_of_the_key(self):
+        """Test that rotated variants are cached separately and rotate before scaling."""
+
+        upright = self.cache.get(self.image, (157, 157))
+        rotated = self.cache.get(self.image, (157, 157), 90)
+
+        self.assertIsNot(upright, rotated, "Rotated variants should not share the upright entry.")
+        self.assertEqual(rotated.get_size(), (157, 157), "Rotated variants should still be scaled to the target size.")
+
+    def test_warm_builds_every_chain(self):
+        """Test that warming pre-builds every stage of each transform chain."""
+
+        self.cache.warm([self.image], [(((175, 210), 0), ((157, 157), 90))])
+
+        self.assertEqual(self.cache.misses, 2, "Both stages of the chain should be built while warming.")
+        self.cache.get_chain(self.image, (((175, 210), 0), ((157, 157), 90)))
+        self.assertEqual(self.cache.misses, 2, "Drawing after warming should not build any new variants.")
+
+class TestTextRenderer(unittest.TestCase):
+
+    def setUp(self):
+        """Set up pygame fonts and a fresh text renderer."""
+        pygame.font.init()
+        self.text = TextRenderer(max_size=2)
+
+    def test_same_text_is_rendered_once(self):
+        """Test that identical labels share one rendered surface and one font."""
+
+        first = self.text.render("Player 2 Hand Value: 17", 36, (255, 255, 255))
+        second = self.text.render("Player 2 Hand Value: 17", 36, (255, 255, 255))
+
+        self.assertIs(first, second, "Identical text should not be rendered twice.")
+        self.assertEqual(len(self.text.fonts), 1, "The font should only be created once.")
+        self.assertEqual((self.text.hits, self.text.misses), (1, 1))
+
+    def test_changed_value_renders_new_text(self):
+        """Test that a new value renders new text and old text is evicted when full."""
+
+        for value in (17, 18, 19):
+            self.text.render(f"Hand Value: {value}", 36, (255, 255, 255))
+
+        self.assertEqual(self.text.misses, 3, "Each new value should be rendered.")
+        self.assertEqual(len(self.text.surfaces), 2, "The cache should stay within its maximum size.")
+        self.assertEqual(len(self.text.fonts), 1, "All labels should share one font.")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+
+from benchmarks.harness import Benchmark, compare, measure
+
+class TestBenchmarkHarness(unittest.TestCase):
+
+    def test_measure_reports_time_per_unit(self):
+        """Test that a benchmark is timed per unit of work and called at least once per repeat."""
+
+        calls = []
+        bench = Benchmark('test', 'micro', lambda: lambda: calls.append(None), per=4, unit='card')
+        result = measure(bench, repeat=3, min_time=0.001)
+
+        self.assertGreaterEqual(len(calls), 3 * result['calls'])
+        self.assertEqual(result['unit'], 'card')
+        self.assertLessEqual(result['min'], result['mean'])
+        self.assertAlmostEqual(result['per_second'], 1 / result['min'])
+
+    def test_compare_flags_slowdowns_over_threshold(self):
+        """Test that only benchmarks slower than the baseline by more than the threshold regress."""
+
+        baseline = {'fast': {'min': 1.0}, 'slow': {'min': 1.0}, 'removed': {'min': 1.0}}
+        results = {'fast': {'min': 1.05}, 'slow': {'min': 1.5}, 'added': {'min': 1.0}}
+        comparison = {name: (ratio, regressed) for name, ratio, regressed in compare(results, baseline, 0.1)}
+
+        self.assertEqual(set(comparison), {'fast', 'slow'})
+        self.assertFalse(comparison['fast'][1])
+        self.assertTrue(comparison['slow'][1])
+        self.assertAlmostEqual(comparison['slow'][0], 1.5)
+
+if __name__ == '__main__':
+    unittest.main()
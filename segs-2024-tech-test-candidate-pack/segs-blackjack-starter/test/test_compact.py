@@ -0,0 +1,50 @@
+import unittest
+
+from src.compact import CompactDeck, CompactHand, CARD_IDS, card_id, to_card
+from src.deck import Deck
+from src.hand import Hand
+
+class TestCompactCards(unittest.TestCase):
+
+    def test_ids_round_trip(self):
+        """Test that every card converts to an id and back to the same card."""
+
+        for index, card in enumerate(Deck().cards):
+            self.assertEqual(card_id(card), index, "Ids should follow the deck order.")
+            rebuilt = to_card(index)
+            self.assertEqual((rebuilt.rank, rebuilt.suit), (card.rank, card.suit))
+
+    def test_deck_draws_every_card_once(self):
+        """Test that a shuffled compact deck deals all 52 ids exactly once."""
+
+        deck = CompactDeck()
+        deck.shuffle()
+        drawn = [deck.draw_card() for _ in range(52)]
+
+        self.assertEqual(sorted(drawn), list(range(52)))
+        with self.assertRaises(ValueError):
+            deck.draw_card()
+
+    def test_hand_value_matches_card_objects(self):
+        """Test that compact hand values match hands of card objects."""
+
+        hands = [
+            [('Ace', 'Clubs'), ('King', 'Hearts')],  # 21
+            [('Ace', 'Clubs'), ('Ace', 'Hearts'), ('9', 'Spades')],  # 21
+            [('10', 'Clubs'), ('Jack', 'Hearts'), ('5', 'Spades')],  # 25
+            [('7', 'Clubs'), ('Ace', 'Hearts'), ('Ace', 'Spades')],  # 19
+            [('Ace', 'Clubs'), ('5', 'Hearts'), ('King', 'Spades')],  # 16, soft 16 turned hard
+            [('Ace', 'Clubs'), ('6', 'Hearts'), ('8', 'Spades')],  # 15
+            [('Ace', 'Clubs'), ('Ace', 'Hearts'), ('9', 'Spades'), ('King', 'Diamonds')],  # 21
+            [('Ace', 'Clubs'), ('7', 'Hearts'), ('Queen', 'Spades'), ('5', 'Diamonds')],  # 23
+        ]
+        for cards in hands:
+            compact = CompactHand()
+            hand = Hand()
+            for rank, suit in cards:
+                compact.add_card(CARD_IDS[(rank, suit)])
+                hand.add_card(to_card(CARD_IDS[(rank, suit)]))
+            self.assertEqual(compact.calculate_value(), hand.calculate_value(), f"Values should match for {hand}.")
+
+if __name__ == '__main__':
+    unittest.main()
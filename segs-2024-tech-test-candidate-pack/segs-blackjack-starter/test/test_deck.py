@@ -306,36 +306,38 @@ class TestBlackjackMultiGame(unittest.TestCase):
         # Test opponent 1
         self.game.turn = 'opponent_one'
         self.game.opponent_one.status = 'playing'
-        initial_opponent_one_hand_value = self.game.opponent_one.hand_value()
+        initial_opponent_one_hand = Hand()
+        initial_opponent_one_hand.cards = list(self.game.opponent_one.hand.cards)
 
         action_taken = simulate_opponent_turn(self.game.opponent_one)
-        new_opponent_one_hand_value = self.game.opponent_one.hand_value()
 
         # Validate the outcome for opponent 1
         if action_taken == "hit":
-            self.assertGreater(new_opponent_one_hand_value, initial_opponent_one_hand_value, 
+            # A soft ace may drop to 1, so the hard total is what always increases
+            self.assertGreater(self.game.opponent_one.hand.hard_total, initial_opponent_one_hand.hard_total, 
                                "Opponent 1 should have hit and increased hand value.")
             self.assertEqual(self.game.opponent_one.status, 'playing', "Opponent 1 should still be playing after hit.")
         else:
-            self.assertEqual(new_opponent_one_hand_value, initial_opponent_one_hand_value, 
+            self.assertEqual(self.game.opponent_one.hand_value(), initial_opponent_one_hand.value, 
                              "Opponent 1 should have stood and kept hand value.")
             self.assertEqual(self.game.opponent_one.status, 'stood', "Opponent 1 should have stood.")
 
         # Test opponent 2
         self.game.turn = 'opponent_two'
         self.game.opponent_two.status = 'playing'
-        initial_opponent_two_hand_value = self.game.opponent_two.hand_value()
+        initial_opponent_two_hand = Hand()
+        initial_opponent_two_hand.cards = list(self.game.opponent_two.hand.cards)
 
         action_taken = simulate_opponent_turn(self.game.opponent_two)
-        new_opponent_two_hand_value = self.game.opponent_two.hand_value()
 
         # Validate the outcome for opponent 2
         if action_taken == "hit":
-            self.assertGreater(new_opponent_two_hand_value, initial_opponent_two_hand_value, 
+            # A soft ace may drop to 1, so the hard total is what always increases
+            self.assertGreater(self.game.opponent_two.hand.hard_total, initial_opponent_two_hand.hard_total, 
                                "Opponent 2 should have hit and increased hand value.")
             self.assertEqual(self.game.opponent_two.status, 'playing', "Opponent 2 should still be playing after hit.")
         else:
-            self.assertEqual(new_opponent_two_hand_value, initial_opponent_two_hand_value, 
+            self.assertEqual(self.game.opponent_two.hand_value(), initial_opponent_two_hand.value, 
                              "Opponent 2 should have stood and kept hand value.")
             self.assertEqual(self.game.opponent_two.status, 'stood', "Opponent 2 should have stood.")
     
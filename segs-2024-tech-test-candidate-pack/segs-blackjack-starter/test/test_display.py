@@ -0,0 +1,73 @@
+import unittest
+
+import pygame
+
+from src.display import OffscreenTarget, frame_hash, parse_resolution
+from src.rng import RandomStream
+from blackjack import BlackjackGame
+
+# Hashes of the opening table for seed 1, recorded with this pygame version,
+# scaling and text rendering may differ slightly in others
+GOLDEN_PYGAME = '2.6.1'
+GOLDEN_HASHES = {
+    1: 'b8f67df136e07dcc5121ca3936cc05421308c35cb460597c1b9378f3cd0374d1',
+    3: '0e86b983fc0445b3cbdca6db32dcb04d79542dfce7dae5930e5811a645e47d84',
+}
+
+def opening_table(num_players, seed, target=None):
+    """Returns a seeded game drawn offscreen once its opening deal has landed."""
+
+    game = BlackjackGame(num_players, rng=RandomStream(seed), target=target or OffscreenTarget())
+    game.deal_initial_cards()
+    game.timeline.finish()
+    game.draw_screen()
+    return game
+
+class TestResolution(unittest.TestCase):
+
+    def test_parse_resolution(self):
+        """Test that resolutions are read as WIDTHxHEIGHT."""
+
+        self.assertEqual(parse_resolution('1600x900'), (1600, 900))
+        self.assertRaises(ValueError, parse_resolution, '1600')
+        self.assertRaises(ValueError, parse_resolution, '0x900')
+
+    def test_layout_follows_resolution(self):
+        """Test that the table is laid out for the target's resolution."""
+
+        game = BlackjackGame(3, target=OffscreenTarget((1600, 900)))
+
+        self.assertEqual(game.screen.get_size(), (1600, 900))
+        self.assertEqual(game.quit_button_rect.right, 1600)
+        self.assertEqual(game.stand_button_rect.bottom, 840)
+
+class TestOffscreenTarget(unittest.TestCase):
+
+    def test_frames_go_to_capture_hook(self):
+        """Test that each presented frame is handed to the hook with the areas that changed."""
+
+        captured = []
+        game = opening_table(3, 1, OffscreenTarget(on_frame=lambda surface, rects: captured.append((frame_hash(surface), rects))))
+
+        self.assertEqual(game.target.frames, 1)
+        self.assertEqual(captured[0][1], [game.screen.get_rect()], "The first frame should be drawn in full.")
+
+        game.draw_screen()
+        self.assertEqual(game.target.frames, 1, "A frame where nothing changed should not be presented.")
+
+    def test_same_seed_renders_same_pixels(self):
+        """Test that rendering is deterministic, so frames can be compared by hash."""
+
+        self.assertEqual(frame_hash(opening_table(3, 1).screen), frame_hash(opening_table(3, 1).screen))
+        self.assertNotEqual(frame_hash(opening_table(3, 1).screen), frame_hash(opening_table(3, 2).screen))
+
+    @unittest.skipUnless(pygame.version.ver == GOLDEN_PYGAME, "golden frames were recorded with pygame " + GOLDEN_PYGAME)
+    def test_opening_tables_match_golden_frames(self):
+        """Test that the opening tables are drawn pixel for pixel as recorded."""
+
+        for num_players, expected in GOLDEN_HASHES.items():
+            with self.subTest(num_players=num_players):
+                self.assertEqual(frame_hash(opening_table(num_players, 1).screen), expected)
+
+if __name__ == '__main__':
+    unittest.main()
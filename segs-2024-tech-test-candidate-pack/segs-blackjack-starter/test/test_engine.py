@@ -0,0 +1,149 @@
+import unittest
+from unittest.mock import patch
+
+from src.engine import GameEngine
+from src.card import Card
+from src.rng import RandomStream
+from src.shoe import Shoe
+
+class TestGameEngine(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a headless engine in multi-player mode."""
+        self.engine = GameEngine(3)
+
+    def test_engine_has_no_display(self):
+        """Test that the engine can be built without pygame being initialised."""
+
+        self.assertFalse(hasattr(self.engine, 'screen'), "The engine should not own a display surface.")
+        self.assertEqual(len(self.engine.deck.cards), 52, "The engine should start with a full deck.")
+
+    def test_play_round_single_player(self):
+        """Test that headless single-player rounds always finish with an outcome."""
+
+        engine = GameEngine(1)
+        for _ in range(200):
+            engine.reset_round()
+            engine.play_round()
+            self.assertTrue(engine.game_over, "Every round should finish.")
+            self.assertIsNotNone(engine.outcome, "Every finished round should have an outcome.")
+
+    def test_play_round_multi_player(self):
+        """Test that headless multi-player rounds finish with nobody left playing."""
+
+        for _ in range(200):
+            self.engine.reset_round()
+            winners = self.engine.play_round()
+            self.assertTrue(self.engine.game_over, "Every round should finish.")
+            self.assertTrue(all(p.status != 'playing' for p in self.engine.players()), "Nobody should still be playing.")
+            for winner in winners:
+                self.assertLessEqual(winner.hand_value(), 21, "Winners should never have busted.")
+
+    def test_highest_hand_wins(self):
+        """Test that the highest valid hand wins once everyone has finished."""
+
+        self.engine.player.hand.cards = [Card('Spades', '9'), Card('Hearts', '9')]  # 18
+        self.engine.opponent_one.hand.cards = [Card('Diamonds', '10'), Card('Clubs', '6')]  # 16
+        self.engine.opponent_two.hand.cards = [Card('Hearts', 'King'), Card('Spades', 'Queen'), Card('Clubs', '5')]  # 25
+        for player in self.engine.players():
+            player.status = 'stood'
+
+        self.assertTrue(self.engine.check_valid_players(), "The round should end when nobody is playing.")
+        self.assertEqual(self.engine.winners, [self.engine.player])
+        self.assertEqual(self.engine.outcome, "Player 1 wins!")
+        self.assertEqual(self.engine.seat_results(), ['win', 'lose', 'bust'])
+
+    def test_opponent_stands_on_unlikely_hit(self):
+        """Test that an opponent on 17 stands when the draw is above the hit chance."""
+
+        self.engine.opponent_one.hand.cards = [Card('Diamonds', '10'), Card('Clubs', '7')]
+        with patch.object(self.engine.round_rng, 'randint', return_value=13):
+            self.engine.opponent_turn(self.engine.opponent_one)
+
+        self.assertEqual(self.engine.opponent_one.status, 'stood')
+        self.assertEqual(len(self.engine.opponent_one.hand.cards), 2, "Standing should not draw a card.")
+
+    def test_opponent_always_hits_on_low_hand(self):
+        """Test that an opponent on 15 or below always hits."""
+
+        self.engine.opponent_two.hand.cards = [Card('Diamonds', '2'), Card('Clubs', '3')]
+        self.engine.opponent_turn(self.engine.opponent_two)
+
+        self.assertEqual(len(self.engine.opponent_two.hand.cards), 3, "The opponent should have drawn a card.")
+
+    def test_round_seed_replays_round(self):
+        """Test that replaying a recorded round seed deals the same cards and decisions."""
+
+        self.engine.reset_round()
+        self.engine.play_round()
+        seed = self.engine.round_seed
+        hands = [[str(card) for card in p.hand.cards] for p in self.engine.players()]
+
+        replay = GameEngine(3)
+        replay.reset_round(seed)
+        replay.play_round()
+
+        self.assertEqual([[str(card) for card in p.hand.cards] for p in replay.players()], hands)
+        self.assertEqual(replay.outcome, self.engine.outcome)
+
+    def test_seeded_tables_are_reproducible(self):
+        """Test that two tables built from the same stream seed play identical rounds."""
+
+        first = GameEngine(3, rng=RandomStream(42))
+        second = GameEngine(3, rng=RandomStream(42))
+        for _ in range(20):
+            for engine in (first, second):
+                engine.reset_round()
+                engine.play_round()
+            self.assertEqual(first.round_seed, second.round_seed)
+            self.assertEqual(first.outcome, second.outcome)
+
+class TestLargeTable(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a seven-seat table dealing from a shoe."""
+        self.engine = GameEngine(7, shoe=Shoe(6), rng=RandomStream(3))
+
+    def test_seats_are_named_in_turn_order(self):
+        """Test that the first three seats keep their names and later ones are numbered."""
+
+        self.assertEqual(len(self.engine.players()), 7)
+        self.assertIs(self.engine.opponent_two, self.engine.seats[2])
+        self.engine.turn = 'opponent_5'
+        self.assertEqual(self.engine.turn_index, 5)
+        self.assertIs(self.engine.get_player_by_turn('opponent_5'), self.engine.seats[5])
+
+    def test_turn_skips_finished_seats(self):
+        """Test that the next turn goes to the next seat still playing, dropping finished seats from the ring."""
+
+        self.engine.deal_initial_cards()
+        for seat in (2, 3, 4):
+            self.engine.seats[seat].status = 'stood'
+        self.engine.turn = 'opponent_one'
+        self.engine.queue_next_turn()
+
+        self.assertEqual(self.engine.next_index, 5)
+        self.assertEqual(self.engine.seats_left, 4, "Each finished seat passed should leave the ring.")
+        self.assertEqual(self.engine.next_seat[1], 5, "The walk should not pass the finished seats again.")
+
+    def test_play_round_large_tables(self):
+        """Test that rounds at large tables finish with nobody left playing and every seat counted."""
+
+        for num_players in (2, 7, 20):
+            engine = GameEngine(num_players, shoe=Shoe(8), rng=RandomStream(num_players))
+            for _ in range(100):
+                engine.reset_round()
+                winners = engine.play_round()
+                self.assertTrue(engine.game_over)
+                self.assertTrue(all(p.status != 'playing' for p in engine.players()), "Nobody should still be playing.")
+                self.assertEqual(len(engine.seat_results()), num_players)
+                for winner in winners:
+                    self.assertLessEqual(winner.hand_value(), 21)
+
+    def test_table_needs_a_player(self):
+        """Test that a table with no seats is rejected."""
+
+        self.assertRaises(ValueError, GameEngine, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+
+from blackjack import BlackjackGame
+from src.card import Card
+
+class TestFastForward(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a multi-player game that fast-forwards opponent turns."""
+        self.game = BlackjackGame(3, fast_forward=True)
+
+    def test_opponent_turn_is_not_animated(self):
+        """Test that a fast-forwarded opponent hit goes straight into the hand with no banner."""
+
+        self.game.deal_initial_cards()
+        self.game.timeline.finish()
+        self.game.opponent_one.hand.cards = [Card('Diamonds', '2'), Card('Clubs', '3')]
+        self.game.opponent_turn(self.game.opponent_one)
+
+        self.assertEqual(len(self.game.opponent_one.hand.cards), 3, "The opponent should have hit.")
+        self.assertTrue(self.game.opponent_one.hand.cards[-1].face_up, "The card should be shown face up at once.")
+        self.assertTrue(self.game.timeline.idle, "Nothing should be queued to animate.")
+
+    def test_toggle_skips_playing_animations(self):
+        """Test that switching fast-forward on finishes whatever is still animating."""
+
+        self.game.fast_forward = False
+        self.game.deal_initial_cards()
+        self.game.toggle_fast_forward()
+
+        self.assertTrue(self.game.fast_forward)
+        self.assertTrue(self.game.timeline.idle)
+        self.assertEqual(self.game.shown_cards(self.game.player), 2)
+
+    def test_autoplay_plays_every_round(self):
+        """Test that autoplay finishes the requested rounds and reports a result for every seat."""
+
+        self.game.fast_forward = False
+        counts = self.game.autoplay(20)
+
+        self.assertEqual(len(counts), 3)
+        for seat in counts:
+            self.assertEqual(sum(seat.values()), 20, "Every round should give each seat one result.")
+        self.assertTrue(self.game.timeline.idle, "No end screen should be left queued.")
+        self.assertFalse(self.game.autoplaying)
+        self.assertFalse(self.game.fast_forward, "Fast-forwarding should be put back as it was.")
+
+if __name__ == '__main__':
+    unittest.main()
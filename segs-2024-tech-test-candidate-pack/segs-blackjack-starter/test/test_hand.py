@@ -0,0 +1,69 @@
+import unittest
+
+from src.card import Card
+from src.hand import Hand
+from src.player import Player
+
+class TestHandValue(unittest.TestCase):
+
+    def setUp(self):
+        """Set up an empty hand."""
+        self.hand = Hand()
+
+    def deal(self, *ranks):
+        """Adds cards of the given ranks to the hand."""
+        for rank in ranks:
+            self.hand.add_card(Card('Spades', rank))
+
+    def test_soft_hand(self):
+        """Test that an ace counts as 11 when it does not bust the hand."""
+
+        self.deal('Ace', '6')
+
+        self.assertEqual(self.hand.value, 17)
+        self.assertTrue(self.hand.is_soft, "Ace and 6 should be a soft 17.")
+        self.assertFalse(self.hand.is_bust)
+
+    def test_ace_drops_to_one_after_later_cards(self):
+        """Test that an ace counted as 11 drops to 1 when a later card would bust."""
+
+        self.deal('Ace', '5', '10')
+
+        self.assertEqual(self.hand.value, 16, "Ace, 5 and 10 should be a hard 16.")
+        self.assertFalse(self.hand.is_soft)
+
+    def test_bust_and_blackjack(self):
+        """Test the bust and blackjack flags."""
+
+        self.deal('Ace', 'King')
+        self.assertTrue(self.hand.is_blackjack, "Ace and King should be blackjack.")
+
+        self.deal('Queen', '5')
+        self.assertFalse(self.hand.is_blackjack, "Blackjack needs exactly two cards.")
+        self.assertTrue(self.hand.is_bust, "Ace, King, Queen and 5 should bust.")
+        self.assertEqual(self.hand.value, 26)
+
+    def test_replacing_cards_recounts_total(self):
+        """Test that assigning the cards list, as reset_game does, keeps the value correct."""
+
+        self.deal('King', 'Queen')
+        self.hand.cards = []
+        self.assertEqual(self.hand.value, 0, "An emptied hand should be worth nothing.")
+
+        self.hand.cards = [Card('Hearts', '10'), Card('Spades', 'Ace')]
+        self.assertEqual(self.hand.value, 21)
+        self.assertTrue(self.hand.is_blackjack)
+
+    def test_player_hand_value_uses_running_total(self):
+        """Test that the player's hand value follows the hand."""
+
+        player = Player()
+        player.add_card_to_hand(Card('Clubs', '9'))
+        player.add_card_to_hand(Card('Clubs', '8'))
+
+        self.assertEqual(player.hand_value(), 17)
+        player.hand.clear()
+        self.assertEqual(player.hand_value(), 0, "A cleared hand should be worth nothing.")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+@unittest.skipIf(numpy is None, "NumPy is required for the batch simulator")
+class TestMonteCarlo(unittest.TestCase):
+
+    def test_rates_cover_every_game(self):
+        """Test that every seat's outcome rates add up to one."""
+        from src.montecarlo import simulate
+
+        result = simulate(20000, seed=7, chunk_size=6000)
+
+        self.assertEqual(result['games'], 20000)
+        for counts in result['counts']:
+            self.assertEqual(sum(counts.values()), 20000, "Every game should have exactly one outcome per seat.")
+
+    def test_seeded_runs_are_reproducible(self):
+        """Test that the same seed gives the same counts."""
+        from src.montecarlo import simulate
+
+        self.assertEqual(simulate(5000, seed=3)['counts'], simulate(5000, seed=3)['counts'])
+
+    def test_rejects_no_games(self):
+        """Test that simulating no games raises ValueError rather than dividing by zero."""
+        from src.montecarlo import simulate
+
+        with self.assertRaises(ValueError):
+            simulate(0)
+
+    def test_standing_policy_never_busts(self):
+        """Test that seats which never hit can never bust."""
+        from src.montecarlo import simulate
+
+        never_hit = {value: 0 for value in range(32)}
+        result = simulate(5000, hit_chances=never_hit, seed=1)
+
+        for counts in result['counts']:
+            self.assertEqual(counts['bust'], 0, "A seat that always stands on two cards cannot bust.")
+
+    def test_final_values_match_hand_rules(self):
+        """Test that simulated hand values are valid blackjack totals."""
+        from src.montecarlo import hit_table, play_games
+
+        values = play_games(numpy.random.default_rng(5), 2000, [hit_table()] * 3)
+
+        self.assertTrue((values >= 4).all(), "Two cards are worth at least 4.")
+        self.assertTrue((values[values <= 21] >= 16).all(), "Seats always hit on 15 or below, so valid hands end on 16 or more.")
+
+if __name__ == '__main__':
+    unittest.main()
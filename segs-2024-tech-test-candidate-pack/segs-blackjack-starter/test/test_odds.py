@@ -0,0 +1,86 @@
+import itertools
+import unittest
+
+from src import odds
+from src.card import Card
+from src.engine import GameEngine
+from src.policy import Policy
+from src.rng import RandomStream
+
+# Hits on 15 or below and stands on 16 or above, with no random draws
+STAND_ON_16 = Policy({})
+
+class TestOdds(unittest.TestCase):
+
+    def test_final_totals_match_enumeration(self):
+        """Test that the memoized recursion matches playing out every order of a small deck."""
+
+        counts = (1, 0, 1, 0, 1, 0, 0, 0, 0, 2)  # an ace, a 3, a 5 and two ten-value cards
+        deck = [1, 3, 5, 10, 10]
+        expected = [0.0] * (odds.BUST + 1)
+        orders = list(itertools.permutations(deck))
+        for order in orders:
+            hard, ace = 6, False
+            for value in order:
+                if odds.hand_value(hard, ace) >= 16:
+                    break
+                hard, ace = hard + value, ace or value == 1
+            expected[odds.hand_value(hard, ace) if hard <= 21 else odds.BUST] += 1 / len(orders)
+
+        totals = odds.final_totals(6, False, counts, STAND_ON_16)
+        for total, chance in enumerate(expected):
+            self.assertAlmostEqual(totals[total], chance)
+
+    def test_final_totals_of_a_standing_hand(self):
+        """Test that a hand the policy always stands on keeps its value."""
+
+        totals = odds.final_totals(20, False, (4,) * 9 + (16,), STAND_ON_16)
+
+        self.assertEqual(totals[20], 1.0)
+        self.assertAlmostEqual(sum(totals), 1.0)
+
+    def test_single_player_only_21_wins(self):
+        """Test that in single player standing only wins on 21."""
+
+        stands = odds.stand_evs(None, (4,) * 9 + (16,))
+
+        self.assertEqual(stands[21], 1.0)
+        self.assertEqual(stands[18], -1.0)
+
+    def test_advice_stands_on_a_winning_hand(self):
+        """Test that the player is told to stand on 20 when both other seats stood on less."""
+
+        engine = GameEngine(3, rng=RandomStream(1))
+        engine.player.hand.cards = [Card('Hearts', 'King'), Card('Spades', 'Queen')]
+        engine.opponent_one.hand.cards = [Card('Hearts', '10'), Card('Clubs', '8')]
+        engine.opponent_two.hand.cards = [Card('Hearts', '9'), Card('Clubs', '8')]
+        engine.opponent_one.status = engine.opponent_two.status = 'stood'
+        hit, hit_ev, stand_ev = odds.advice(engine, engine.player)
+
+        self.assertFalse(hit)
+        self.assertEqual(stand_ev, 1.0, "20 beats 18 and 17 for certain.")
+        self.assertLess(hit_ev, stand_ev)
+
+    def test_advice_is_memoized(self):
+        """Test that asking again for the same table is answered from the cache."""
+
+        engine = GameEngine(3, rng=RandomStream(4))
+        engine.deal_initial_cards()
+        first = odds.advice(engine, engine.player)
+        misses = {name: info.misses for name, info in odds.cache_info().items()}
+
+        self.assertEqual(odds.advice(engine, engine.player), first)
+        self.assertEqual({name: info.misses for name, info in odds.cache_info().items()}, misses, "Nothing should be recomputed.")
+
+    def test_perfect_policy_plays_rounds(self):
+        """Test that opponents playing by the odds finish their rounds."""
+
+        engine = GameEngine(3, rng=RandomStream(6))
+        engine.policy = odds.PerfectPolicy(engine)
+        for _ in range(20):
+            engine.reset_round()
+            engine.play_round()
+            self.assertTrue(engine.game_over)
+
+if __name__ == '__main__':
+    unittest.main()
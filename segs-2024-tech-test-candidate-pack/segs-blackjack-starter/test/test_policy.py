@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from src.policy import Policy, default_policy
+from src.engine import GameEngine
+from src.hand import Hand
+from src.card import Card
+
+def make_hand(*ranks):
+    """Builds a hand of the given ranks."""
+    hand = Hand()
+    hand.cards = [Card('Spades', rank) for rank in ranks]
+    return hand
+
+class TestPolicy(unittest.TestCase):
+
+    def test_default_policy_file(self):
+        """Test that the default policy file holds the original opponent chances."""
+
+        self.assertEqual(default_policy.hit_chances, {16: 4, 17: 3, 18: 2, 19: 1})
+        self.assertEqual(default_policy.chance(make_hand('10', '5')), 13, "Opponents should always hit on 15.")
+        self.assertEqual(default_policy.chance(make_hand('10', '7')), 3)
+        self.assertEqual(default_policy.chance(make_hand('10', 'Queen')), 0, "Opponents should always stand on 20.")
+
+    def test_soft_hands_use_soft_value(self):
+        """Test that soft hands are looked up by their soft value unless the ace has to count 1."""
+
+        policy = Policy({17: 3}, soft_hit_chances={17: 13})
+
+        self.assertEqual(policy.chance(make_hand('Ace', '6')), 13, "Soft 17 should use the soft chance.")
+        self.assertEqual(policy.chance(make_hand('10', '7')), 3, "Hard 17 should use the hard chance.")
+        self.assertEqual(policy.chance(make_hand('Ace', '6', '10')), 3, "An ace counting 1 makes the hand hard.")
+
+    def test_decide_only_draws_when_uncertain(self):
+        """Test that certain hits and stands do not use the random stream."""
+
+        rng = MagicMock()
+        rng.randint.return_value = 1
+
+        self.assertTrue(default_policy.decide(make_hand('2', '3'), rng))
+        self.assertFalse(default_policy.decide(make_hand('King', 'Queen'), rng))
+        rng.randint.assert_not_called()
+        self.assertTrue(default_policy.decide(make_hand('10', '9'), rng))
+        rng.randint.assert_called_once_with(1, 13)
+
+    def test_save_and_load_round_trip(self):
+        """Test that a saved policy loads back with the same decision table."""
+
+        policy = Policy({16: 6}, soft_hit_chances={18: 5}, always_hit_to=14, sides=20, name='cautious')
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cautious.json')
+            policy.save(path)
+            loaded = Policy.load(path)
+
+        self.assertEqual(loaded.table, policy.table)
+        self.assertEqual((loaded.name, loaded.sides), ('cautious', 20))
+
+    def test_engine_plays_by_policy(self):
+        """Test that opponents follow the engine's policy rather than fixed rules."""
+
+        engine = GameEngine(3, policy=Policy({}, always_hit_to=0))
+        for _ in range(50):
+            engine.reset_round()
+            engine.play_round()
+            for player in engine.players():
+                self.assertEqual(len(player.hand.cards), 2, "A policy that never hits should never draw a third card.")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import json
+import os
+import tempfile
+import unittest
+
+import pygame
+
+from src.profiler import Profiler, NULL_SECTION, profiler
+from src.hand import Hand
+from src.card import Card
+from blackjack import BlackjackGame
+
+class TestProfiler(unittest.TestCase):
+
+    def setUp(self):
+        """Set up an enabled profiler driven by a fake clock."""
+        self.now = 0.0
+        self.profiler = Profiler(frames=4, clock=lambda: self.now)
+        self.profiler.enabled = True
+
+    def frame(self, sections):
+        """Runs one frame made of the given (name, seconds) sections."""
+
+        self.profiler.begin_frame()
+        for name, seconds in sections:
+            with self.profiler.section(name):
+                self.now += seconds
+        self.profiler.end_frame()
+
+    def test_disabled_profiler_records_nothing(self):
+        """Test that while off sections cost nothing and no frames are kept."""
+
+        self.profiler.enabled = False
+        self.assertIs(self.profiler.section('draw_screen'), NULL_SECTION)
+        self.frame([('draw_screen', 0.01)])
+
+        self.assertEqual(len(self.profiler.frames), 0)
+        self.assertEqual(self.profiler.trace()['traceEvents'], [])
+
+    def test_frames_are_kept_in_a_ring_buffer(self):
+        """Test that only the most recent frames are kept."""
+
+        for milliseconds in range(1, 7):
+            self.frame([('draw_screen', milliseconds / 1000)])
+
+        self.assertEqual([round(duration * 1000) for _, duration, _ in self.profiler.frames], [3, 4, 5, 6])
+        self.assertAlmostEqual(self.profiler.percentile(50), 0.005)
+        self.assertAlmostEqual(self.profiler.percentile(99), 0.006)
+        self.assertEqual(self.profiler.fps(), 4)
+
+    def test_slowest_sections_are_ranked_by_total_time(self):
+        """Test that sections are summed over frames and the slowest listed first."""
+
+        self.frame([('handle_input', 0.001), ('draw_screen', 0.004)])
+        self.frame([('handle_input', 0.001), ('draw_screen', 0.002), ('draw_screen', 0.002)])
+        slowest = self.profiler.slowest(2)
+
+        self.assertEqual([name for name, _, _, _ in slowest], ['draw_screen', 'handle_input'])
+        name, calls, total, worst = slowest[0]
+        self.assertEqual(calls, 3)
+        self.assertAlmostEqual(total, 0.008)
+        self.assertAlmostEqual(worst, 0.004)
+        self.assertEqual(len(self.profiler.summary(2)), 3, "The overlay should show the frame times and each section.")
+
+    def test_sections_outside_frames_are_kept(self):
+        """Test that sections timed between frames, like loading at startup, are not dropped by the next frame."""
+
+        with self.profiler.section('atlas'):
+            self.now += 0.05
+        self.frame([('draw_screen', 0.002)])
+        with self.profiler.section('atlas'):
+            self.now += 0.01
+
+        self.assertEqual([name for name, _, _, _ in self.profiler.slowest()], ['draw_screen'])
+        name, calls, total, worst = self.profiler.outside()[0]
+        self.assertEqual((name, calls), ('atlas', 2))
+        self.assertAlmostEqual(total, 0.06)
+        self.assertAlmostEqual(worst, 0.05)
+        self.assertEqual(self.profiler.summary()[-1], "outside frames 60.0 ms, most in atlas")
+
+        self.profiler.clear()
+        self.assertEqual(self.profiler.outside(), [])
+
+    def test_dump_writes_chrome_trace(self):
+        """Test that sections and frames are written as complete trace events in microseconds."""
+
+        self.frame([('draw_screen', 0.002)])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'trace.json')
+            self.profiler.dump(path)
+            with open(path) as file:
+                events = json.load(file)['traceEvents']
+
+        self.assertEqual([event['name'] for event in events], ['draw_screen', 'frame'])
+        self.assertTrue(all(event['ph'] == 'X' for event in events))
+        self.assertAlmostEqual(events[0]['dur'], 2000)
+
+class TestProfileOverlay(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a game with the shared profiler cleared."""
+        profiler.clear()
+        self.game = BlackjackGame(3)
+
+    def tearDown(self):
+        """Turn the shared profiler back off."""
+        profiler.enabled = False
+        profiler.clear()
+
+    def test_p_key_shows_overlay_and_starts_profiling(self):
+        """Test that P turns profiling on and adds the overlay to the table."""
+
+        self.game.handle_input([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_p)])
+        names = [name for name, _, _, _ in self.game.scene_layers()]
+
+        self.assertTrue(profiler.enabled)
+        self.assertIn('profile 0', names)
+
+    def test_hand_drawing_is_timed(self):
+        """Test that drawing a hand is recorded as a section while profiling."""
+
+        profiler.enabled = True
+        hand = Hand()
+        hand.add_card(Card('Hearts', 'Ace', face_up=True))
+        profiler.begin_frame()
+        hand.draw_hand(pygame.Surface((1200, 700)), 0, 0, 'horizontal')
+        profiler.end_frame()
+
+        self.assertIn('draw_hand', profiler.frames[-1][2])
+
+if __name__ == '__main__':
+    unittest.main()
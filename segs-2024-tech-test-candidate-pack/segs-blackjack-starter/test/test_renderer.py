@@ -0,0 +1,48 @@
+import unittest
+import pygame
+
+from src.renderer import DirtyRenderer
+
+class TestDirtyRenderer(unittest.TestCase):
+
+    def setUp(self):
+        """Set up an offscreen surface and a renderer with a green background."""
+        self.screen = pygame.Surface((200, 100))
+        self.renderer = DirtyRenderer((34, 139, 34))
+        self.colour = (255, 0, 0)
+
+    def layers(self, x=10):
+        """Builds a scene with one box whose position and colour are its state."""
+        rect = pygame.Rect(x, 10, 20, 20)
+        return [('box', rect, self.colour, lambda surface: surface.fill(self.colour, rect))]
+
+    def test_first_frame_redraws_everything(self):
+        """Test that the first frame repaints the whole screen."""
+
+        self.assertEqual(self.renderer.render(self.screen, self.layers()), [self.screen.get_rect()])
+
+    def test_idle_frame_redraws_nothing(self):
+        """Test that an unchanged scene produces no dirty rects."""
+
+        self.renderer.render(self.screen, self.layers())
+        self.assertEqual(self.renderer.render(self.screen, self.layers()), [], "Nothing changed, so nothing should be redrawn.")
+
+    def test_moved_layer_repaints_old_and_new_areas(self):
+        """Test that moving a layer repaints where it was and where it is now."""
+
+        self.renderer.render(self.screen, self.layers(x=10))
+        dirty = self.renderer.render(self.screen, self.layers(x=100))
+
+        self.assertEqual(dirty, [pygame.Rect(100, 10, 20, 20), pygame.Rect(10, 10, 20, 20)])
+        self.assertEqual(self.screen.get_at((15, 15))[:3], (34, 139, 34), "The old position should be cleared.")
+        self.assertEqual(self.screen.get_at((105, 15))[:3], self.colour, "The box should be drawn at its new position.")
+
+    def test_invalidate_forces_full_redraw(self):
+        """Test that invalidating repaints the whole screen on the next frame."""
+
+        self.renderer.render(self.screen, self.layers())
+        self.renderer.invalidate()
+        self.assertEqual(self.renderer.render(self.screen, self.layers()), [self.screen.get_rect()])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+import os
+import tempfile
+import unittest
+
+from src.replay import RecordedRound, Replay, check_log
+from src.roundlog import RoundLogReader, record_rounds
+from src.engine import GameEngine
+from src.display import OffscreenTarget
+from src.rng import RandomStream
+from src.scheduler import Scheduler
+from blackjack import BlackjackGame
+
+def hands(engine):
+    """Returns every seat's cards and status, to compare tables."""
+
+    return [([str(card) for card in player.hand.cards], player.status) for player in engine.players()]
+
+class TestReplay(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Record a log of rounds dealt from a shoe, which the seed alone cannot deal again."""
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.directory.name, 'rounds.bjlog')
+        record_rounds(cls.path, 200, num_seats=3, seed=6, num_decks=2)
+        cls.reader = RoundLogReader(cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.reader
+        cls.directory.cleanup()
+
+    def test_replayed_rounds_match_the_log(self):
+        """Test that every recorded round plays out the same with the current rules."""
+
+        checked, mismatches = check_log(self.path)
+
+        self.assertEqual(checked, 200)
+        self.assertEqual(mismatches, {})
+
+    def test_replay_from_seed(self):
+        """Test that a seed alone replays a round from a fresh deck, decisions coming from the policy."""
+
+        engine = GameEngine(3, rng=RandomStream(11))
+        engine.reset_round(1234)
+        engine.play_round()
+        played = hands(engine)
+
+        replay = Replay(GameEngine(3), RecordedRound(1234, 3))
+        replay.play_to()
+
+        self.assertEqual(hands(replay.engine), played)
+
+    def test_jumping_to_an_action(self):
+        """Test that stopping at any action and playing on, or going back, ends the same as playing straight through."""
+
+        recorded = RecordedRound.from_log(self.reader, 42)
+        replay = Replay(GameEngine(3), recorded)
+        replay.play_to()
+        final = hands(replay.engine)
+
+        for index in range(len(recorded.actions) + 1):
+            self.assertEqual(replay.play_to(index), index)
+            self.assertFalse(replay.finished and index < len(recorded.actions))
+            replay.play_to()
+            self.assertEqual(hands(replay.engine), final)
+            self.assertEqual(replay.differences(), [])
+
+    def test_steps_play_one_action_each(self):
+        """Test that stepping moves through the recorded actions one at a time."""
+
+        recorded = RecordedRound.from_log(self.reader, 7)
+        replay = Replay(GameEngine(3), recorded)
+
+        positions = []
+        while not replay.finished:
+            positions.append(replay.step())
+        self.assertEqual(positions, list(range(1, len(recorded.actions) + 1)))
+
+    def test_divergence_is_reported(self):
+        """Test that a recording the rules no longer follow is reported rather than replayed silently."""
+
+        recorded = RecordedRound.from_log(self.reader, 3)
+        seat, hit, value = recorded.actions[0]
+        recorded.actions[0] = (seat, hit, value + 1)
+
+        with self.assertRaises(ValueError):
+            Replay(GameEngine(3), recorded).play_to()
+
+        recorded = RecordedRound.from_log(self.reader, 3)
+        recorded.outcomes = [('win', 21)] * 3
+        replay = Replay(GameEngine(3), recorded)
+        replay.play_to()
+        self.assertTrue(replay.differences())
+
+    def test_policy_is_put_back(self):
+        """Test that an engine plays by its own policy again after a replay, including one that diverged."""
+
+        engine = GameEngine(3)
+        policy = engine.policy
+        Replay(engine, RecordedRound.from_log(self.reader, 42)).play_to()
+        self.assertIs(engine.policy, policy)
+
+        recorded = RecordedRound.from_log(self.reader, 3)
+        seat, hit, value = recorded.actions[0]
+        recorded.actions[0] = (seat, hit, value + 1)
+        with self.assertRaises(ValueError):
+            Replay(engine, recorded).play_to()
+        self.assertIs(engine.policy, policy)
+
+    def test_missing_round(self):
+        """Test that asking for a round that is not in the log raises ValueError."""
+
+        with self.assertRaises(ValueError):
+            RecordedRound.from_log(self.reader, 200)
+
+    def test_replay_through_the_renderer(self):
+        """Test that the game window jumps to an action showing the same table as a headless replay."""
+
+        recorded = RecordedRound.from_log(self.reader, 42)
+        headless = Replay(GameEngine(3), recorded)
+        headless.play_to(1)
+
+        game = BlackjackGame(3, target=OffscreenTarget())
+        replay = Replay(game, recorded)
+        game.jump_replay(replay, 1)
+        game.draw_screen()
+
+        self.assertEqual(hands(game), hands(headless.engine))
+        self.assertTrue(game.timeline.idle)
+        self.assertGreater(game.target.frames, 0)
+
+    def test_divergence_is_shown_in_the_window(self):
+        """Test that a recording the rules no longer follow stops the window replay with the reason rather than crashing."""
+
+        recorded = RecordedRound.from_log(self.reader, 3)
+        seat, hit, value = recorded.actions[0]
+        recorded.actions[0] = (seat, hit, value + 1)
+        game = BlackjackGame(3, target=OffscreenTarget())
+        replay = Replay(game, recorded)
+
+        game.jump_replay(replay, 1)
+        self.assertTrue(game.replay_error.startswith("Replay diverged at action 0"))
+        game.draw_screen()
+
+        # Stepping on from before the divergence stops the same way
+        game.jump_replay(replay, 0)
+        self.assertIsNone(game.replay_error)
+        now = [0.0]
+        game.scheduler = Scheduler(clock=lambda: now[0])
+        game.schedule_replay_step(replay)
+        now[0] += 10
+        game.scheduler.run_due()
+        self.assertTrue(game.replay_error.startswith("Replay diverged at action 0"))
+        self.assertFalse(game.replay_pending)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+from src.rng import RandomStream
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class TestRandomStream(unittest.TestCase):
+
+    def test_same_seed_same_sequence(self):
+        """Test that streams with the same seed produce the same draws."""
+
+        first, second = RandomStream(7), RandomStream(7)
+        self.assertEqual([first.randint(1, 13) for _ in range(50)], [second.randint(1, 13) for _ in range(50)])
+
+    def test_spawned_streams_are_deterministic_and_distinct(self):
+        """Test that children depend only on the parent seed and are independent of each other."""
+
+        children = RandomStream(7).spawn(4)
+        again = RandomStream(7).spawn(4)
+
+        self.assertEqual([child.seed for child in children], [child.seed for child in again])
+        self.assertEqual(len({child.seed for child in children}), 4, "Every child should get its own seed.")
+
+    def test_spawn_continues_numbering(self):
+        """Test that spawning in two calls gives the same children as spawning at once."""
+
+        stream = RandomStream(3)
+        split = stream.spawn(2) + stream.spawn(2)
+        self.assertEqual([child.seed for child in split], [child.seed for child in RandomStream(3).spawn(4)])
+
+    @unittest.skipIf(numpy is None, "NumPy is required for the NumPy backend")
+    def test_numpy_backend(self):
+        """Test that the NumPy backend shuffles in place and draws within range."""
+
+        stream = RandomStream(5, backend='numpy')
+        items = list(range(52))
+        stream.shuffle(items)
+
+        self.assertEqual(sorted(items), list(range(52)))
+        self.assertTrue(all(1 <= stream.randint(1, 13) <= 13 for _ in range(200)))
+        self.assertEqual(RandomStream(5, backend='numpy').next_seed(), RandomStream(5, backend='numpy').next_seed())
+
+if __name__ == '__main__':
+    unittest.main()
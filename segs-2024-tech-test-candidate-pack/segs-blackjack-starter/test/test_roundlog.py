@@ -0,0 +1,183 @@
+import os
+import tempfile
+import unittest
+
+from src.roundlog import RoundLogWriter, RoundLogReader, record_rounds, HEADER, RECORD, SHUFFLE, STAND
+from src.engine import GameEngine, OUTCOMES
+from src.compact import card_id
+from src.rng import RandomStream
+from src.shoe import Shoe
+
+class TestRoundLog(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a path for a log in a temporary directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'rounds.bjlog')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_records_match_the_rounds_played(self):
+        """Test that the draws, decisions and outcomes logged are the ones the engine played."""
+
+        played = []
+        with RoundLogWriter(self.path, buffer_records=7) as log:
+            engine = GameEngine(3, rng=RandomStream(4), log=log)
+            for index in range(20):
+                if index:
+                    engine.reset_round()
+                engine.play_round()
+                played.append(([[card_id(card) for card in player.hand.cards] for player in engine.players()],
+                               engine.seat_results(), engine.round_seed))
+
+        reader = RoundLogReader(self.path)
+        rounds = reader.rounds()
+        self.assertEqual(list(rounds['round']), list(range(20)))
+        for number, (hands, results, seed) in enumerate(played):
+            self.assertEqual(int(rounds['data'][number]), seed)
+            self.assertEqual(int(rounds['seat'][number]), 3)
+
+            draws = reader.draws()
+            draws = draws[draws['round'] == number]
+            for seat, cards in enumerate(hands):
+                self.assertEqual(list(draws['card'][draws['seat'] == seat]), cards)
+
+            outcomes = reader.outcomes()
+            outcomes = outcomes[outcomes['round'] == number]
+            self.assertEqual([OUTCOMES[result] for result in outcomes['data']], results)
+
+        # Every card after the opening deal follows a hit
+        self.assertEqual(reader.summary()['hits'], len(reader.draws()) - 20 * 6)
+
+    def test_decisions_record_the_hand_value_decided_on(self):
+        """Test that a hit is logged at the value before its card and a stand at the final value."""
+
+        with RoundLogWriter(self.path) as log:
+            engine = GameEngine(1, rng=RandomStream(2), log=log)
+            engine.deal_initial_cards()
+            value = engine.player.hand.value
+            engine.player_stand()
+
+        decisions = RoundLogReader(self.path).decisions()
+        self.assertEqual(len(decisions), 1)
+        self.assertEqual((int(decisions['code'][0]), int(decisions['seat'][0]), int(decisions['value'][0])), (STAND, 0, value))
+
+    def test_appending_continues_the_round_numbers(self):
+        """Test that a second writer on the same file carries on counting rounds."""
+
+        record_rounds(self.path, 3, seed=1)
+        record_rounds(self.path, 2, seed=1)
+
+        self.assertEqual(list(RoundLogReader(self.path).rounds()['round']), [0, 1, 2, 3, 4])
+
+    def test_partial_record_is_dropped(self):
+        """Test that a record cut short by a crash is ignored by the reader and overwritten by the next writer."""
+
+        record_rounds(self.path, 2, seed=1)
+        records = len(RoundLogReader(self.path))
+        with open(self.path, 'ab') as file:
+            file.write(b'\x01\x02\x03')
+
+        self.assertEqual(len(RoundLogReader(self.path)), records)
+        record_rounds(self.path, 1, seed=1)
+        self.assertEqual((os.path.getsize(self.path) - HEADER.size) % RECORD.size, 0)
+        self.assertEqual(list(RoundLogReader(self.path).rounds()['round']), [0, 1, 2])
+
+    def test_shuffles_are_only_logged_when_asked_for(self):
+        """Test that the deck order is written only with shuffles on, a full deck per fresh deck."""
+
+        record_rounds(self.path, 2, seed=3)
+        self.assertEqual(len(RoundLogReader(self.path).of(SHUFFLE)), 0)
+
+        os.remove(self.path)
+        with RoundLogWriter(self.path, shuffles=True) as log:
+            engine = GameEngine(3, rng=RandomStream(3), log=log)
+            order = [card_id(card) for card in engine.deck.cards]
+            engine.play_round()
+        shuffle = RoundLogReader(self.path).of(SHUFFLE)
+        self.assertEqual(list(shuffle['card']), order)
+
+    def test_shoe_shuffles_are_logged_at_the_cut_card(self):
+        """Test that rounds dealt from a shoe log its order only when it was reshuffled."""
+
+        with RoundLogWriter(self.path, shuffles=True) as log:
+            engine = GameEngine(3, shoe=Shoe(1), rng=RandomStream(3), log=log)
+            for index in range(10):
+                if index:
+                    engine.reset_round()
+                engine.play_round()
+        shuffles = RoundLogReader(self.path).of(SHUFFLE)
+        self.assertGreater(len(set(shuffles['round'])), 1)
+        self.assertLess(len(set(shuffles['round'])), 10)
+        self.assertEqual(len(shuffles) % 52, 0)
+
+    def test_summary_rates(self):
+        """Test that every seat's outcome rates add up to one."""
+
+        record_rounds(self.path, 200, num_seats=3, seed=5)
+        summary = RoundLogReader(self.path).summary()
+
+        self.assertEqual(summary['rounds'], 200)
+        self.assertEqual(len(summary['rates']), 3)
+        for rates in summary['rates']:
+            self.assertAlmostEqual(sum(rates.values()), 1.0)
+
+    def test_empty_log(self):
+        """Test that a log with only its header reads as no records."""
+
+        RoundLogWriter(self.path).close()
+        reader = RoundLogReader(self.path)
+
+        self.assertEqual(len(reader), 0)
+        self.assertEqual(reader.summary()['rounds'], 0)
+
+    def test_rejects_other_files(self):
+        """Test that a file without the log header raises ValueError."""
+
+        for data in (b'not a round log at all', b'short', b''):
+            with open(self.path, 'wb') as file:
+                file.write(data)
+
+            with self.assertRaises(ValueError):
+                RoundLogReader(self.path)
+
+    def test_writer_leaves_other_files_alone(self):
+        """Test that opening a writer on a file that is not a log raises ValueError without changing the file."""
+
+        for data in (b'not a round log at all', b'not a log'):
+            with open(self.path, 'wb') as file:
+                file.write(data)
+
+            with self.assertRaises(ValueError):
+                RoundLogWriter(self.path)
+            with open(self.path, 'rb') as file:
+                self.assertEqual(file.read(), data)
+
+    def test_short_header_is_written_again(self):
+        """Test that a header cut short by a crash is written again, leaving a log that can be read."""
+
+        RoundLogWriter(self.path).close()
+        os.truncate(self.path, 3)
+
+        record_rounds(self.path, 2, seed=1)
+        self.assertEqual(list(RoundLogReader(self.path).rounds()['round']), [0, 1])
+
+    def test_logging_leaves_the_game_unchanged(self):
+        """Test that a seeded table plays the same rounds with and without a log."""
+
+        def play(log):
+            engine = GameEngine(3, rng=RandomStream(8), log=log)
+            results = []
+            for index in range(50):
+                if index:
+                    engine.reset_round()
+                engine.play_round()
+                results.append((engine.seat_results(), [str(player.hand) for player in engine.players()]))
+            return results
+
+        with RoundLogWriter(self.path) as log:
+            self.assertEqual(play(log), play(None))
+
+if __name__ == '__main__':
+    unittest.main()
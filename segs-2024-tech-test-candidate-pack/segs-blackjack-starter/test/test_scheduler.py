@@ -0,0 +1,40 @@
+import unittest
+
+from src.scheduler import Scheduler
+
+class TestScheduler(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a scheduler driven by a fake clock."""
+        self.now = 0.0
+        self.scheduler = Scheduler(clock=lambda: self.now)
+        self.calls = []
+
+    def test_idle_scheduler_has_no_timeout(self):
+        """Test that with nothing scheduled the loop may block indefinitely."""
+
+        self.assertIsNone(self.scheduler.timeout(), "An idle scheduler should not wake the loop.")
+
+    def test_timeout_is_time_to_next_timer(self):
+        """Test that the timeout is the time until the earliest timer."""
+
+        self.scheduler.call_later(2.5, lambda: None)
+        self.scheduler.call_later(0.5, lambda: None)
+        self.now = 0.25
+
+        self.assertAlmostEqual(self.scheduler.timeout(), 0.25)
+
+    def test_only_due_timers_run_in_order(self):
+        """Test that due timers run in deadline order and later ones wait."""
+
+        self.scheduler.call_later(1.0, lambda: self.calls.append('second'))
+        self.scheduler.call_later(0.5, lambda: self.calls.append('first'))
+        self.scheduler.call_later(3.0, lambda: self.calls.append('later'))
+        self.now = 1.0
+        self.scheduler.run_due()
+
+        self.assertEqual(self.calls, ['first', 'second'])
+        self.assertAlmostEqual(self.scheduler.timeout(), 2.0, msg="The remaining timer should still be pending.")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+from src.server import Connection, TableServer, MAX_LINE, MAX_SEATS
+from src.loadgen import run_load
+
+class TestTableServer(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        """Start a seeded server on a free local port and connect a client to it."""
+        self.server = TableServer(3, seed=1, turn_timeout=None)
+        await self.server.start('127.0.0.1', 0)
+        self.reader, self.writer = await asyncio.open_connection(*self.server.address)
+
+    async def asyncTearDown(self):
+        """Disconnect the client and stop the server."""
+        self.writer.close()
+        await self.server.close()
+
+    async def request(self, line):
+        """Sends a request, given as a dict or a raw line, and returns the next message from the server."""
+
+        if isinstance(line, dict):
+            line = json.dumps(line).encode()
+        self.writer.write(line + b'\n')
+        await self.writer.drain()
+        return json.loads(await self.reader.readline())
+
+    async def test_play_a_round(self):
+        """Test that a client can join a table and hit or stand until the round is over."""
+
+        reply = await self.request({'op': 'join', 'id': 7})
+        self.assertTrue(reply['ok'])
+        self.assertEqual(reply['id'], 7, "The request id should be echoed back.")
+        self.assertEqual(len(self.server.tables), 1)
+
+        state = (await self.request({'op': 'deal'}))['state']
+        self.assertEqual(len(state['seats']), 3)
+        while not state['game_over']:
+            self.assertEqual(state['turn'], 'player', "Replies should wait for the client's decision.")
+            state = (await self.request({'op': 'hit' if state['seats'][0]['value'] < 17 else 'stand'}))['state']
+
+        self.assertIn('outcome', state)
+        self.assertEqual(len(state['results']), 3)
+        await self.request({'op': 'leave'})
+        self.assertEqual(self.server.tables, {})
+
+    async def test_bad_requests_are_rejected(self):
+        """Test that invalid requests get an error reply and leave the connection open."""
+
+        self.assertFalse((await self.request(b'not json'))['ok'])
+        self.assertEqual((await self.request({'op': 'fold'}))['error'], "Unknown op 'fold'")
+        self.assertEqual((await self.request({'op': []}))['error'], "The op must be a string")
+        self.assertEqual((await self.request({'op': 'hit'}))['error'], "Join a table first")
+        self.assertEqual((await self.request({'op': 'join', 'players': True}))['error'], f"Players must be between 1 and {MAX_SEATS}")
+        await self.request({'op': 'join', 'players': 1})
+        self.assertEqual((await self.request({'op': 'stand'}))['error'], "No round is being played, deal first")
+        self.assertFalse((await self.request({'op': 'join', 'players': 9}))['ok'])
+
+    async def test_long_lines_close_the_connection(self):
+        """Test that a request longer than the limit is refused."""
+
+        reply = await self.request(b'x' * (MAX_LINE * 2))
+
+        self.assertFalse(reply['ok'])
+        self.assertEqual(await self.reader.readline(), b'', "The connection should be closed.")
+
+    async def test_turn_timer_stands_for_slow_player(self):
+        """Test that a player who does not act in time is stood automatically and told so."""
+
+        self.server.turn_timeout = 0.05
+        await self.request({'op': 'join', 'players': 1})
+        state = (await self.request({'op': 'deal'}))['state']
+        self.assertFalse(state['game_over'])
+
+        event = json.loads(await asyncio.wait_for(self.reader.readline(), 2))
+        self.assertEqual(event['event'], 'timeout')
+        self.assertTrue(event['state']['game_over'])
+        self.assertEqual(event['state']['seats'][0]['status'], 'stood')
+
+    async def test_unix_socket(self):
+        """Test that the server also listens on a Unix socket."""
+
+        with tempfile.TemporaryDirectory() as directory:
+            server = TableServer(1, turn_timeout=None)
+            await server.start(path=os.path.join(directory, 'tables.sock'))
+            reader, writer = await asyncio.open_unix_connection(server.address)
+            writer.write(b'{"op": "join"}\n')
+            reply = json.loads(await reader.readline())
+            writer.close()
+            await server.close()
+
+        self.assertEqual(len(reply['state']['seats']), 1)
+
+class TestBackpressure(unittest.IsolatedAsyncioTestCase):
+
+    async def test_full_outbox_drops_client(self):
+        """Test that a timer event for a client too far behind to take it closes the connection."""
+
+        class Transport:
+            aborted = False
+
+            def abort(self):
+                self.aborted = True
+
+        class Writer:
+            transport = Transport()
+
+        connection = Connection(Writer(), outbox_size=2)
+        await connection.send({'ok': True})
+        connection.push({'event': 'timeout'})
+        self.assertFalse(connection.closed)
+
+        connection.push({'event': 'timeout'})
+        self.assertTrue(connection.closed)
+        self.assertTrue(Writer.transport.aborted)
+
+class TestLoadGenerator(unittest.IsolatedAsyncioTestCase):
+
+    async def test_run_load_reports_throughput_and_latency(self):
+        """Test that a local load run plays every round and reports request rates and percentiles."""
+
+        result = await run_load(clients=20, rounds=3)
+
+        self.assertEqual(result['rounds'], 60)
+        self.assertGreaterEqual(result['actions'], 20 * (2 + 3 * 2), "Each client joins, leaves, and deals and acts each round.")
+        self.assertGreater(result['actions_per_second'], 0)
+        self.assertLessEqual(result['p50'], result['p99'])
+        self.assertLessEqual(result['p99'], result['max'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+
+from src.engine import GameEngine
+from src.shoe import Shoe
+
+class TestShoe(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a shuffled two deck shoe with the cut card halfway."""
+        self.shoe = Shoe(num_decks=2, penetration=0.5)
+        self.shoe.shuffle()
+
+    def test_shoe_holds_every_deck(self):
+        """Test that the shoe is built from the requested number of decks."""
+
+        self.assertEqual(len(self.shoe.cards), 104, "Two decks should hold 104 cards.")
+        self.assertEqual(self.shoe.cut_card, 52, "Half penetration should leave 52 cards behind the cut card.")
+
+    def test_deck_count_is_validated(self):
+        """Test that shoes only hold between 1 and 8 decks."""
+
+        with self.assertRaises(ValueError):
+            Shoe(num_decks=0)
+        with self.assertRaises(ValueError):
+            Shoe(num_decks=9)
+
+    def test_cut_card_triggers_reshuffle(self):
+        """Test that reaching the cut card asks for a reshuffle and reuses the same cards."""
+
+        original_cards = {id(card) for card in self.shoe.cards}
+        dealt = [self.shoe.draw_card() for _ in range(52)]
+        self.assertTrue(self.shoe.needs_shuffle(), "The cut card should be reached after 52 cards.")
+
+        self.shoe.discard(dealt)
+        self.shoe.reshuffle()
+
+        self.assertEqual(len(self.shoe.cards), 104, "Every discard should return to the shoe.")
+        self.assertEqual({id(card) for card in self.shoe.cards}, original_cards, "No new cards should be created.")
+        self.assertTrue(all(not card.face_up for card in self.shoe.cards), "Returned cards should be face down.")
+
+    def test_engine_reuses_shoe_across_rounds(self):
+        """Test that long sessions with a shoe never lose or create cards."""
+
+        shoe = Shoe(num_decks=1)
+        engine = GameEngine(3, shoe=shoe)
+        players = engine.players()
+        for _ in range(300):
+            engine.reset_round()
+            engine.play_round()
+            in_hands = sum(len(p.hand.cards) for p in engine.players())
+            self.assertEqual(len(shoe.cards) + len(shoe.discards) + in_hands, 52, "Cards should never be lost or created.")
+        self.assertEqual(engine.players(), players, "Players should be reused between rounds.")
+
+if __name__ == '__main__':
+    unittest.main()
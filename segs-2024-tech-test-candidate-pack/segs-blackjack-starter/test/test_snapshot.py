@@ -0,0 +1,171 @@
+import unittest
+
+from src.engine import GameEngine
+from src.display import OffscreenTarget
+from src.rng import RandomStream
+from src.shoe import Shoe
+from src.snapshot import MAGIC, HEADER
+from blackjack import BlackjackGame
+
+def table(engine):
+    """Returns everything about a table that play depends on, to compare tables."""
+
+    return ([(str(card), card.face_up) for card in engine.deck.cards],
+            [([(str(card), card.face_up) for card in player.hand.cards], player.status) for player in engine.players()],
+            engine.turn, engine.next_turn, engine.turns_completed, engine.game_over, engine.outcome,
+            [engine.seats.index(player) for player in engine.winners])
+
+def play_out(engine, rounds=3):
+    """Finishes the round and plays a few more, returning the tables they ended on."""
+
+    results = []
+    while not engine.game_over:
+        if engine.player.status == 'playing' and engine.turn == 'player':
+            if engine.opponent_decision(engine.player):
+                engine.player_hit()
+            else:
+                engine.player_stand()
+        else:
+            engine.check_turn_end(engine.player)
+    results.append(table(engine))
+    for _ in range(rounds):
+        engine.reset_round()
+        engine.play_round()
+        results.append(table(engine))
+    return results
+
+class TestSnapshot(unittest.TestCase):
+
+    def mid_round(self, num_players=3, shoe=None, backend='python', seed=3):
+        """Returns a table part way through a round, after the player's first decision."""
+
+        engine = GameEngine(num_players, shoe=shoe, rng=RandomStream(seed, backend))
+        engine.deal_initial_cards()
+        engine.player_hit()
+        return engine
+
+    def test_restore_plays_on_the_same(self):
+        """Test that a restored table plays the rest of the round and later rounds exactly as before."""
+
+        engine = self.mid_round()
+        data = engine.snapshot()
+        before = table(engine)
+        expected = play_out(engine)
+
+        engine.restore(data)
+        self.assertEqual(table(engine), before)
+        self.assertEqual(play_out(engine), expected)
+
+    def test_fork_onto_another_table(self):
+        """Test that two tables restored from one snapshot play on independently and the same."""
+
+        data = self.mid_round().snapshot()
+        first, second = GameEngine(3), GameEngine(3)
+        first.restore(data)
+        second.restore(data)
+
+        self.assertEqual(play_out(first), play_out(second))
+        self.assertIsNot(first.deck.cards[0], second.deck.cards[0])
+
+    def test_shoe_and_numpy_streams(self):
+        """Test that a shoe's discards and a NumPy random stream are restored too."""
+
+        engine = GameEngine(5, shoe=Shoe(2), rng=RandomStream(4, 'numpy'))
+        for _ in range(3):
+            engine.play_round()
+            engine.reset_round()
+        engine.deal_initial_cards()
+        data = engine.snapshot()
+        discards = [str(card) for card in engine.shoe.discards]
+        self.assertTrue(discards)
+        expected = play_out(engine, rounds=10)
+
+        fork = GameEngine(5, shoe=Shoe(2))
+        fork.restore(data)
+        self.assertEqual(fork.rng.backend, 'numpy')
+        self.assertEqual([str(card) for card in fork.shoe.discards], discards)
+        self.assertEqual(play_out(fork, rounds=10), expected)
+
+    def test_finished_round(self):
+        """Test that the outcome and winners of a finished round are restored."""
+
+        engine = GameEngine(3, rng=RandomStream(9))
+        engine.play_round()
+        data = engine.snapshot()
+
+        fork = GameEngine(3)
+        fork.restore(data)
+        self.assertTrue(fork.game_over)
+        self.assertEqual(fork.outcome, engine.outcome)
+        self.assertEqual(fork.seat_results(), engine.seat_results())
+
+    def test_compact_form(self):
+        """Test that a snapshot is packed bytes with a card per byte, mostly the random streams' state."""
+
+        engine = self.mid_round(seed=1)
+        data = engine.snapshot()
+
+        self.assertIsInstance(data, bytes)
+        self.assertTrue(data.startswith(MAGIC))
+        self.assertLess(len(data), 5500)
+        self.assertLess(len(GameEngine(7, shoe=Shoe(8), rng=RandomStream(1, 'numpy')).snapshot()), 700)
+
+    def test_rejects_other_tables(self):
+        """Test that a snapshot only restores onto a table with the same seats and kind of deck."""
+
+        data = self.mid_round().snapshot()
+
+        with self.assertRaises(ValueError):
+            GameEngine(1).restore(data)
+        with self.assertRaises(ValueError):
+            GameEngine(3, shoe=Shoe(1)).restore(data)
+        with self.assertRaises(ValueError):
+            GameEngine(3).restore(b'not a snapshot' * 4)
+
+    def test_rejects_truncated_snapshots(self):
+        """Test that a snapshot cut short or with a corrupt byte raises ValueError and leaves the table as it was."""
+
+        engine = self.mid_round()
+        data = engine.snapshot()
+        before = table(engine)
+
+        for size in (0, 10, 40, 60, 100, len(data) - 1):
+            with self.assertRaises(ValueError):
+                engine.restore(data[:size])
+            self.assertEqual(table(engine), before)
+
+        # A status, a ring link and a card in the deck, then the turn index in the header
+        for position, byte in ((HEADER.size, 9), (HEADER.size + 6, 200), (HEADER.size + 21, 0x7f), (8, 3)):
+            corrupt = bytearray(data)
+            corrupt[position] = byte
+            with self.assertRaises(ValueError):
+                engine.restore(bytes(corrupt))
+            self.assertEqual(table(engine), before)
+
+    def test_seed_must_fit_the_snapshot(self):
+        """Test that a stream's seed must be an unsigned 64-bit number, as snapshots store it."""
+
+        with self.assertRaises(ValueError):
+            RandomStream(-1)
+        with self.assertRaises(ValueError):
+            RandomStream(2 ** 64)
+        self.assertEqual(RandomStream(2 ** 64 - 1).seed, 2 ** 64 - 1)
+
+    def test_restore_in_the_game(self):
+        """Test that the game restores a round with no animations left and every hand face up."""
+
+        engine = self.mid_round()
+        data = engine.snapshot()
+
+        game = BlackjackGame(3, target=OffscreenTarget())
+        game.deal_initial_cards()
+        game.restore(data)
+        game.draw_screen()
+
+        self.assertTrue(game.timeline.idle)
+        self.assertEqual([[str(card) for card in player.hand.cards] for player in game.players()],
+                         [[str(card) for card in player.hand.cards] for player in engine.players()])
+        self.assertTrue(all(card.face_up for player in game.players() for card in player.hand.cards))
+
+if __name__ == '__main__':
+    unittest.main()
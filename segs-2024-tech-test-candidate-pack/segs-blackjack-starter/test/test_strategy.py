@@ -0,0 +1,77 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from src.strategy import StrategyChart, load_chart, rule_config, config_hash, UP_CARDS
+from src.engine import GameEngine
+from src.policy import Policy
+from src.rng import RandomStream
+
+class TestStrategyChart(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Generate the single-deck chart once into a temporary cache."""
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.chart = load_chart(1, 3, cache_dir=cls.directory.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the temporary cache."""
+        cls.directory.cleanup()
+
+    def test_chart_covers_every_total(self):
+        """Test that the chart has an action for every total against every up card."""
+
+        for row in list(self.chart.hard.values()) + list(self.chart.soft.values()):
+            self.assertEqual(len(row), len(UP_CARDS))
+            self.assertTrue(set(row) <= {'H', 'S'})
+
+    def test_obvious_decisions(self):
+        """Test that the chart always hits where it cannot bust and always stands on 21."""
+
+        for total in range(4, 12):
+            self.assertEqual(self.chart.hard[total], 'H' * len(UP_CARDS), f"Hard {total} can never bust by hitting.")
+        self.assertEqual(self.chart.hard[21], 'S' * len(UP_CARDS))
+        self.assertEqual(self.chart.soft[21], 'S' * len(UP_CARDS))
+
+    def test_action_reads_soft_and_hard_rows(self):
+        """Test that soft hands are read from the soft rows and hard hands from the hard rows."""
+
+        column = UP_CARDS.index(7)
+        self.assertEqual(self.chart.action(7, True, 7), self.chart.soft[17][column])
+        self.assertEqual(self.chart.action(17, False, 7), self.chart.hard[17][column])
+
+    def test_cached_chart_loads_without_generating(self):
+        """Test that a chart already on disk is read back rather than generated again."""
+
+        path = os.path.join(self.directory.name, f"{config_hash(rule_config(1, 3))}.json")
+        self.assertTrue(os.path.exists(path), "The chart should be cached under its rule configuration hash.")
+
+        with patch.object(StrategyChart, 'generate', side_effect=AssertionError("should not regenerate")):
+            start = time.perf_counter()
+            chart = load_chart(1, 3, cache_dir=self.directory.name)
+            self.assertLess(time.perf_counter() - start, 0.1, "Loading a cached chart should take milliseconds.")
+        self.assertEqual(chart.to_dict(), self.chart.to_dict())
+
+    def test_rules_change_the_hash(self):
+        """Test that different rules are cached separately."""
+
+        hashes = {config_hash(rule_config(1, 3)), config_hash(rule_config(6, 3)),
+                  config_hash(rule_config(1, 2)), config_hash(rule_config(1, 3, Policy({17: 13})))}
+        self.assertEqual(len(hashes), 4)
+
+    def test_player_policy_plays_rounds(self):
+        """Test that the chart can play the player's seat in headless rounds."""
+
+        engine = GameEngine(3, rng=RandomStream(8))
+        policy = self.chart.player_policy(engine)
+        for _ in range(50):
+            engine.reset_round()
+            engine.play_round(policy)
+            self.assertTrue(engine.game_over)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+
+from src.timeline import Timeline, FRAME_INTERVAL
+from blackjack import BlackjackGame
+
+class TestTimeline(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a timeline driven by a fake clock."""
+        self.now = 0.0
+        self.timeline = Timeline(clock=lambda: self.now)
+        self.calls = []
+
+    def test_tweens_play_in_order_by_default(self):
+        """Test that a tween queued after another begins when the first finishes."""
+
+        first = self.timeline.add(1.0)
+        second = self.timeline.add(0.5)
+
+        self.assertEqual(second.begin, first.finish, "Queued tweens should play one after another.")
+        self.assertEqual(self.timeline.end, 1.5)
+
+    def test_tweens_can_overlap(self):
+        """Test that a tween given a start time plays alongside the others."""
+
+        first = self.timeline.add(1.0)
+        second = self.timeline.add(1.0, at=first.begin + 0.25)
+
+        self.assertEqual(second.begin, 0.25)
+        self.assertEqual(self.timeline.active(), [first], "Only the tween that has begun should be active.")
+        self.now = 0.5
+        self.assertEqual(self.timeline.active(), [first, second])
+
+    def test_value_interpolates_between_start_and_end(self):
+        """Test that a moving tween is interpolated by how far through it is."""
+
+        tween = self.timeline.add(2.0, (0, 100), (100, 0))
+
+        self.assertEqual(tween.value(0.5), (25, 75))
+        self.assertEqual(tween.value(5.0), (100, 0), "A finished tween should stay at its end.")
+
+    def test_update_runs_callbacks_once_finished(self):
+        """Test that finished tweens are removed and their callbacks run in finishing order."""
+
+        self.timeline.add(1.0, on_finish=lambda: self.calls.append('long'))
+        self.timeline.add(0.5, at=0, on_finish=lambda: self.calls.append('short'))
+        self.now = 0.75
+        self.timeline.update()
+        self.assertEqual(self.calls, ['short'])
+
+        self.now = 1.0
+        self.timeline.update()
+        self.assertEqual(self.calls, ['short', 'long'])
+        self.assertTrue(self.timeline.idle)
+
+    def test_clear_in_callback_drops_remaining_callbacks(self):
+        """Test that clearing the timeline from a callback stops the rest of the old round's callbacks."""
+
+        self.timeline.add(1.0, on_finish=self.timeline.clear)
+        self.timeline.add(0, on_finish=lambda: self.calls.append('stale'))
+        self.now = 2.0
+        self.timeline.update()
+
+        self.assertEqual(self.calls, [], "Callbacks queued before the clear should not run.")
+
+    def test_finish_skips_to_final_state(self):
+        """Test that finishing the timeline runs every queued callback in order without waiting."""
+
+        self.timeline.add(1.0, on_finish=lambda: self.calls.append('deal'))
+        self.timeline.add(2.5, on_finish=lambda: self.calls.append('banner'))
+        self.timeline.finish()
+
+        self.assertEqual(self.calls, ['deal', 'banner'])
+        self.assertTrue(self.timeline.idle)
+        self.assertEqual(self.timeline.add(1.0).begin, 0.0, "New tweens should not wait for the skipped ones.")
+
+    def test_timeout_wakes_for_frames_only_while_moving(self):
+        """Test that the loop is woken every frame while something moves, and otherwise only when needed."""
+
+        self.assertIsNone(self.timeline.timeout(), "An idle timeline should let the loop block.")
+        self.timeline.add(2.0)
+        self.assertEqual(self.timeline.timeout(), 2.0, "A banner only needs a frame when it ends.")
+
+        self.timeline.add(1.0, (0, 0), (10, 10), at=0)
+        self.assertAlmostEqual(self.timeline.timeout(), FRAME_INTERVAL)
+
+class TestAnimatedDeal(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a multi-player game whose timeline runs on a fake clock."""
+        self.now = 0.0
+        self.game = BlackjackGame(3, speed=2.0)
+        self.game.timeline.clock = lambda: self.now
+
+    def test_deal_does_not_block(self):
+        """Test that dealing returns straight away and the card only shows once its animation lands."""
+
+        self.game.animate_card_to_player(self.game.opponent_one)
+        card = self.game.opponent_one.hand.cards[-1]
+        self.assertEqual(len(self.game.opponent_one.hand.cards), 1, "The engine should see the card immediately.")
+        self.assertEqual(self.game.shown_cards(self.game.opponent_one), 0, "The card should be hidden while it is dealt.")
+        self.assertFalse(self.game.actions_enabled(), "Hit and Stand should wait for the animation.")
+
+        self.now = self.game.timeline.end
+        self.game.timeline.update()
+        self.assertEqual(self.game.shown_cards(self.game.opponent_one), 1)
+        self.assertTrue(card.face_up, "The card should have flipped face up.")
+        self.assertTrue(self.game.actions_enabled())
+
+    def test_opening_deals_overlap(self):
+        """Test that the opening deal animations overlap rather than play one after another."""
+
+        self.game.deal_initial_cards()
+        deals = [tween for tween, image in self.game.flying]
+
+        self.assertEqual(len(deals), 6)
+        self.assertLess(deals[1].begin, deals[0].finish, "Each card should leave before the previous one lands.")
+
+if __name__ == '__main__':
+    unittest.main()
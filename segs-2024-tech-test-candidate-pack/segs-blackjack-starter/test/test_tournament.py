@@ -0,0 +1,33 @@
+import unittest
+
+from src.tournament import run_chunk, run_tournament
+
+class TestTournament(unittest.TestCase):
+
+    def test_chunk_counts_every_round(self):
+        """Test that a chunk reports one outcome per seat for every round."""
+
+        counts = run_chunk(seed=11, rounds=200)
+
+        self.assertEqual(len(counts), 3, "There should be counts for all three seats.")
+        for seat_counts in counts:
+            self.assertEqual(sum(seat_counts), 200)
+
+    def test_results_do_not_depend_on_worker_count(self):
+        """Test that a seeded tournament gives the same counts with one or two workers."""
+
+        single = run_tournament(600, workers=1, chunk_size=150, seed=9)
+        sharded = run_tournament(600, workers=2, chunk_size=150, seed=9)
+
+        self.assertEqual(single['counts'], sharded['counts'])
+        for seat_counts in single['counts']:
+            self.assertEqual(sum(seat_counts.values()), 600, "Every round should be counted once per seat.")
+
+    def test_rejects_no_rounds(self):
+        """Test that a tournament of no rounds raises ValueError rather than dividing by zero."""
+
+        with self.assertRaises(ValueError):
+            run_tournament(0, workers=1)
+
+if __name__ == '__main__':
+    unittest.main()